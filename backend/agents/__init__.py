@@ -6,6 +6,8 @@ This package contains all the specialized agents for the K-Square Programme Onbo
 - ClientProfileAgent: Builds detailed client profiles and generates insights
 - ActionableInsightsAgent: Synthesizes outputs from other agents to generate recommendations
 - MeetingsAgent: Analyzes meeting transcripts and extracts insights
+
+AgentRegistry maps agent names to an instance, its entry coroutine and an input schema.
 """
 
 from .conversational_setup import ConversationalSetupAgent
@@ -13,13 +15,15 @@ from .domain_knowledge import DomainKnowledgeAgent
 from .client_profile import ClientProfileAgent
 from .actionable_insights import ActionableInsightsAgent
 from .meetings import MeetingsAgent
+from .registry import AgentRegistry
 
 __all__ = [
     'ConversationalSetupAgent',
     'DomainKnowledgeAgent',
     'ClientProfileAgent',
     'ActionableInsightsAgent',
-    'MeetingsAgent'
+    'MeetingsAgent',
+    'AgentRegistry'
 ]
 
 __version__ = '1.0.0'
@@ -8,6 +8,9 @@ logger = logging.getLogger(__name__)
 class ActionableInsightsAgent:
     """Actionable Insights Agent for synthesizing outputs and generating recommendations"""
     
+    # Bump when a change alters the output for the same inputs, so cached stage results are recomputed
+    VERSION = "1.0"
+    
     def __init__(self, db_manager):
         self.db_manager = db_manager
         self.name = "Actionable Insights Agent"
@@ -8,6 +8,9 @@ logger = logging.getLogger(__name__)
 class ClientProfileAgent:
     """Client Profile Agent for building detailed client profiles"""
     
+    # Bump when a change alters the output for the same inputs, so cached stage results are recomputed
+    VERSION = "1.0"
+    
     def __init__(self, db_manager):
         self.db_manager = db_manager
         self.name = "Client Profile Agent"
@@ -19,13 +22,7 @@ class ClientProfileAgent:
         
         try:
             # Check if client profile already exists in database
-            existing_profiles = self.db_manager.get_client_profiles()
-            existing_profile = None
-            
-            for profile in existing_profiles:
-                if profile["client_name"].lower() == client_name.lower():
-                    existing_profile = profile
-                    break
+            existing_profile = await self.db_manager.aio.get_client_profile(client_name)
             
             if existing_profile:
                 # Use existing profile and enhance it
@@ -117,8 +114,8 @@ class ClientProfileAgent:
         current_tech = enhanced.get("tech_stack", [])
         new_tech = [tech.strip() for tech in tech_stack.split(',')]
         
-        # Merge tech stacks
-        all_tech = list(set(current_tech + new_tech))
+        # Merge tech stacks (sorted so the same inputs always give the same profile)
+        all_tech = sorted(set(current_tech + new_tech))
         enhanced["tech_stack"] = all_tech
         
         # Add project context
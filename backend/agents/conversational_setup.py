@@ -9,6 +9,8 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel, Field
 
+from .fast_extractor import FastExtractor
+
 logger = logging.getLogger(__name__)
 
 class ClientInfo(BaseModel):
@@ -33,6 +35,59 @@ class ConversationState(BaseModel):
     is_complete: bool = Field(default=False)
     session_id: str = Field(default="")
 
+# Extraction prompt templates by extraction type, for _extract_information_with_llm
+EXTRACTION_PROMPTS = {
+    "company_and_industry": """
+    Extract the company name and industry from the user's message. Be flexible and natural - company names can be in any language, format, or style.
+    
+    User message: "{message}"
+    
+    Return a JSON object with:
+    - company_name: The company name (exactly as mentioned, preserve original formatting)
+    - industry: The industry if mentioned (or null if not clear)
+    
+    Examples:
+    - "Hi, my company is Weird-Co and we're in IT" -> {{"company_name": "Weird-Co", "industry": "IT"}}
+    - "We are 株式会社テスト in technology" -> {{"company_name": "株式会社テスト", "industry": "technology"}}
+    - "I work at ABC-123 Corp" -> {{"company_name": "ABC-123 Corp", "industry": null}}
+    """,
+    "problem_statement": """
+    Extract the main business problem or challenge from the user's message. Be comprehensive and preserve the user's own words.
+    
+    User message: "{message}"
+    
+    Return a JSON object with:
+    - problem_statement: The main challenge or problem described
+    """,
+    "tech_stack": """
+    Extract technology stack, tools, platforms, and systems from the user's message. Be flexible with formats and naming.
+    
+    User message: "{message}"
+    
+    Return a JSON object with:
+    - tech_stack: Array of technologies mentioned
+    """,
+    "project_details": """
+    Extract project timeline, budget, team size, and other project details from the user's message.
+    
+    User message: "{message}"
+    
+    Return a JSON object with:
+    - timeline: Project timeline if mentioned
+    - budget: Budget information if mentioned  
+    - team_size: Team size if mentioned (as integer)
+    - location: Company location if mentioned
+    """
+}
+
+# Client info fields each extraction type fills
+EXTRACTION_FIELDS = {
+    "company_and_industry": ["company_name", "industry"],
+    "problem_statement": ["problem_statement"],
+    "tech_stack": ["tech_stack"],
+    "project_details": ["timeline", "budget", "team_size", "location"]
+}
+
 class ConversationalSetupAgent:
     """Conversational AI agent for client onboarding using LangGraph and Ollama"""
     
@@ -40,9 +95,24 @@ class ConversationalSetupAgent:
         self.db_manager = db_manager
         self.name = "Conversational Setup Agent"
         self.model_name = model_name
-        self.llm = Ollama(model=model_name, temperature=0.7)
         self.json_parser = JsonOutputParser(pydantic_object=ClientInfo)
+        # Compiled once; the chains over them are rebuilt only when the model changes
+        self.extraction_prompts = {extraction_type: ChatPromptTemplate.from_template(template)
+                                   for extraction_type, template in EXTRACTION_PROMPTS.items()}
+        self.llm = Ollama(model=model_name, temperature=0.7)
+        self.fast_extractor = FastExtractor()
         self.conversation_graph = self._build_conversation_graph()
+    
+    @property
+    def llm(self):
+        return self._llm
+    
+    @llm.setter
+    def llm(self, llm):
+        """Set the model and compile the extraction chains over it, keyed by extraction type"""
+        self._llm = llm
+        self.extraction_chains = {extraction_type: prompt | llm | JsonOutputParser()
+                                  for extraction_type, prompt in self.extraction_prompts.items()}
         
     def _build_conversation_graph(self) -> StateGraph:
         """Build the conversation flow graph using LangGraph"""
@@ -120,63 +190,23 @@ class ConversationalSetupAgent:
 
     async def _extract_information_with_llm(self, user_message: str, extraction_type: str, current_info: Dict[str, Any] = None) -> Dict[str, Any]:
         """Use LLM to extract information from user message"""
-        extraction_prompts = {
-            "company_and_industry": """
-            Extract the company name and industry from the user's message. Be flexible and natural - company names can be in any language, format, or style.
-            
-            User message: "{message}"
-            
-            Return a JSON object with:
-            - company_name: The company name (exactly as mentioned, preserve original formatting)
-            - industry: The industry if mentioned (or null if not clear)
-            
-            Examples:
-            - "Hi, my company is Weird-Co and we're in IT" -> {{"company_name": "Weird-Co", "industry": "IT"}}
-            - "We are 株式会社テスト in technology" -> {{"company_name": "株式会社テスト", "industry": "technology"}}
-            - "I work at ABC-123 Corp" -> {{"company_name": "ABC-123 Corp", "industry": null}}
-            """,
-            "problem_statement": """
-            Extract the main business problem or challenge from the user's message. Be comprehensive and preserve the user's own words.
-            
-            User message: "{message}"
-            
-            Return a JSON object with:
-            - problem_statement: The main challenge or problem described
-            """,
-            "tech_stack": """
-            Extract technology stack, tools, platforms, and systems from the user's message. Be flexible with formats and naming.
-            
-            User message: "{message}"
-            
-            Return a JSON object with:
-            - tech_stack: Array of technologies mentioned
-            """,
-            "project_details": """
-            Extract project timeline, budget, team size, and other project details from the user's message.
-            
-            User message: "{message}"
-            
-            Return a JSON object with:
-            - timeline: Project timeline if mentioned
-            - budget: Budget information if mentioned  
-            - team_size: Team size if mentioned (as integer)
-            - location: Company location if mentioned
-            """
-        }
-        
-        prompt_template = extraction_prompts.get(extraction_type, "")
-        if not prompt_template:
+        chain = self.extraction_chains.get(extraction_type)
+        if chain is None:
             return {}
-            
-        prompt = ChatPromptTemplate.from_template(prompt_template)
-        chain = prompt | self.llm | JsonOutputParser()
+        
+        # Skip the LLM when the rules read every field of this type the message mentions
+        fields = EXTRACTION_FIELDS[extraction_type]
+        matches = self.fast_extractor.extract(user_message)
+        resolved = {field: value for field, value in self.fast_extractor.resolved(matches).items() if field in fields}
+        if resolved and not self.fast_extractor.unresolved(user_message, matches, fields):
+            return resolved
         
         try:
             result = await chain.ainvoke({"message": user_message})
-            return result if isinstance(result, dict) else {}
+            return {**result, **resolved} if isinstance(result, dict) else resolved
         except Exception as e:
             logger.error(f"Error in LLM extraction: {e}")
-            return {}
+            return resolved
     
     async def process_message(self, session_id: str, user_message: str, current_state: Dict[str, Any]) -> Dict[str, Any]:
         """Process user message and continue conversation"""
@@ -613,9 +643,6 @@ class ConversationalSetupAgent:
                 for msg in state.messages
             ])
             
-            # Analyze sentiment
-            sentiment_score, sentiment_category = self.db_manager.analyze_sentiment(transcript)
-            
             # Create action items based on gathered information
             action_items = [
                 "Review and validate client profile information",
@@ -631,24 +658,11 @@ class ConversationalSetupAgent:
                 "interaction_type": "conversational_onboarding"
             }
             
-            # Save to database
-            conn = self.db_manager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO meetings (client_name, transcript, action_items, 
-                                    engagement_metrics, sentiment_score, sentiment_category)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                state.client_info.company_name,
-                transcript,
-                json.dumps(action_items),
-                json.dumps(engagement_metrics),
-                sentiment_score,
-                sentiment_category
-            ))
+            # Save to database (sentiment is scored and the aggregates updated on insert)
+            await self.db_manager.aio.save_meeting(
+                state.client_info.company_name, transcript, action_items, engagement_metrics
+            )
             
-            conn.commit()
             logger.info(f"Conversation saved as meeting for {state.client_info.company_name}")
             
         except Exception as e:
@@ -688,7 +702,7 @@ class ConversationalSetupAgent:
             }
             
             # Save profile to database
-            self.db_manager.save_client_profile(
+            await self.db_manager.aio.save_client_profile(
                 state.client_info.company_name,
                 profile_data
             )
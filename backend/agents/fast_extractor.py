@@ -0,0 +1,310 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+# Client info fields the extractor knows about, in ClientInfo order
+FIELDS = (
+    "company_name", "industry", "problem_statement", "tech_stack", "timeline",
+    "budget", "team_size", "location", "contact_info"
+)
+
+# Industry keywords (lowercase) and the label recorded for them; "IT" is matched case-sensitively
+INDUSTRIES = {
+    "information technology": "IT", "software development": "Software Development", "software": "Software",
+    "fintech": "Fintech", "financial services": "Financial Services", "finance": "Finance", "banking": "Banking",
+    "insurance": "Insurance", "healthcare": "Healthcare", "health care": "Healthcare", "pharmaceutical": "Pharmaceutical",
+    "pharma": "Pharmaceutical", "retail": "Retail", "e-commerce": "E-commerce", "ecommerce": "E-commerce",
+    "automotive": "Automotive", "manufacturing": "Manufacturing", "logistics": "Logistics",
+    "transportation": "Transportation", "telecommunications": "Telecommunications", "telecom": "Telecommunications",
+    "energy": "Energy", "utilities": "Utilities", "real estate": "Real Estate", "hospitality": "Hospitality",
+    "travel": "Travel", "media": "Media", "entertainment": "Entertainment", "gaming": "Gaming",
+    "education": "Education", "edtech": "EdTech", "government": "Government", "public sector": "Public Sector",
+    "agriculture": "Agriculture", "construction": "Construction", "consulting": "Consulting", "legal": "Legal",
+    "nonprofit": "Nonprofit", "non-profit": "Nonprofit"
+}
+
+# Technologies by canonical name, with the aliases users write them as (matched case-insensitively)
+TECHNOLOGIES = {
+    "Java": ["java"], "Python": ["python"], "JavaScript": ["javascript", "js"], "TypeScript": ["typescript"],
+    "C#": ["c#"], "C++": ["c++"], ".NET": [".net", "dotnet", "asp.net"], "PHP": ["php"], "Ruby on Rails": ["ruby on rails", "rails"],
+    "Ruby": ["ruby"], "Kotlin": ["kotlin"], "Scala": ["scala"], "Golang": ["golang"], "Rust": ["rust"], "COBOL": ["cobol"],
+    "Django": ["django"], "Flask": ["flask"], "FastAPI": ["fastapi"], "Spring Boot": ["spring boot"], "Laravel": ["laravel"],
+    "React": ["react", "reactjs", "react.js"], "Angular": ["angular", "angularjs"], "Vue": ["vue", "vue.js", "vuejs"],
+    "Node.js": ["node.js", "nodejs"], "Flutter": ["flutter"],
+    "PostgreSQL": ["postgresql", "postgres"], "MySQL": ["mysql"], "SQL Server": ["sql server", "mssql"], "Oracle": ["oracle"],
+    "MongoDB": ["mongodb", "mongo"], "Redis": ["redis"], "Elasticsearch": ["elasticsearch"], "Cassandra": ["cassandra"],
+    "Snowflake": ["snowflake"], "BigQuery": ["bigquery"], "Databricks": ["databricks"], "Hadoop": ["hadoop"],
+    "Kafka": ["kafka"], "Tableau": ["tableau"], "Power BI": ["power bi", "powerbi"],
+    "AWS": ["aws", "amazon web services"], "Azure": ["azure"], "GCP": ["gcp", "google cloud"], "Heroku": ["heroku"],
+    "Firebase": ["firebase"], "Docker": ["docker"], "Kubernetes": ["kubernetes", "k8s"], "Terraform": ["terraform"],
+    "Jenkins": ["jenkins"], "GitHub": ["github"], "GitLab": ["gitlab"], "Jira": ["jira"], "Linux": ["linux"],
+    "Mainframe": ["mainframe", "mainframes"], "SAP": ["sap"], "Salesforce": ["salesforce"], "HubSpot": ["hubspot"],
+    "ServiceNow": ["servicenow"], "SharePoint": ["sharepoint"], "Dynamics 365": ["dynamics 365", "dynamics"],
+    "Workday": ["workday"], "NetSuite": ["netsuite"], "QuickBooks": ["quickbooks"], "Shopify": ["shopify"],
+    "Magento": ["magento"], "WordPress": ["wordpress"], "Stripe": ["stripe"], "Twilio": ["twilio"]
+}
+# Common words that are also technology names: only matched as written
+CASE_SENSITIVE_TECHNOLOGIES = {"Excel": ["Excel"], "Spark": ["Spark"], "Swift": ["Swift"]}
+
+NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    "eleven": 11, "twelve": 12, "fifteen": 15, "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50, "hundred": 100
+}
+NUMBER = r"(\d{1,6}|" + "|".join(NUMBER_WORDS) + r")"
+
+# A proper name: capitalized tokens ("Zulu.riverside", "ABC-123 Corp", "Smith & Co")
+NAME = r"([A-Z0-9][\w.&'-]*(?:\s+(?:&\s+)?[A-Z0-9][\w.&'-]*){0,4})"
+PLACE = r"([A-Z][\w.'-]*(?:\s+[A-Z][\w.'-]*){0,3}(?:,\s*[A-Z][\w.'-]*(?:\s+[A-Z][\w.'-]*){0,2})?)"
+
+COMPANY_PATTERNS = [
+    (re.compile(r"(?i:\b(?:my|our)\s+(?:company|business|firm|startup|organi[sz]ation)(?:'s name|\s+name)?"
+                r"(?:\s+is|'s)(?:\s+called|\s+named)?\s+)" + NAME), 0.95),
+    (re.compile(r"(?i:\b(?:company|business|firm|startup)\s+(?:called|named)\s+)" + NAME), 0.95),
+    # Below the threshold: "I'm calling from New York" names a place, so the LLM confirms these
+    (re.compile(r"(?i:\b(?:i'm|i am|we're|we are)\s+(?:\w+\s+)?(?:from|with)\s+)" + NAME), 0.75),
+    (re.compile(r"(?i:\b(?:work|working)\s+(?:at|for)\s+)" + NAME), 0.85),
+    (re.compile(r"(?i:\bwe(?:'re| are)\s+)" + NAME), 0.75)
+]
+
+# "in the industry" can still capture "the" (the article is optional); _industry rejects it
+INDUSTRY_CONTEXT = re.compile(
+    r"(?i:\b(?:in|within)\s+(?:the\s+)?)((?:[\w&/-]+\s+){0,2}?[\w&/-]+)(?i:\s+(?:industry|sector|space|market|vertical))\b"
+)
+INDUSTRY_DESCRIPTOR = re.compile(
+    r"(?i:\b(?:a|an)\s+)((?:[\w&/-]+\s+){0,2}?[\w&/-]+)(?i:\s+(?:company|firm|business|startup|consultancy|agency|provider))\b"
+)
+# Words that open a reference to an industry rather than name one ("this industry", "the same sector")
+NON_INDUSTRY_WORDS = frozenset({
+    "the", "a", "an", "this", "that", "these", "those", "our", "your", "their", "its", "my", "his", "her",
+    "same", "whole", "entire", "other", "any", "every"
+})
+INDUSTRY_KEYWORDS = re.compile(
+    r"(?i:\b(" + "|".join(re.escape(keyword) for keyword in sorted(INDUSTRIES, key=len, reverse=True)) + r")\b)|\b(IT)\b"
+)
+
+def _alias_pattern(aliases: Iterable[str], flags: int = 0) -> "re.Pattern":
+    """One alternation of aliases, longest first, that does not match inside longer names"""
+    alternation = "|".join(re.escape(alias) for alias in sorted(aliases, key=len, reverse=True))
+    return re.compile(r"(?<![\w.#+])(" + alternation + r")(?![\w#+])", flags)
+
+TECH_ALIASES = {alias: name for name, aliases in TECHNOLOGIES.items() for alias in aliases}
+TECH_PATTERN = _alias_pattern(TECH_ALIASES, re.IGNORECASE)
+CASE_SENSITIVE_TECH_ALIASES = {alias: name for name, aliases in CASE_SENSITIVE_TECHNOLOGIES.items() for alias in aliases}
+CASE_SENSITIVE_TECH_PATTERN = _alias_pattern(CASE_SENSITIVE_TECH_ALIASES)
+
+# Phrases that introduce a list of technologies, and where such a list ends
+TECH_LIST_START = re.compile(
+    r"(?i)\b(?:stack(?:\s+(?:is|includes|consists\s+of))?|we\s+use|we're\s+using|using|uses|built\s+(?:on|with)|runs?\s+on"
+    r"|(?:technologies|tools|platforms)\s+(?:are|include))\b:?"
+)
+TECH_LIST_END = re.compile(r"(?i)[.;!?]|\b(?:but|although|though|while|because|which|that|to|for)\b")
+TECH_LIST_SEPARATOR = re.compile(r"(?i),|\band\b|&|/|\bwith\b|\bplus\b|\bas well as\b")
+
+TEAM_PATTERNS = [
+    re.compile(r"(?i)\bteam\s+(?:of|has|is|size\s+(?:is|of))?\s*(?:about|around|roughly|approximately|~|nearly|over)?\s*"
+               + NUMBER + r"\b"),
+    re.compile(r"(?i)\b" + NUMBER + r"(?:\s+full[- ]time)?\s+(?:developers|engineers|people|employees|staff|members|devs"
+               r"|consultants|analysts)\b"),
+    re.compile(r"(?i)\b" + NUMBER + r"[- ](?:person|people|member)\s+team\b")
+]
+
+AMOUNT = (r"(?:[$€£]\s?\d[\d,]*(?:\.\d+)?(?:\s?(?:k|m|mm|bn|million|thousand|billion))?"
+          r"|\d[\d,]*(?:\.\d+)?\s?(?:k|m|million|thousand)?\s?(?:usd|eur|gbp|dollars|euros|pounds))(?![\w])")
+BUDGET_PATTERN = re.compile(
+    r"(?i)(?:(?:around|about|approximately|roughly|up to|under|over|at most|~)\s*)?" + AMOUNT
+    + r"(?:\s*(?:-|–|to|and)\s*" + AMOUNT + r")?"
+)
+BUDGET_CONTEXT = re.compile(r"(?i)\b(?:budget|spend|invest|funding|cost|afford)")
+
+TIMELINE_PATTERNS = [
+    re.compile(r"(?i)\b(?:within|in|over|under|next|about|around)\s+(?:the\s+next\s+)?(?:about\s+|around\s+)?"
+               r"(?:" + NUMBER + r"|a|an|a\s+few|a\s+couple\s+of)\s+(?:days?|weeks?|months?|quarters?|years?)\b"),
+    re.compile(r"(?i)\bby\s+(?:the\s+)?(?:end\s+of\s+)?(?:Q[1-4](?:\s+\d{4})?|next\s+(?:year|quarter|month)|this\s+year"
+               r"|(?:january|february|march|april|may|june|july|august|september|october|november|december)(?:\s+\d{4})?"
+               r"|\d{4})\b"),
+    re.compile(r"(?i)\b" + NUMBER + r"[- ](?:day|week|month|year)\s+(?:timeline|deadline|project|engagement|programme|program)\b")
+]
+TIMELINE_CONTEXT = re.compile(r"(?i)\b(?:timeline|deadline|complete|finish|deliver|launch|go live|done|solve|ready|ship)")
+
+LOCATION_PATTERNS = [
+    (re.compile(r"(?i:\b(?:based|located|headquartered|situated|offices?)\s+(?:in|out\s+of)\s+)" + PLACE), 0.9),
+    (re.compile(r"(?i:\bwe(?:'re| are)\s+in\s+)" + PLACE), 0.7)
+]
+
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE = re.compile(r"(?<![\w$€£])\+?\d[\d\s().-]{7,}\d(?![\w])")
+
+# Words that show a message talks about a field, whether or not a rule could read its value
+FIELD_CUES = {
+    "company_name": re.compile(r"(?i)\b(?:company|firm|startup|organi[sz]ation|corp(?:oration)?|inc|ltd|llc|gmbh"
+                               r"|i work (?:at|for)|i'm from|we're called|we are called)\b"),
+    "industry": re.compile(r"(?i)\b(?:industry|sector|vertical)\b"),
+    "problem_statement": re.compile(r"(?i)\b(?:challenges?|problems?|issues?|struggl\w*|pain points?|difficult\w*"
+                                    r"|bottlenecks?|needs? to|wants? to|looking to|trying to|hoping to|goals?|improve)\b"),
+    "tech_stack": re.compile(r"(?i)\b(?:stack|technolog(?:y|ies)|platforms?|tools|frameworks?|databases?|using|we use"
+                             r"|built (?:on|with)|runs? on)\b"),
+    "timeline": re.compile(r"(?i)\b(?:timeline|deadline|months?|weeks?|quarters?|Q[1-4]|asap)\b"),
+    "budget": re.compile(r"(?i)\b(?:budget|funding|spend)\b|[$€£]"),
+    "team_size": re.compile(r"(?i)\b(?:team|developers|engineers|employees|staff|headcount)\b"),
+    "location": re.compile(r"(?i)\b(?:based|located|headquartered|offices?|location)\b"),
+    "contact_info": re.compile(r"(?i)\b(?:e-?mail|phone|contact|reach (?:me|us))\b")
+}
+
+class FieldMatch:
+    """A value found for a client info field, and how reliable the rule that found it is (0-1)"""
+
+    __slots__ = ("value", "confidence", "rule")
+
+    def __init__(self, value: Any, confidence: float, rule: str):
+        self.value = value
+        self.confidence = confidence
+        self.rule = rule
+
+    def __repr__(self) -> str:
+        return f"FieldMatch({self.value!r}, {self.confidence}, {self.rule!r})"
+
+class FastExtractor:
+    """Rule, regex and gazetteer extraction of client info fields, used before LLM extraction.
+
+    extract() returns a FieldMatch per field it found. Matches at or above threshold
+    are resolved and are used as they are. unresolved() lists the fields a message
+    talks about that no rule could confidently read, which are the only ones worth
+    asking an LLM about. Free-text fields such as problem_statement are never
+    resolved here.
+    """
+
+    def __init__(self, threshold: float = 0.8):
+        self.threshold = threshold
+
+    def extract(self, message: str) -> Dict[str, FieldMatch]:
+        """Best match per field found in message"""
+        matches = {}
+        for field, extractor in (
+            ("company_name", self._company_name), ("industry", self._industry), ("tech_stack", self._tech_stack),
+            ("timeline", self._timeline), ("budget", self._budget), ("team_size", self._team_size),
+            ("location", self._location), ("contact_info", self._contact_info)
+        ):
+            match = extractor(message)
+            if match is not None:
+                matches[field] = match
+        return matches
+
+    def resolved(self, matches: Dict[str, FieldMatch]) -> Dict[str, Any]:
+        """Values of the matches confident enough to use without the LLM"""
+        return {field: match.value for field, match in matches.items() if match.confidence >= self.threshold}
+
+    def unresolved(self, message: str, matches: Dict[str, FieldMatch],
+                   fields: Optional[Iterable[str]] = None) -> List[str]:
+        """Fields (of fields, default all) the message mentions but that matches did not resolve"""
+        unresolved = []
+        for field in fields or FIELDS:
+            match = matches.get(field)
+            if match is not None and match.confidence >= self.threshold:
+                continue
+            if match is not None or FIELD_CUES[field].search(message):
+                unresolved.append(field)
+        return unresolved
+
+    def _company_name(self, message: str) -> Optional[FieldMatch]:
+        for pattern, confidence in COMPANY_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                name = match.group(1).rstrip(".,;:!?'-")
+                # "We're IT consultants" names an industry, not a company
+                if name and name.lower() not in INDUSTRIES and name != "IT":
+                    return FieldMatch(name, confidence, "company_phrase")
+        return None
+
+    def _industry(self, message: str) -> Optional[FieldMatch]:
+        match = INDUSTRY_CONTEXT.search(message)
+        if match:
+            label = self._industry_label(match.group(1))
+            if label:
+                return FieldMatch(label, 0.95, "industry_phrase")
+            words = match.group(1)
+            if words.split()[0].lower() not in NON_INDUSTRY_WORDS:
+                return FieldMatch(words if not words.islower() else words.title(), 0.85, "industry_phrase")
+        match = INDUSTRY_DESCRIPTOR.search(message)
+        if match:
+            label = self._industry_label(match.group(1))
+            if label:
+                return FieldMatch(label, 0.85, "industry_descriptor")
+        label = self._industry_label(message)
+        if label:
+            return FieldMatch(label, 0.6, "industry_keyword")
+        return None
+
+    def _industry_label(self, text: str) -> Optional[str]:
+        match = INDUSTRY_KEYWORDS.search(text)
+        if match is None:
+            return None
+        return INDUSTRIES[match.group(1).lower()] if match.group(1) else "IT"
+
+    def _technologies(self, text: str) -> List[str]:
+        """Canonical names of the technologies in text, in order of first mention"""
+        found = [(match.start(), TECH_ALIASES[match.group(1).lower()]) for match in TECH_PATTERN.finditer(text)]
+        found += [(match.start(), CASE_SENSITIVE_TECH_ALIASES[match.group(1)])
+                  for match in CASE_SENSITIVE_TECH_PATTERN.finditer(text)]
+        return list(dict.fromkeys(name for _, name in sorted(found)))
+
+    def _tech_stack(self, message: str) -> Optional[FieldMatch]:
+        technologies = self._technologies(message)
+        if not technologies:
+            return None
+
+        # Where the message lists its stack, every listed item should be a known technology
+        confidence = 0.8
+        for start in TECH_LIST_START.finditer(message):
+            rest = message[start.end():]
+            end = TECH_LIST_END.search(rest)
+            items = [item.strip() for item in TECH_LIST_SEPARATOR.split(rest[:end.start() if end else len(rest)])]
+            items = [item for item in items if item and item.lower() not in ("also", "some", "the", "a", "an")]
+            if not items:
+                continue
+            if all(self._technologies(item) for item in items):
+                confidence = max(confidence, 0.9)
+            else:
+                confidence = 0.6
+                break
+        return FieldMatch(technologies, confidence, "tech_gazetteer")
+
+    def _timeline(self, message: str) -> Optional[FieldMatch]:
+        for pattern in TIMELINE_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                confidence = 0.9 if TIMELINE_CONTEXT.search(message) else 0.7
+                return FieldMatch(match.group(0).strip(), confidence, "timeline_phrase")
+        return None
+
+    def _budget(self, message: str) -> Optional[FieldMatch]:
+        match = BUDGET_PATTERN.search(message)
+        if match is None:
+            return None
+        confidence = 0.95 if BUDGET_CONTEXT.search(message) else 0.7
+        return FieldMatch(match.group(0).strip().rstrip(","), confidence, "currency_amount")
+
+    def _team_size(self, message: str) -> Optional[FieldMatch]:
+        for pattern in TEAM_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                number = match.group(1).lower()
+                return FieldMatch(int(number) if number.isdigit() else NUMBER_WORDS[number], 0.9, "team_phrase")
+        return None
+
+    def _location(self, message: str) -> Optional[FieldMatch]:
+        for pattern, confidence in LOCATION_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                return FieldMatch(match.group(1).rstrip(".,;:!?"), confidence, "location_phrase")
+        return None
+
+    def _contact_info(self, message: str) -> Optional[FieldMatch]:
+        contact = {}
+        email = EMAIL.search(message)
+        if email:
+            contact["email"] = email.group(0).rstrip(".")
+        phone = PHONE.search(message)
+        if phone and sum(char.isdigit() for char in phone.group(0)) >= 9:
+            contact["phone"] = phone.group(0).strip()
+        if not contact:
+            return None
+        return FieldMatch(contact, 0.95, "contact_pattern")
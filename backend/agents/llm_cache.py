@@ -0,0 +1,98 @@
+import hashlib
+import logging
+import random
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, Optional[int]]
+
+class LLMResponseCache:
+    """Responses to LLM prompts that do not depend on the user, such as the conversation opening.
+
+    Keys are (model, prompt hash, temperature bucket). Each key holds up to
+    responses_per_key responses, and get() picks one at random, so sampled outputs
+    keep some variety. Responses expire ttl seconds after they were generated. The
+    least recently used keys are evicted beyond max_entries.
+    """
+
+    TEMPERATURE_STEP = 0.1
+
+    def __init__(self, max_entries: int = 256, ttl: float = 3600.0, responses_per_key: int = 4):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.responses_per_key = responses_per_key
+        self._entries: "OrderedDict[CacheKey, deque]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def key(cls, model: str, prompt: str, temperature: Optional[float] = None) -> CacheKey:
+        """Cache key of a prompt rendered for model at temperature"""
+        bucket = None if temperature is None else round(temperature / cls.TEMPERATURE_STEP)
+        return (model, hashlib.sha256(prompt.encode()).hexdigest(), bucket)
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """A random unexpired response for key, or None"""
+        responses = self._fresh(key)
+        if not responses:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return random.choice(responses)[1]
+
+    def count(self, key: CacheKey) -> int:
+        """Number of unexpired responses held for key"""
+        return len(self._fresh(key))
+
+    def put(self, key: CacheKey, response: str):
+        """Add a response for key, dropping the oldest one beyond responses_per_key"""
+        responses = self._entries.get(key)
+        if responses is None:
+            responses = self._entries[key] = deque(maxlen=self.responses_per_key)
+        responses.append((time.time(), response))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_generate(self, key: CacheKey, generate: Callable[[], Awaitable[str]]) -> str:
+        """Cached response for key, else generate one and cache it"""
+        response = self.get(key)
+        if response is None:
+            response = await generate()
+            self.put(key, response)
+        return response
+
+    def invalidate(self) -> int:
+        """Drop every cached response; returns the number of keys removed"""
+        removed = len(self._entries)
+        self._entries.clear()
+        logger.info(f"LLM response cache invalidated ({removed} keys)")
+        return removed
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get hit rate and size"""
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "responses": sum(len(responses) for responses in self._entries.values()),
+            "max_entries": self.max_entries
+        }
+
+    def _fresh(self, key: CacheKey) -> deque:
+        """Responses for key with expired ones dropped (they are stored oldest first)"""
+        responses = self._entries.get(key)
+        if responses is None:
+            return deque()
+        cutoff = time.time() - self.ttl
+        while responses and responses[0][0] <= cutoff:
+            responses.popleft()
+        if not responses:
+            del self._entries[key]
+        return responses
@@ -332,33 +332,11 @@ class MeetingsAgent:
         
         return found_phrases[:5]  # Return top 5
     
-    def get_sentiment_distribution(self, client_name: Optional[str] = None) -> Dict[str, Any]:
+    async def get_sentiment_distribution(self, client_name: Optional[str] = None) -> Dict[str, Any]:
         """Get sentiment distribution for visualization"""
         try:
-            meeting_insights = self.db_manager.get_meeting_insights()
-            
-            if client_name:
-                meeting_insights = [m for m in meeting_insights if m["client_name"] == client_name]
-            
-            if not meeting_insights:
-                return {"positive": 0, "neutral": 0, "negative": 0}
-            
-            sentiment_counts = {"positive": 0, "neutral": 0, "negative": 0}
-            
-            for meeting in meeting_insights:
-                category = meeting.get("sentiment_category", "neutral")
-                sentiment_counts[category] = sentiment_counts.get(category, 0) + 1
-            
-            total = sum(sentiment_counts.values())
-            
-            if total == 0:
-                return {"positive": 0, "neutral": 0, "negative": 0}
-            
-            return {
-                "positive": round((sentiment_counts["positive"] / total) * 100, 1),
-                "neutral": round((sentiment_counts["neutral"] / total) * 100, 1),
-                "negative": round((sentiment_counts["negative"] / total) * 100, 1)
-            }
+            # Read from the trigger-maintained meeting_stats aggregates
+            return await self.db_manager.aio.get_sentiment_data(client_name)
             
         except Exception as e:
             logger.error(f"Error calculating sentiment distribution: {e}")
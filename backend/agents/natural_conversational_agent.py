@@ -1,14 +1,161 @@
+import asyncio
 import logging
 import json
-from typing import Dict, Any, List, Optional
+import re
+import statistics
+import time
+from collections import Counter, deque
+from typing import Dict, Any, AsyncIterator, List, Optional, Set
 from datetime import datetime
 from langchain_community.llms import Ollama
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel, Field
 
+from .fast_extractor import FastExtractor
+from .llm_cache import LLMResponseCache
+
 logger = logging.getLogger(__name__)
 
+# Words in a reply question that show which field it asks about
+FIELD_QUESTION_KEYWORDS = {
+    "company_name": ["company name", "name of your company", "company called"],
+    "industry": ["industry", "sector"],
+    "problem_statement": ["challenge", "problem", "goal", "pain point"],
+    "tech_stack": ["tech stack", "technolog", "tools", "platform"],
+    "timeline": ["timeline", "deadline", "when do you", "how soon"],
+    "budget": ["budget", "spend", "cost"],
+    "team_size": ["team size", "how many", "how big is your team", "how large is your team"],
+    "location": ["location", "located", "based", "where are you"],
+    "contact_info": ["email", "phone", "contact", "reach you"]
+}
+
+# Follow-up used when reconciliation removed every question from a reply
+FIELD_FOLLOW_UPS = {
+    "company_name": "What's the name of your company?",
+    "industry": "Which industry are you in?",
+    "problem_statement": "What's the main challenge you'd like to solve?",
+    "tech_stack": "What technologies are you using today?",
+    "timeline": "What timeline are you working towards?",
+    "budget": "Do you have a budget range in mind?",
+    "team_size": "How many people are on your team?",
+    "location": "Where is your team based?",
+    "contact_info": "What's the best way to reach you?"
+}
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+# Phrases that mark the start of meta-commentary in a reply; the reply is cut there
+META_COMMENTARY_PATTERNS = [
+    'notes on why', 'approach was chosen', 'would you like me to',
+    '**notes', '---', 'this approach', 'why this', 'adjust this message',
+    'generate a', 'response that', 'i\'m particularly interested',
+    'it sounds like', 'that\'s really', 'fantastic!', 'wow,'
+]
+
+# Filler removed from replies, in order
+FILLER_PHRASES = ['really ', 'fantastic! ', 'That\'s ', 'It sounds like ', 'I\'m particularly interested in ']
+
+# How each field is described to the LLM in the extraction prompt
+FIELD_DESCRIPTIONS = {
+    "company_name": "Company name (preserve exact formatting)",
+    "industry": "Industry or business sector",
+    "problem_statement": "Business problem, challenge, or goal",
+    "tech_stack": "Technologies, tools, platforms (as array)",
+    "timeline": "Project timeline or deadlines",
+    "budget": "Budget information or range",
+    "team_size": "Number of team members (as integer)",
+    "location": "Company or team location",
+    "contact_info": "Contact details like email, phone (as object)"
+}
+
+REPLY_WORD_LIMIT = 50
+REPLY_KEEP_WORDS = 45
+OPENING_FALLBACK = "Hello! I'm excited to learn about your business and how K-Square can help you succeed. What brings you here today?"
+REPLY_FALLBACK = "I appreciate you sharing that with me. Could you tell me a bit more about your business and what you're hoping to achieve?"
+
+class StreamingMessageCleaner:
+    """Applies the reply cleaning rules of _extract_clean_message to a reply as it streams in.
+    
+    feed() returns the newly cleaned text that is safe to send. The last HOLD characters
+    are held back until a meta-commentary pattern or filler phrase there can be ruled out,
+    and words past REPLY_KEEP_WORDS until the reply is known to stay within the word limit,
+    so sent text is never retracted. Unlike the batch cleaner, meta-commentary cuts the
+    reply where the pattern starts, since the start of its line may already be sent.
+    """
+    
+    HOLD = max(len(phrase) for phrase in META_COMMENTARY_PATTERNS + FILLER_PHRASES)
+    
+    def __init__(self):
+        self._raw = ""
+        self.text = ""
+        self.stopped = False
+    
+    def feed(self, chunk: str) -> str:
+        """Add a chunk of raw reply; returns the cleaned text that can be sent now"""
+        if self.stopped:
+            return ""
+        self._raw += chunk
+        return self._advance(final=False)
+    
+    def finish(self) -> str:
+        """End of the reply; returns the held-back text (self.text is then the whole cleaned reply)"""
+        delta = "" if self.stopped else self._advance(final=True)
+        self.stopped = True
+        return delta
+    
+    def _advance(self, final: bool) -> str:
+        clean, complete = self._clean(final)
+        if complete:
+            self.stopped = True
+        if not clean.startswith(self.text):
+            return ""
+        delta = clean[len(self.text):]
+        self.text = clean
+        return delta
+    
+    def _clean(self, final: bool):
+        """Cleaned text of the raw reply so far and whether the reply is complete"""
+        complete = final
+        kept = []
+        for line in self._raw.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            lowered = line.lower()
+            starts = [lowered.find(pattern) for pattern in META_COMMENTARY_PATTERNS if pattern in lowered]
+            if starts:
+                line = line[:min(starts)].strip()
+                if line and not line.startswith(('*', '-')):
+                    kept.append(line)
+                complete = True
+                break
+            if line.startswith('*') or line.startswith('-'):
+                continue
+            kept.append(line)
+        
+        text = ' '.join(kept)
+        if text.startswith('"'):
+            text = text[1:]
+            if complete and text.endswith('"'):
+                text = text[:-1]
+        words = text.split()
+        if len(words) > REPLY_WORD_LIMIT:
+            text = ' '.join(words[:REPLY_KEEP_WORDS])
+            if not text.endswith('?'):
+                text += "?"
+            complete = True
+        elif not complete and len(words) > REPLY_KEEP_WORDS:
+            text = ' '.join(words[:REPLY_KEEP_WORDS])
+        else:
+            text = ' '.join(words)
+        for phrase in FILLER_PHRASES:
+            text = text.replace(phrase, '')
+        
+        if not complete:
+            text = text[:max(0, len(text) - self.HOLD)]
+        return text, complete
+
 class ClientInfo(BaseModel):
     """Required client information to be collected"""
     company_name: Optional[str] = Field(None, description="Company name")
@@ -46,11 +193,22 @@ class ConversationSession(BaseModel):
 class NaturalConversationalAgent:
     """A natural, free-flowing conversational agent that collects client information organically"""
     
-    def __init__(self, db_manager, model_name: str = "gemma3:latest"):
+    def __init__(self, db_manager, model_name: str = "gemma3:latest", base_url: str = "http://localhost:11434",
+                 pipelined: bool = True, response_cache: Optional[LLMResponseCache] = None):
         self.db_manager = db_manager
         self.name = "Natural Conversational Agent"
         self.model_name = model_name
-        self.llm = Ollama(model=model_name, temperature=0.8)  # Higher temperature for more natural responses
+        # Run information extraction and reply generation concurrently (one LLM round-trip of latency per turn)
+        self.pipelined = pipelined
+        # Time to first token and full reply time of recent streamed turns, in seconds
+        self._first_token_times: deque = deque(maxlen=500)
+        self._stream_times: deque = deque(maxlen=500)
+        # Pool of pre-generated opening messages, topped up in the background
+        self.response_cache = response_cache or LLMResponseCache()
+        self._opening_refill: Optional[asyncio.Task] = None
+        # Rules resolve what they can; the LLM is only asked about the rest
+        self.fast_extractor = FastExtractor()
+        self._extraction_counts: Counter = Counter()
         self.sessions: Dict[str, ConversationSession] = {}
         
         # Core system prompt that gives the LLM freedom while maintaining purpose
@@ -77,53 +235,124 @@ But approach this organically through conversation, not as a checklist. Let the
 
 Be conversational, warm, and professional. Keep responses brief but engaging.
 """
+        # Prompts are compiled once; the chains over them are rebuilt only when the model changes
+        self.prompts = {name: ChatPromptTemplate.from_template(template)
+                        for name, template in self._prompt_templates().items()}
+        self.llm = Ollama(model=model_name, base_url=base_url, temperature=0.8)  # Higher temperature for more natural responses
+    
+    @property
+    def llm(self):
+        return self._llm
+    
+    @llm.setter
+    def llm(self, llm):
+        """Set the model and compile the prompt | llm | parser chains over it"""
+        self._llm = llm
+        self.chains = {
+            "opening": self.prompts["opening"] | llm,
+            "extraction": self.prompts["extraction"] | llm | JsonOutputParser(),
+            "response": self.prompts["response"] | llm
+        }
+        # The opening prompt has no inputs, so its response cache key only changes with the model
+        self._opening_key = LLMResponseCache.key(
+            getattr(llm, "model", self.model_name), self.prompts["opening"].format(), getattr(llm, "temperature", None)
+        )
+    
+    def _prompt_templates(self) -> Dict[str, str]:
+        """Template text of the opening message, information extraction and reply prompts"""
+        return {
+            "opening": (
+                self.system_prompt + 
+                "\n\nGenerate ONLY a warm, welcoming opening message to start the conversation. "
+                "Be friendly and set a positive tone for learning about their business needs. "
+                "Return ONLY the message text that should be sent to the client, without any "
+                "meta-commentary, notes, or explanations. Just the direct message."
+            ),
+            "extraction": """Extract any business information from this user message and return it as JSON.
+            
+Current information we have: {current_info}
+            
+User message: "{user_message}"
+            
+Extract any of these fields if mentioned (return null for fields not mentioned):
+            {fields}
+            
+Only extract information that is clearly stated. Don't infer or assume.
+            Return valid JSON only.""",
+            "response": self.system_prompt + """
+            
+Conversation so far:
+            {conversation_history}
+            
+User just said: "{user_message}"
+            
+Current information collected: {current_info}
+            Missing information: {missing_fields}
+            Completion: {completion_percentage}%
+            
+Generate a brief, focused response that:
+            1. Acknowledges what the user said (1 sentence)
+            2. Asks 1-2 specific follow-up questions to gather missing info
+            3. Keeps total response under 50 words
+            4. Prioritizes the most important missing information
+            
+If completion is above 80%, focus on confirming details and next steps.
+            Otherwise, ask targeted questions about the highest priority missing fields.
+            
+Be friendly but concise. No lengthy explanations or multiple topics."""
+        }
     
     async def start_conversation(self, session_id: str) -> Dict[str, Any]:
         """Start a new conversation session"""
         session = ConversationSession(session_id=session_id)
         self.sessions[session_id] = session
         
-        # Generate a natural, welcoming opening message
-        opening_prompt = ChatPromptTemplate.from_template(
-            self.system_prompt + 
-            "\n\nGenerate ONLY a warm, welcoming opening message to start the conversation. "
-            "Be friendly and set a positive tone for learning about their business needs. "
-            "Return ONLY the message text that should be sent to the client, without any "
-            "meta-commentary, notes, or explanations. Just the direct message."
-        )
+        # Served from the pool of pre-generated openings, so a new session never waits on the model
+        message = self.response_cache.get(self._opening_key) or OPENING_FALLBACK
+        self.refresh_openings()
         
-        chain = opening_prompt | self.llm
+        session.messages.append({
+            "role": "assistant",
+            "content": message,
+            "timestamp": datetime.now().isoformat()
+        })
         
-        try:
-            response = await chain.ainvoke({})
-            
-            # Clean the response - extract only the actual message
-            clean_message = self._extract_clean_message(response)
-            
-            # Add to conversation history
-            session.messages.append({
-                "role": "assistant",
-                "content": clean_message,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            return {
-                "session_id": session_id,
-                "message": clean_message,
-                "client_info": session.client_info.to_dict(),
-                "completion_percentage": session.client_info.completion_percentage(),
-                "is_complete": session.is_complete
-            }
-            
-        except Exception as e:
-            logger.error(f"Error starting conversation: {e}")
-            return {
-                "session_id": session_id,
-                "message": "Hello! I'm excited to learn about your business and how K-Square can help you succeed. What brings you here today?",
-                "client_info": {},
-                "completion_percentage": 0,
-                "is_complete": False
-            }
+        return {
+            "session_id": session_id,
+            "message": message,
+            "client_info": session.client_info.to_dict(),
+            "completion_percentage": session.client_info.completion_percentage(),
+            "is_complete": session.is_complete
+        }
+    
+    def refresh_openings(self) -> Optional[asyncio.Task]:
+        """Top up the opening message pool in the background; returns the refill task, or None if the pool is full"""
+        if self._opening_refill is not None and not self._opening_refill.done():
+            return self._opening_refill
+        if self.response_cache.count(self._opening_key) >= self.response_cache.responses_per_key:
+            return None
+        self._opening_refill = asyncio.create_task(self._refill_openings())
+        return self._opening_refill
+    
+    async def stop_opening_refresh(self):
+        """Cancel a running opening refill, e.g. on shutdown"""
+        if self._opening_refill is not None and not self._opening_refill.done():
+            self._opening_refill.cancel()
+            try:
+                await self._opening_refill
+            except asyncio.CancelledError:
+                pass
+    
+    async def _refill_openings(self):
+        """Generate cleaned opening messages until the pool is full; gives up on the first error"""
+        key = self._opening_key
+        while self.response_cache.count(key) < self.response_cache.responses_per_key:
+            try:
+                response = await self.chains["opening"].ainvoke({})
+            except Exception as e:
+                logger.warning(f"Could not generate an opening message: {e}")
+                return
+            self.response_cache.put(key, self._extract_clean_message(response))
     
     def _extract_clean_message(self, raw_response: str) -> str:
         """Extract clean message from LLM response, removing meta-commentary and enforcing brevity"""
@@ -141,12 +370,7 @@ Be conversational, warm, and professional. Keep responses brief but engaging.
                 if not line:
                     continue
                 # Skip lines that look like meta-commentary
-                if any(pattern in line.lower() for pattern in [
-                    'notes on why', 'approach was chosen', 'would you like me to',
-                    '**notes', '---', 'this approach', 'why this', 'adjust this message',
-                    'generate a', 'response that', 'i\'m particularly interested',
-                    'it sounds like', 'that\'s really', 'fantastic!', 'wow,'
-                ]):
+                if any(pattern in line.lower() for pattern in META_COMMENTARY_PATTERNS):
                     break  # Stop processing when we hit meta-commentary
                 # Skip lines that start with asterisks (bullet points in explanations)
                 if line.startswith('*') or line.startswith('-'):
@@ -163,16 +387,16 @@ Be conversational, warm, and professional. Keep responses brief but engaging.
             
             # Enforce word limit (50 words max)
             words = clean_message.split()
-            if len(words) > 50:
+            if len(words) > REPLY_WORD_LIMIT:
                 # Keep first 45 words and add a question
-                clean_message = ' '.join(words[:45])
+                clean_message = ' '.join(words[:REPLY_KEEP_WORDS])
                 # Ensure it ends with a question if it doesn't already
                 if not clean_message.endswith('?'):
                     clean_message += "?"
             
             # Remove excessive enthusiasm and redundant phrases
-            clean_message = clean_message.replace('really ', '').replace('fantastic! ', '').replace('That\'s ', '')
-            clean_message = clean_message.replace('It sounds like ', '').replace('I\'m particularly interested in ', '')
+            for phrase in FILLER_PHRASES:
+                clean_message = clean_message.replace(phrase, '')
             
             # Fallback to a simple default if cleaning failed
             if not clean_message or len(clean_message) < 10:
@@ -198,12 +422,112 @@ Be conversational, warm, and professional. Keep responses brief but engaging.
             "timestamp": datetime.now().isoformat()
         })
         
-        # Extract any new information from the user's message
-        await self._extract_information(session, user_message)
+        if self.pipelined:
+            # The reply is prompted with the information known before this message, so both
+            # LLM calls run at once; questions about fields the message answered are then dropped
+            known_before = session.client_info.model_copy(deep=True)
+            _, response = await asyncio.gather(
+                self._extract_information(session, user_message),
+                self._generate_response(session, user_message, client_info=known_before)
+            )
+            response = self._reconcile_response(response, known_before, session.client_info)
+        else:
+            # Extract any new information from the user's message
+            await self._extract_information(session, user_message)
+            
+            # Generate natural response based on conversation context
+            response = await self._generate_response(session, user_message)
+        
+        return await self._complete_turn(session, response)
+    
+    async def stream_message(self, session_id: str, user_message: str) -> AsyncIterator[Dict[str, Any]]:
+        """Process user message, yielding the reply as the LLM generates it.
+        
+        Yields {"event": "token", "text"} for each piece of cleaned reply text, then one
+        {"event": "done", ...} with the process_message result and the time to first token.
+        In pipelined mode extraction runs while the reply streams and the final reply is
+        reconciled with it, so the done event's response can differ from the joined tokens.
+        """
+        started = time.perf_counter()
+        if session_id not in self.sessions:
+            result = await self.start_conversation(session_id)
+            yield {"event": "token", "text": result["message"]}
+            yield {"event": "done", "response": result["message"], **result,
+                   "ttft_ms": round((time.perf_counter() - started) * 1000, 1)}
+            return
         
-        # Generate natural response based on conversation context
-        response = await self._generate_response(session, user_message)
+        session = self.sessions[session_id]
+        session.messages.append({
+            "role": "user",
+            "content": user_message,
+            "timestamp": datetime.now().isoformat()
+        })
+        
+        known_before = session.client_info.model_copy(deep=True)
+        extraction = asyncio.create_task(self._extract_information(session, user_message))
+        try:
+            if not self.pipelined:
+                await extraction
+                known_before = session.client_info
+            
+            cleaner = StreamingMessageCleaner()
+            first_token = None
+            try:
+                chain = self.chains["response"]
+                chunks = chain.astream(self._response_inputs(session, user_message, known_before))
+                try:
+                    async for chunk in chunks:
+                        text = cleaner.feed(str(chunk))
+                        if text:
+                            first_token = first_token or time.perf_counter()
+                            yield {"event": "token", "text": text}
+                        if cleaner.stopped:
+                            break
+                finally:
+                    # Stop the LLM stream as soon as we are done with it
+                    await chunks.aclose()
+            except Exception as e:
+                logger.error(f"Error streaming response: {e}")
+            
+            text = cleaner.finish()
+            if not cleaner.text:
+                text = cleaner.text = REPLY_FALLBACK
+            if text:
+                first_token = first_token or time.perf_counter()
+                yield {"event": "token", "text": text}
+            
+            await extraction
+            response = self._reconcile_response(cleaner.text, known_before, session.client_info)
+            result = await self._complete_turn(session, response)
+        finally:
+            # The client may disconnect mid-reply
+            if not extraction.done():
+                extraction.cancel()
+        
+        self._first_token_times.append(first_token - started)
+        self._stream_times.append(time.perf_counter() - started)
+        yield {"event": "done", **result, "ttft_ms": round((first_token - started) * 1000, 1)}
+    
+    def get_stream_metrics(self) -> Dict[str, Any]:
+        """Time to first token and full reply time of recent streamed turns"""
+        def percentiles(samples) -> Dict[str, float]:
+            if not samples:
+                return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+            ordered = sorted(samples)
+            return {
+                "p50": round(statistics.median(ordered) * 1000, 1),
+                "p95": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 1),
+                "max": round(ordered[-1] * 1000, 1)
+            }
         
+        return {
+            "streamed_turns": len(self._first_token_times),
+            "ttft_ms": percentiles(self._first_token_times),
+            "reply_ms": percentiles(self._stream_times)
+        }
+    
+    async def _complete_turn(self, session: ConversationSession, response: str) -> Dict[str, Any]:
+        """Record the assistant reply, mark the session complete once enough is known, and build the result"""
         # Add assistant response to history
         session.messages.append({
             "role": "assistant",
@@ -219,7 +543,7 @@ Be conversational, warm, and professional. Keep responses brief but engaging.
             await self._save_session(session)
         
         return {
-            "session_id": session_id,
+            "session_id": session.session_id,
             "response": response,
             "message": response,
             "client_info": session.client_info.to_dict(),
@@ -229,50 +553,83 @@ Be conversational, warm, and professional. Keep responses brief but engaging.
         }
     
     async def _extract_information(self, session: ConversationSession, user_message: str):
-        """Extract any relevant information from user message and update client info"""
-        current_info = session.client_info.to_dict()
+        """Extract any relevant information from user message and update client info.
         
-        extraction_prompt = ChatPromptTemplate.from_template(
-            """Extract any business information from this user message and return it as JSON.
-            
-Current information we have: {current_info}
-            
-User message: "{user_message}"
-            
-Extract any of these fields if mentioned (return null for fields not mentioned):
-            - company_name: Company name (preserve exact formatting)
-            - industry: Industry or business sector
-            - problem_statement: Business problem, challenge, or goal
-            - tech_stack: Technologies, tools, platforms (as array)
-            - timeline: Project timeline or deadlines
-            - budget: Budget information or range
-            - team_size: Number of team members (as integer)
-            - location: Company or team location
-            - contact_info: Contact details like email, phone (as object)
-            
-Only extract information that is clearly stated. Don't infer or assume.
-            Return valid JSON only."""
-        )
+        Fields the fast extractor resolves are used as they are; the LLM is only called when
+        the message mentions fields the rules could not read, and is asked about those alone.
+        The rules never read a problem statement, so until one is known every message goes
+        to the LLM for it. A bare answer ("Toronto, Canada", "around 20") has no cue words: it
+        goes to the LLM for the missing fields the last reply asked about, or for every missing
+        field when the rules resolved nothing from it. List and dict fields accumulate across
+        messages.
+        """
+        matches = self.fast_extractor.extract(user_message)
+        resolved = self.fast_extractor.resolved(matches)
+        unresolved = set(self.fast_extractor.unresolved(user_message, matches))
+        missing = set(session.client_info.missing_fields()) - set(resolved)
+        if not resolved and user_message.strip():
+            unresolved |= missing
+        else:
+            unresolved |= missing & self._asked_fields(session)
+        if session.client_info.problem_statement is None:
+            unresolved.add("problem_statement")
+        unresolved = [field for field in FIELD_DESCRIPTIONS if field in unresolved]
+        self._extraction_counts["messages"] += 1
+        self._extraction_counts["fast_path_fields"] += len(resolved)
         
-        chain = extraction_prompt | self.llm | JsonOutputParser()
+        extracted = {}
+        if unresolved:
+            self._extraction_counts["llm_calls"] += 1
+            try:
+                extracted = await self.chains["extraction"].ainvoke({
+                    "current_info": json.dumps(session.client_info.to_dict()),
+                    "user_message": user_message,
+                    "fields": self._field_list(unresolved)
+                })
+            except Exception as e:
+                logger.error(f"Error extracting information: {e}")
         
-        try:
-            extracted = await chain.ainvoke({
-                "current_info": json.dumps(current_info),
-                "user_message": user_message
-            })
-            
-            # Update client info with extracted data
-            if isinstance(extracted, dict):
-                for key, value in extracted.items():
-                    if value is not None and hasattr(session.client_info, key):
-                        setattr(session.client_info, key, value)
-                        
-        except Exception as e:
-            logger.error(f"Error extracting information: {e}")
+        # Update client info with extracted data; rule matches win over the LLM's reading
+        if not isinstance(extracted, dict):
+            extracted = {}
+        for key, value in {**extracted, **resolved}.items():
+            if value is None or not hasattr(session.client_info, key):
+                continue
+            current = getattr(session.client_info, key)
+            if isinstance(current, list) and isinstance(value, list):
+                # "We also run Docker now" adds to the stack instead of replacing it
+                known = {str(item).lower() for item in current}
+                value = current + [item for item in value if str(item).lower() not in known]
+            elif isinstance(current, dict) and isinstance(value, dict):
+                value = {**current, **value}
+            setattr(session.client_info, key, value)
+    
+    def _asked_fields(self, session: ConversationSession) -> Set[str]:
+        """Fields the questions of the last assistant message asked about"""
+        last_reply = next((msg["content"] for msg in reversed(session.messages) if msg["role"] == "assistant"), "")
+        questions = [sentence.lower() for sentence in SENTENCE_BOUNDARY.split(last_reply.strip()) if sentence.endswith("?")]
+        return {
+            field for field, keywords in FIELD_QUESTION_KEYWORDS.items()
+            if any(keyword in question for question in questions for keyword in keywords)
+        }
+    
+    def _field_list(self, fields: List[str]) -> str:
+        """Extraction prompt lines describing fields"""
+        return "\n            ".join(f"- {field}: {FIELD_DESCRIPTIONS[field]}" for field in fields)
+    
+    def get_extraction_metrics(self) -> Dict[str, Any]:
+        """How many messages needed LLM extraction and how many fields the rules resolved"""
+        messages = self._extraction_counts["messages"]
+        return {
+            "messages": messages,
+            "llm_calls": self._extraction_counts["llm_calls"],
+            "llm_calls_saved": messages - self._extraction_counts["llm_calls"],
+            "fast_path_fields": self._extraction_counts["fast_path_fields"]
+        }
     
-    async def _generate_response(self, session: ConversationSession, user_message: str) -> str:
-        """Generate a natural, contextual response"""
+    def _response_inputs(self, session: ConversationSession, user_message: str,
+                         client_info: ClientInfo) -> Dict[str, Any]:
+        """Variables of the reply prompt: recent conversation and what is known and missing in client_info"""
         # Build conversation context
         recent_messages = session.messages[-6:]  # Last 6 messages for context
         conversation_history = "\n".join([
@@ -280,50 +637,51 @@ Only extract information that is clearly stated. Don't infer or assume.
             for msg in recent_messages
         ])
         
-        current_info = session.client_info.to_dict()
-        missing_fields = session.client_info.missing_fields()
-        completion_percentage = session.client_info.completion_percentage()
-        
-        response_prompt = ChatPromptTemplate.from_template(
-            self.system_prompt + 
-            """
-            
-Conversation so far:
-            {conversation_history}
-            
-User just said: "{user_message}"
-            
-Current information collected: {current_info}
-            Missing information: {missing_fields}
-            Completion: {completion_percentage}%
-            
-Generate a brief, focused response that:
-            1. Acknowledges what the user said (1 sentence)
-            2. Asks 1-2 specific follow-up questions to gather missing info
-            3. Keeps total response under 50 words
-            4. Prioritizes the most important missing information
-            
-If completion is above 80%, focus on confirming details and next steps.
-            Otherwise, ask targeted questions about the highest priority missing fields.
-            
-Be friendly but concise. No lengthy explanations or multiple topics."""
-        )
-        
-        chain = response_prompt | self.llm
+        return {
+            "conversation_history": conversation_history,
+            "user_message": user_message,
+            "current_info": json.dumps(client_info.to_dict()),
+            "missing_fields": client_info.missing_fields(),
+            "completion_percentage": client_info.completion_percentage()
+        }
+    
+    async def _generate_response(self, session: ConversationSession, user_message: str,
+                                 client_info: Optional[ClientInfo] = None) -> str:
+        """Generate a natural, contextual response (from client_info if given, else the session's)"""
+        client_info = client_info or session.client_info
         
         try:
-            response = await chain.ainvoke({
-                "conversation_history": conversation_history,
-                "user_message": user_message,
-                "current_info": json.dumps(current_info),
-                "missing_fields": missing_fields,
-                "completion_percentage": completion_percentage
-            })
+            response = await self.chains["response"].ainvoke(self._response_inputs(session, user_message, client_info))
             return response
             
         except Exception as e:
             logger.error(f"Error generating response: {e}")
-            return "I appreciate you sharing that with me. Could you tell me a bit more about your business and what you're hoping to achieve?"
+            return REPLY_FALLBACK
+    
+    def _reconcile_response(self, response: str, known_before: ClientInfo, known_after: ClientInfo) -> str:
+        """Drop questions in a reply about fields that extraction filled in from the same message"""
+        filled = [
+            field for field in known_before.missing_fields()
+            if getattr(known_after, field) is not None
+        ]
+        if not filled:
+            return response
+        
+        keywords = [keyword for field in filled for keyword in FIELD_QUESTION_KEYWORDS.get(field, [])]
+        sentences = SENTENCE_BOUNDARY.split(str(response).strip())
+        kept = [
+            sentence for sentence in sentences
+            if not (sentence.endswith("?") and any(keyword in sentence.lower() for keyword in keywords))
+        ]
+        if len(kept) == len(sentences):
+            return response
+        
+        # Keep the conversation moving: ask about the next missing field if no question is left
+        missing = known_after.missing_fields()
+        if missing and not any(sentence.endswith("?") for sentence in kept):
+            kept.append(FIELD_FOLLOW_UPS.get(missing[0], "What else should we know about your project?"))
+        logger.debug(f"Reconciled reply: dropped questions about {', '.join(filled)}")
+        return " ".join(kept)
     
     async def _save_session(self, session: ConversationSession):
         """Save completed session to database"""
@@ -0,0 +1,113 @@
+import inspect
+import logging
+from typing import Any, Awaitable, Dict, List, Type
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+logger = logging.getLogger(__name__)
+
+def _join_tech_stack(value: Any) -> Any:
+    """Accept a tech stack given as a list as well as a comma-separated string"""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value)
+    return value
+
+class AgentInput(BaseModel):
+    """Base of agent input schemas; unknown fields are rejected so typos surface as errors"""
+    model_config = ConfigDict(extra="forbid")
+
+class DomainKnowledgeInput(AgentInput):
+    industry: str
+    problem_statement: str = ""
+    tech_stack: str = ""
+
+    _tech_stack = field_validator("tech_stack", mode="before")(_join_tech_stack)
+
+class ClientProfileInput(AgentInput):
+    client_name: str
+    industry: str = ""
+    problem_statement: str = ""
+    tech_stack: str = ""
+
+    _tech_stack = field_validator("tech_stack", mode="before")(_join_tech_stack)
+
+class MeetingAnalysisInput(AgentInput):
+    client_name: str
+    transcript: str
+
+class ActionableInsightsInput(AgentInput):
+    client_name: str
+    domain_knowledge: Dict[str, Any] = {}
+    client_profile: Dict[str, Any] = {}
+    meeting_analysis: Dict[str, Any] = {}
+
+class AgentEntry:
+    """A registered agent: the instance, the name of its entry coroutine and the schema of its inputs.
+
+    The entry method is looked up on the instance at call time, so replacing it (e.g. in
+    tests) takes effect without re-registering. Input field names match the method's
+    parameter names.
+    """
+
+    def __init__(self, name: str, agent: Any, method: str, input_model: Type[AgentInput], description: str = ""):
+        self.name = name
+        self.agent = agent
+        self.method = method
+        self.input_model = input_model
+        self.description = description
+
+    def __call__(self, *args, **kwargs) -> Awaitable[Dict[str, Any]]:
+        return getattr(self.agent, self.method)(*args, **kwargs)
+
+    def validate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Entry keyword arguments from untrusted params; raises ValueError (pydantic ValidationError)"""
+        return self.input_model.model_validate(params).model_dump()
+
+    def describe(self) -> Dict[str, Any]:
+        """Name, description and JSON schema of the inputs"""
+        return {
+            "name": self.name,
+            "agent": getattr(self.agent, "name", type(self.agent).__name__),
+            "description": self.description,
+            "input_schema": self.input_model.model_json_schema()
+        }
+
+class AgentRegistry:
+    """Agents by name, for single-agent runs and workflow stages alike (one dict lookup per dispatch)"""
+
+    def __init__(self):
+        self._entries: Dict[str, AgentEntry] = {}
+
+    def register(self, name: str, agent: Any, method: str, input_model: Type[AgentInput],
+                 description: str = "") -> AgentEntry:
+        """Register agent under name with its entry coroutine method; raises ValueError on a bad entry"""
+        if name in self._entries:
+            raise ValueError(f"Agent {name} is already registered")
+        if not inspect.iscoroutinefunction(getattr(agent, method, None)):
+            raise ValueError(f"{type(agent).__name__}.{method} is not a coroutine method")
+        entry = self._entries[name] = AgentEntry(name, agent, method, input_model, description)
+        logger.debug(f"Registered agent {name} -> {type(agent).__name__}.{method}")
+        return entry
+
+    def get(self, name: str) -> AgentEntry:
+        """Entry for name; raises KeyError if no such agent is registered"""
+        return self._entries[name]
+
+    def names(self) -> List[str]:
+        """Registered agent names in registration order"""
+        return list(self._entries)
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """Descriptions and input schemas of every registered agent"""
+        return [entry.describe() for entry in self._entries.values()]
+
+    async def execute(self, name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate params against the agent's schema and run it; KeyError or ValueError on bad requests"""
+        entry = self._entries[name]
+        return await entry(**entry.validate(params))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
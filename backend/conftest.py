@@ -0,0 +1,15 @@
+"""
+pytest configuration for the backend tests.
+
+The workflow orchestrator, job queue and main app use package-relative imports,
+so tests exercising them import everything through the ``backend`` package.
+Put the repository root on sys.path so that also works when pytest is run
+from inside backend/.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
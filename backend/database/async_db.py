@@ -0,0 +1,150 @@
+import asyncio
+import functools
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class AsyncProxy:
+    """Awaitable view of an object whose blocking methods run on an AsyncDatabase executor"""
+
+    def __init__(self, runner: "AsyncDatabase", target: Any):
+        self._runner = runner
+        self._target = target
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await self._runner.run(attr, *args, **kwargs)
+        return call
+
+class AsyncDatabase(AsyncProxy):
+    """Async data access for DatabaseManager.
+
+    Blocking calls run on a dedicated thread pool sized to the connection pool, so
+    request handlers await SQLite instead of stalling the event loop. At most
+    max_pending calls are handed to the executor at once; further callers wait
+    (asynchronously, in arrival order) for a slot. Health probes use a separate
+    single thread so they are never queued behind query traffic.
+    """
+
+    def __init__(self, db_manager, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        super().__init__(self, db_manager)
+        self.db_manager = db_manager
+        # One thread per pooled reader plus one for the writer
+        self.max_workers = max_workers or db_manager.pool_size + 1
+        self.max_pending = max_pending or self.max_workers * 2
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._probe_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # asyncio primitives belong to one event loop, so keep a semaphore per loop
+        self._slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+        self._metrics = {
+            "calls": 0,
+            "errors": 0,
+            "waiting": 0,
+            "in_flight": 0,
+            "max_waiting": 0,
+            "total_queue_wait": 0.0,
+            "max_queue_wait": 0.0
+        }
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="ks-db")
+        return self._executor
+
+    def _get_probe_executor(self) -> ThreadPoolExecutor:
+        if self._probe_executor is None:
+            with self._executor_lock:
+                if self._probe_executor is None:
+                    self._probe_executor = ThreadPoolExecutor(1, thread_name_prefix="ks-db-probe")
+        return self._probe_executor
+
+    def _get_slots(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.max_pending)
+        return slots
+
+    def bind(self, target: Any) -> AsyncProxy:
+        """Awaitable view of target (e.g. a repository) whose calls run on this executor"""
+        return AsyncProxy(self, target)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking database call on the executor and await its result"""
+        loop = asyncio.get_running_loop()
+        metrics = self._metrics
+        queued_at = time.perf_counter()
+
+        metrics["waiting"] += 1
+        metrics["max_waiting"] = max(metrics["max_waiting"], metrics["waiting"])
+        try:
+            await self._get_slots(loop).acquire()
+        finally:
+            metrics["waiting"] -= 1
+
+        waited = time.perf_counter() - queued_at
+        metrics["calls"] += 1
+        metrics["in_flight"] += 1
+        metrics["total_queue_wait"] += waited
+        metrics["max_queue_wait"] = max(metrics["max_queue_wait"], waited)
+        try:
+            future = self._get_executor().submit(functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            self._finish(None)
+            raise
+        # The slot is freed when the call finishes on its thread, not when the awaiter
+        # is cancelled, so cancellations cannot push past max_pending
+        future.add_done_callback(lambda done: self._release(loop, done))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _release(self, loop: asyncio.AbstractEventLoop, future):
+        try:
+            loop.call_soon_threadsafe(self._finish, future)
+        except RuntimeError:
+            # The loop is closed; its semaphore went with it
+            self._metrics["in_flight"] -= 1
+
+    def _finish(self, future):
+        metrics = self._metrics
+        metrics["in_flight"] -= 1
+        if future is not None and not future.cancelled() and future.exception() is not None:
+            metrics["errors"] += 1
+        self._get_slots(asyncio.get_running_loop()).release()
+
+    async def check_connection(self) -> bool:
+        """Health probe on its own thread, independent of query load"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_probe_executor(), self.db_manager.check_connection)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get executor queue metrics"""
+        metrics = dict(self._metrics)
+        calls = metrics["calls"]
+        metrics["avg_queue_wait_ms"] = round(metrics["total_queue_wait"] / calls * 1000, 3) if calls else 0.0
+        metrics["max_queue_wait_ms"] = round(metrics.pop("max_queue_wait") * 1000, 3)
+        metrics.pop("total_queue_wait")
+        metrics["max_workers"] = self.max_workers
+        metrics["max_pending"] = self.max_pending
+        return metrics
+
+    def close(self):
+        """Shut down the executor threads"""
+        for executor in (self._executor, self._probe_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._executor = None
+        self._probe_executor = None
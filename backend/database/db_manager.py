@@ -1,38 +1,334 @@
 import sqlite3
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import queue
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from datetime import datetime
 from textblob import TextBlob
 
+from .async_db import AsyncDatabase
+from .migrations import apply_migrations, split_tags
+from .pagination import decode_cursor, parse_fields
+
 logger = logging.getLogger(__name__)
 
+# Columns a fields= projection may select from each paginated table
+USE_CASE_FIELDS = ("id", "client_name", "industry", "problem_statement", "tech_stack", "created_at")
+MEETING_FIELDS = (
+    "id", "client_name", "transcript", "action_items", "engagement_metrics",
+    "sentiment_score", "sentiment_category", "created_at"
+)
+
+# client_key is lower(trim(client_name)) with a unique index, so saving a profile
+# for an existing client (in any letter case) updates it in place
+PROFILE_UPSERT = """
+    INSERT INTO profiles (client_name, profile_data) VALUES (?, ?)
+    ON CONFLICT(client_key) DO UPDATE SET
+        profile_data = excluded.profile_data,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# FTS5 virtual tables mirror insights and meetings as external-content indexes,
+# kept in sync by triggers so writers never touch them directly
+SEARCH_INDEX_SCHEMA = {
+    "insights_fts": [
+        """CREATE VIRTUAL TABLE insights_fts USING fts5(
+            content, tags, content='insights', content_rowid='id', tokenize='porter unicode61'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS insights_fts_ai AFTER INSERT ON insights BEGIN
+            INSERT INTO insights_fts(rowid, content, tags) VALUES (new.id, new.content, new.tags);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS insights_fts_ad AFTER DELETE ON insights BEGIN
+            INSERT INTO insights_fts(insights_fts, rowid, content, tags) VALUES ('delete', old.id, old.content, old.tags);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS insights_fts_au AFTER UPDATE OF content, tags ON insights BEGIN
+            INSERT INTO insights_fts(insights_fts, rowid, content, tags) VALUES ('delete', old.id, old.content, old.tags);
+            INSERT INTO insights_fts(rowid, content, tags) VALUES (new.id, new.content, new.tags);
+        END"""
+    ],
+    "meetings_fts": [
+        """CREATE VIRTUAL TABLE meetings_fts USING fts5(
+            transcript, content='meetings', content_rowid='id', tokenize='porter unicode61'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS meetings_fts_ai AFTER INSERT ON meetings BEGIN
+            INSERT INTO meetings_fts(rowid, transcript) VALUES (new.id, new.transcript);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS meetings_fts_ad AFTER DELETE ON meetings BEGIN
+            INSERT INTO meetings_fts(meetings_fts, rowid, transcript) VALUES ('delete', old.id, old.transcript);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS meetings_fts_au AFTER UPDATE OF transcript ON meetings BEGIN
+            INSERT INTO meetings_fts(meetings_fts, rowid, transcript) VALUES ('delete', old.id, old.transcript);
+            INSERT INTO meetings_fts(rowid, transcript) VALUES (new.id, new.transcript);
+        END"""
+    ]
+}
+
+class PoolTimeoutError(sqlite3.OperationalError):
+    """Raised when no pooled connection becomes available within the checkout timeout"""
+
+class ConnectionPool:
+    """Bounded SQLite connection pool with a set of reader connections and a single writer"""
+    
+    def __init__(self, db_path: str, max_readers: int = 4, checkout_timeout: float = 30.0,
+                 cache_size_kb: int = 65536, mmap_size: int = 256 * 1024 * 1024):
+        self.db_path = db_path
+        self.max_readers = max(1, max_readers)
+        self.checkout_timeout = checkout_timeout
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size = mmap_size
+        # Every connection to ":memory:" is a separate database, so in-memory pools
+        # serve reads from the writer connection instead of opening readers
+        self.in_memory = db_path == ":memory:" or "mode=memory" in db_path
+        
+        self._writer = self._open(readonly=False)
+        self._writer_lock = threading.RLock()
+        self._writer_depth = threading.local()
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=self.max_readers)
+        self._all_readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            "reader_checkouts": 0,
+            "reader_waits": 0,
+            "reader_wait_time_total": 0.0,
+            "reader_wait_time_max": 0.0,
+            "writer_checkouts": 0,
+            "writer_waits": 0,
+            "writer_wait_time_total": 0.0,
+            "writer_wait_time_max": 0.0,
+            "checkout_timeouts": 0,
+            "readers_in_use": 0
+        }
+    
+    def _open(self, readonly: bool) -> sqlite3.Connection:
+        """Open a connection and apply the performance pragmas"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.checkout_timeout,
+            check_same_thread=False,
+            uri=self.db_path.startswith("file:")
+        )
+        conn.row_factory = sqlite3.Row
+        if not readonly and not self.in_memory:
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.checkout_timeout * 1000)}")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if readonly:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+    
+    def _record_wait(self, kind: str, waited: float, blocked: bool):
+        """Update checkout metrics for a reader or writer checkout"""
+        with self._metrics_lock:
+            self._metrics[f"{kind}_checkouts"] += 1
+            if blocked:
+                self._metrics[f"{kind}_waits"] += 1
+            self._metrics[f"{kind}_wait_time_total"] += waited
+            self._metrics[f"{kind}_wait_time_max"] = max(self._metrics[f"{kind}_wait_time_max"], waited)
+    
+    def _timeout(self, kind: str) -> PoolTimeoutError:
+        with self._metrics_lock:
+            self._metrics["checkout_timeouts"] += 1
+        return PoolTimeoutError(f"Timed out after {self.checkout_timeout}s waiting for a {kind} connection")
+    
+    def _checkout_reader(self) -> sqlite3.Connection:
+        start = time.perf_counter()
+        try:
+            conn = self._readers.get_nowait()
+            self._record_wait("reader", time.perf_counter() - start, blocked=False)
+            return conn
+        except queue.Empty:
+            pass
+        
+        with self._readers_lock:
+            if len(self._all_readers) < self.max_readers:
+                conn = self._open(readonly=True)
+                self._all_readers.append(conn)
+                self._record_wait("reader", time.perf_counter() - start, blocked=False)
+                return conn
+        
+        try:
+            conn = self._readers.get(timeout=self.checkout_timeout)
+        except queue.Empty:
+            raise self._timeout("reader")
+        self._record_wait("reader", time.perf_counter() - start, blocked=True)
+        return conn
+    
+    @contextmanager
+    def reader(self):
+        """Check out a read-only connection for the duration of the block"""
+        if self.in_memory:
+            with self.writer() as conn:
+                yield conn
+            return
+        
+        conn = self._checkout_reader()
+        with self._metrics_lock:
+            self._metrics["readers_in_use"] += 1
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            with self._metrics_lock:
+                self._metrics["readers_in_use"] -= 1
+            self._readers.put(conn)
+    
+    @contextmanager
+    def writer(self):
+        """Check out the single writer connection; commits on success, rolls back on error"""
+        start = time.perf_counter()
+        blocked = not self._writer_lock.acquire(blocking=False)
+        if blocked and not self._writer_lock.acquire(timeout=self.checkout_timeout):
+            raise self._timeout("writer")
+        self._record_wait("writer", time.perf_counter() - start, blocked)
+        
+        depth = getattr(self._writer_depth, "value", 0)
+        self._writer_depth.value = depth + 1
+        try:
+            yield self._writer
+            if depth == 0:
+                self._writer.commit()
+        except BaseException:
+            if depth == 0:
+                self._writer.rollback()
+            raise
+        finally:
+            self._writer_depth.value = depth
+            self._writer_lock.release()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get checkout and wait metrics for sizing the pool"""
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        metrics.update({
+            "max_readers": self.max_readers,
+            "readers_open": len(self._all_readers),
+            "readers_idle": self._readers.qsize(),
+            "in_memory": self.in_memory,
+            "reader_wait_time_avg": (
+                metrics["reader_wait_time_total"] / metrics["reader_checkouts"]
+                if metrics["reader_checkouts"] else 0.0
+            ),
+            "writer_wait_time_avg": (
+                metrics["writer_wait_time_total"] / metrics["writer_checkouts"]
+                if metrics["writer_checkouts"] else 0.0
+            )
+        })
+        return metrics
+    
+    def close(self):
+        """Close every connection owned by the pool"""
+        with self._readers_lock:
+            for conn in self._all_readers:
+                conn.close()
+            self._all_readers.clear()
+        with self._writer_lock:
+            self._writer.close()
+
 class DatabaseManager:
-    def __init__(self, db_path: str = ":memory:"):
+    def __init__(self, db_path: str = ":memory:", pool_size: int = 4, checkout_timeout: float = 30.0):
         self.db_path = db_path
-        self.connection = None
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self._pool: Optional[ConnectionPool] = None
+        self._aio: Optional[AsyncDatabase] = None
+        self._pool_lock = threading.Lock()
+        self.fts_enabled = False
+        self.schema_version = 0
+    
+    @property
+    def pool(self) -> ConnectionPool:
+        """Lazily open the connection pool on first use"""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        self.db_path,
+                        max_readers=self.pool_size,
+                        checkout_timeout=self.checkout_timeout
+                    )
+        return self._pool
+    
+    @property
+    def aio(self) -> AsyncDatabase:
+        """Awaitable versions of these methods, run on a database thread executor"""
+        if self._aio is None:
+            with self._pool_lock:
+                if self._aio is None:
+                    self._aio = AsyncDatabase(self)
+        return self._aio
+    
+    def reader(self):
+        """Check out a pooled read-only connection"""
+        return self.pool.reader()
+    
+    def writer(self):
+        """Check out the pooled writer connection (commits when the block exits cleanly)"""
+        return self.pool.writer()
     
     def get_connection(self):
-        """Get database connection"""
-        if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.connection.row_factory = sqlite3.Row
-        return self.connection
+        """Get the shared writer connection (prefer reader()/writer(), which are thread-safe)"""
+        return self.pool._writer
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Get connection pool checkout/wait metrics"""
+        return self.pool.get_metrics()
+    
+    def close(self):
+        """Close all pooled connections"""
+        if self._aio is not None:
+            self._aio.close()
+            self._aio = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
     
     def check_connection(self) -> bool:
         """Check if database connection is healthy"""
         try:
-            conn = self.get_connection()
-            conn.execute("SELECT 1")
+            # Readers never wait on the writer (WAL), so probes don't queue behind in-flight writes
+            with self.reader() as conn:
+                conn.execute("SELECT 1")
             return True
         except Exception:
             return False
     
     def initialize_database(self):
         """Initialize database tables"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
+        with self.writer() as conn:
+            self._create_tables(conn.cursor())
+            self.fts_enabled = self._create_search_index(conn.cursor())
+            self.schema_version = apply_migrations(conn)
+        logger.info(f"Database initialized successfully (schema version {self.schema_version})")
+    
+    def _create_search_index(self, cursor: sqlite3.Cursor) -> bool:
+        """Create the FTS5 search tables and sync triggers; returns False if FTS5 is unavailable"""
+        try:
+            for table, statements in SEARCH_INDEX_SCHEMA.items():
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+                if cursor.fetchone():
+                    continue
+                
+                for statement in statements:
+                    cursor.execute(statement)
+                # Index rows that existed before the search table was created
+                cursor.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+                logger.info(f"Created full-text index {table}")
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, knowledge base search will use LIKE scans: {e}")
+            return False
+    
+    def _create_tables(self, cursor: sqlite3.Cursor):
+        """Create the base tables"""
         # Create use_cases table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS use_cases (
@@ -102,9 +398,6 @@ class DatabaseManager:
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-
-        conn.commit()
-        logger.info("Database initialized successfully")
     
     def analyze_sentiment(self, text: str) -> tuple:
         """Analyze sentiment using TextBlob"""
@@ -122,14 +415,11 @@ class DatabaseManager:
     
     def load_use_cases(self):
         """Load predefined use cases into database"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         # Check if use cases already exist
-        cursor.execute("SELECT COUNT(*) FROM use_cases")
-        if cursor.fetchone()[0] > 0:
-            logger.info("Use cases already loaded")
-            return
+        with self.reader() as conn:
+            if conn.execute("SELECT COUNT(*) FROM use_cases").fetchone()[0] > 0:
+                logger.info("Use cases already loaded")
+                return
         
         use_cases = [
             {
@@ -191,66 +481,119 @@ class DatabaseManager:
             }
         ]
         
-        for case in use_cases:
-            # Insert use case
-            cursor.execute("""
-                INSERT INTO use_cases (client_name, industry, problem_statement, tech_stack)
-                VALUES (?, ?, ?, ?)
-            """, (case["client_name"], case["industry"], case["problem_statement"], case["tech_stack"]))
+        with self.writer() as conn:
+            cursor = conn.cursor()
             
-            # Insert profile
-            cursor.execute("""
-                INSERT INTO profiles (client_name, profile_data)
-                VALUES (?, ?)
-            """, (case["client_name"], json.dumps(case["profile"])))
+            for case in use_cases:
+                # Insert use case
+                cursor.execute("""
+                    INSERT INTO use_cases (client_name, industry, problem_statement, tech_stack)
+                    VALUES (?, ?, ?, ?)
+                """, (case["client_name"], case["industry"], case["problem_statement"], case["tech_stack"]))
             
-            # Insert domain knowledge
-            cursor.execute("""
-                INSERT INTO insights (client_name, insight_type, content, tags)
-                VALUES (?, ?, ?, ?)
-            """, (case["client_name"], "domain_knowledge", case["domain_knowledge"], "Best Practices"))
+                # Insert profile
+                cursor.execute(PROFILE_UPSERT, (case["client_name"], json.dumps(case["profile"])))
             
-            # Insert recommendations
-            cursor.execute("""
-                INSERT INTO insights (client_name, insight_type, content, tags)
-                VALUES (?, ?, ?, ?)
-            """, (case["client_name"], "recommendations", case["recommendations"], "Recommendations"))
+                # Insert domain knowledge
+                self._insert_insight(conn, case["client_name"], "domain_knowledge", case["domain_knowledge"], ["Best Practices"])
             
-            # Analyze sentiment and insert meeting data
-            sentiment_score, sentiment_category = self.analyze_sentiment(case["transcript"])
+                # Insert recommendations
+                self._insert_insight(conn, case["client_name"], "recommendations", case["recommendations"], ["Recommendations"])
             
-            cursor.execute("""
-                INSERT INTO meetings (client_name, transcript, action_items, engagement_metrics, sentiment_score, sentiment_category)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                case["client_name"],
-                case["transcript"],
-                json.dumps(["Clarify MVP scope", "Finalize encryption plan", "Test checkout flow"][use_cases.index(case)]),
-                json.dumps({"engagement": [70, 80, 65][use_cases.index(case)]}),
-                sentiment_score,
-                sentiment_category
-            ))
-        
-        conn.commit()
+                # Insert meeting data (sentiment is scored on insert)
+                self._insert_meeting(
+                    conn,
+                    case["client_name"],
+                    case["transcript"],
+                    ["Clarify MVP scope", "Finalize encryption plan", "Test checkout flow"][use_cases.index(case)],
+                    {"engagement": [70, 80, 65][use_cases.index(case)]}
+                )
+        
         logger.info(f"Loaded {len(use_cases)} use cases successfully")
     
-    def get_use_cases(self) -> List[Dict]:
-        """Get all use cases"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+    def _insert_insight(self, conn: sqlite3.Connection, client_name: str, insight_type: str,
+                        content: str, tags: Optional[List[str]] = None) -> int:
+        """Insert an insight and its normalized tags on an open writer connection"""
+        tags = split_tags(tags)
+        cursor = conn.execute(
+            "INSERT INTO insights (client_name, insight_type, content, tags) VALUES (?, ?, ?, ?)",
+            (client_name, insight_type, content, ", ".join(tags) or None)
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO insight_tags (tag, insight_id) VALUES (?, ?)",
+            [(tag, cursor.lastrowid) for tag in tags]
+        )
+        return cursor.lastrowid
+    
+    def _insert_meeting(self, conn: sqlite3.Connection, client_name: str, transcript: str,
+                        action_items: Optional[List[str]] = None, engagement_metrics: Optional[Dict[str, Any]] = None) -> int:
+        """Insert a meeting with its sentiment on an open writer connection (triggers update meeting_stats)"""
+        sentiment_score, sentiment_category = self.analyze_sentiment(transcript)
+        cursor = conn.execute("""
+            INSERT INTO meetings (client_name, transcript, action_items, engagement_metrics, sentiment_score, sentiment_category)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (
+            client_name,
+            transcript,
+            json.dumps(action_items if action_items is not None else []),
+            json.dumps(engagement_metrics or {}),
+            sentiment_score,
+            sentiment_category
+        ))
+        return cursor.lastrowid
+    
+    def save_meeting(self, client_name: str, transcript: str, action_items: Optional[List[str]] = None,
+                     engagement_metrics: Optional[Dict[str, Any]] = None) -> int:
+        """Store a meeting transcript with its sentiment; the aggregates are updated in the same transaction"""
+        with self.writer() as conn:
+            return self._insert_meeting(conn, client_name, transcript, action_items, engagement_metrics)
+    
+    def add_insight(self, client_name: str, insight_type: str, content: str,
+                    tags: Optional[List[str]] = None) -> int:
+        """Store a knowledge base insight with its tags"""
+        with self.writer() as conn:
+            return self._insert_insight(conn, client_name, insight_type, content, tags)
+    
+    def get_insights_by_tag(self, tag: str) -> List[Dict]:
+        """Get insights carrying a tag (case-insensitive), newest first"""
+        with self.reader() as conn:
+            rows = conn.execute("""
+                SELECT insights.* FROM insight_tags
+                JOIN insights ON insights.id = insight_tags.insight_id
+                WHERE insight_tags.tag = ?
+                ORDER BY insight_tags.insight_id DESC
+            """, (tag.strip(),)).fetchall()
         
-        cursor.execute("SELECT * FROM use_cases")
-        rows = cursor.fetchall()
+        return [dict(row) for row in rows]
+    
+    def _select_columns(self, columns: tuple, fields: Optional[str]) -> List[str]:
+        """Columns for a fields= projection; the id is always included for cursors"""
+        selected = parse_fields(fields, columns) or list(columns)
+        return selected if "id" in selected else ["id"] + selected
+    
+    def get_use_cases(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                      fields: Optional[str] = None) -> List[Dict]:
+        """Get use cases in id order, optionally one keyset page of the selected fields"""
+        columns = self._select_columns(USE_CASE_FIELDS, fields)
+        sql = f"SELECT {', '.join(columns)} FROM use_cases"
+        params: List[Any] = []
+        if cursor:
+            sql += " WHERE id > ?"
+            params.extend(decode_cursor(cursor, 1))
+        sql += " ORDER BY id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        with self.reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
         
         return [dict(row) for row in rows]
     
     def get_client_profiles(self) -> List[Dict]:
         """Get all client profiles"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM profiles")
-        rows = cursor.fetchall()
+        with self.reader() as conn:
+            rows = conn.execute("SELECT * FROM profiles").fetchall()
         
         profiles = []
         for row in rows:
@@ -260,143 +603,234 @@ class DatabaseManager:
         
         return profiles
     
+    def get_client_profile(self, client_name: str) -> Optional[Dict]:
+        """Get one client profile by name (case and surrounding whitespace ignored), or None"""
+        with self.reader() as conn:
+            row = conn.execute(
+                "SELECT * FROM profiles WHERE client_key = lower(trim(?))", (client_name,)
+            ).fetchone()
+        
+        if not row:
+            return None
+        
+        profile = dict(row)
+        profile["profile_data"] = json.loads(profile["profile_data"])
+        return profile
+    
     def save_client_profile(self, client_name: str, profile_data: Dict[str, Any]):
         """Save or update client profile in database"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         try:
-            # Check if profile already exists
-            cursor.execute("SELECT id FROM profiles WHERE client_name = ?", (client_name,))
-            existing = cursor.fetchone()
-            
-            profile_json = json.dumps(profile_data)
-            
-            if existing:
-                # Update existing profile
-                cursor.execute(
-                    "UPDATE profiles SET profile_data = ?, updated_at = CURRENT_TIMESTAMP WHERE client_name = ?",
-                    (profile_json, client_name)
-                )
-                logger.info(f"Updated existing profile for {client_name}")
-            else:
-                # Insert new profile
-                cursor.execute(
-                    "INSERT INTO profiles (client_name, profile_data) VALUES (?, ?)",
-                    (client_name, profile_json)
-                )
-                logger.info(f"Created new profile for {client_name}")
-            
-            conn.commit()
+            with self.writer() as conn:
+                conn.execute(PROFILE_UPSERT, (client_name, json.dumps(profile_data)))
+            logger.info(f"Saved profile for {client_name}")
             
         except Exception as e:
             logger.error(f"Error saving client profile for {client_name}: {e}")
-            conn.rollback()
+            raise
+    
+    def save_client_profiles(self, profiles: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Upsert (client_name, profile_data) pairs in a single transaction; returns the number saved"""
+        saved = 0
+        
+        def rows():
+            nonlocal saved
+            for client_name, profile_data in profiles:
+                saved += 1
+                yield client_name, json.dumps(profile_data)
+        
+        try:
+            with self.writer() as conn:
+                conn.executemany(PROFILE_UPSERT, rows())
+            logger.info(f"Saved {saved} client profiles")
+            return saved
+            
+        except Exception as e:
+            logger.error(f"Error saving client profiles: {e}")
             raise
     
     def get_domain_knowledge(self) -> List[Dict]:
         """Get domain knowledge insights"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT * FROM insights WHERE insight_type = 'domain_knowledge'
-        """)
-        rows = cursor.fetchall()
+        with self.reader() as conn:
+            rows = conn.execute("""
+                SELECT * FROM insights WHERE insight_type = 'domain_knowledge'
+            """).fetchall()
         
         return [dict(row) for row in rows]
     
-    def get_meeting_insights(self) -> List[Dict]:
-        """Get meeting insights with sentiment data"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM meetings")
-        rows = cursor.fetchall()
+    def get_meeting_insights(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                             fields: Optional[str] = None) -> List[Dict]:
+        """Get meeting insights with sentiment data, newest first, optionally one keyset page of the selected fields"""
+        columns = self._select_columns(MEETING_FIELDS, fields)
+        sql = f"SELECT {', '.join(columns)} FROM meetings"
+        params: List[Any] = []
+        if cursor:
+            sql += " WHERE id < ?"
+            params.extend(decode_cursor(cursor, 1))
+        sql += " ORDER BY id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        with self.reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
         
         insights = []
         for row in rows:
             insight = dict(row)
-            insight["action_items"] = json.loads(insight["action_items"]) if insight["action_items"] else []
-            insight["engagement_metrics"] = json.loads(insight["engagement_metrics"]) if insight["engagement_metrics"] else {}
+            if "action_items" in insight:
+                insight["action_items"] = json.loads(insight["action_items"]) if insight["action_items"] else []
+            if "engagement_metrics" in insight:
+                insight["engagement_metrics"] = json.loads(insight["engagement_metrics"]) if insight["engagement_metrics"] else {}
             insights.append(insight)
         
         return insights
     
+    def get_meetings_by_client(self, client_name: str) -> List[Dict]:
+        """Get a client's meetings, most recent first"""
+        with self.reader() as conn:
+            rows = conn.execute(
+                "SELECT * FROM meetings WHERE client_name = ? ORDER BY created_at DESC, id DESC",
+                (client_name,)
+            ).fetchall()
+        
+        meetings = []
+        for row in rows:
+            meeting = dict(row)
+            meeting["action_items"] = json.loads(meeting["action_items"]) if meeting["action_items"] else []
+            meeting["engagement_metrics"] = json.loads(meeting["engagement_metrics"]) if meeting["engagement_metrics"] else {}
+            meetings.append(meeting)
+        
+        return meetings
+    
     def get_recommendations(self) -> List[Dict]:
         """Get recommendations"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT * FROM insights WHERE insight_type = 'recommendations'
-        """)
-        rows = cursor.fetchall()
+        with self.reader() as conn:
+            rows = conn.execute("""
+                SELECT * FROM insights WHERE insight_type = 'recommendations'
+            """).fetchall()
         
         return [dict(row) for row in rows]
     
-    def get_sentiment_data(self) -> Dict:
+    def get_meeting_stats(self, client_name: Optional[str] = None) -> Dict[str, Any]:
+        """Get the trigger-maintained meeting aggregates for a client (or all meetings) in one key lookup"""
+        with self.reader() as conn:
+            # Normalized in SQL exactly as the triggers normalize it
+            row = conn.execute(
+                "SELECT * FROM meeting_stats WHERE scope = lower(trim(?))", (client_name or "*",)
+            ).fetchone()
+        
+        stats = dict(row) if row else {}
+        meetings = stats.get("meetings", 0)
+        return {
+            "total_meetings": meetings,
+            "sentiment_counts": {category: stats.get(category, 0) for category in ("positive", "neutral", "negative")},
+            "average_sentiment": stats["polarity_sum"] / stats["polarity_count"] if stats.get("polarity_count") else 0.0,
+            "average_engagement": stats["engagement_sum"] / stats["engagement_count"] if stats.get("engagement_count") else 0.0,
+            "total_action_items": stats.get("action_items", 0)
+        }
+    
+    def get_sentiment_data(self, client_name: Optional[str] = None) -> Dict:
         """Get sentiment analysis data for visualization"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT sentiment_category, COUNT(*) as count
-            FROM meetings
-            GROUP BY sentiment_category
-        """)
-        rows = cursor.fetchall()
-        
-        sentiment_counts = {row["sentiment_category"]: row["count"] for row in rows}
+        sentiment_counts = self.get_meeting_stats(client_name)["sentiment_counts"]
         total = sum(sentiment_counts.values())
         
         if total == 0:
             return {"positive": 0, "neutral": 0, "negative": 0}
         
         return {
-            "positive": round((sentiment_counts.get("positive", 0) / total) * 100, 1),
-            "neutral": round((sentiment_counts.get("neutral", 0) / total) * 100, 1),
-            "negative": round((sentiment_counts.get("negative", 0) / total) * 100, 1)
+            "positive": round((sentiment_counts["positive"] / total) * 100, 1),
+            "neutral": round((sentiment_counts["neutral"] / total) * 100, 1),
+            "negative": round((sentiment_counts["negative"] / total) * 100, 1)
         }
     
-    def search_knowledge_base(self, query: str, tags: Optional[List[str]] = None) -> List[Dict]:
-        """Search knowledge base by query and tags"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Search in insights table
-        sql = "SELECT * FROM insights WHERE content LIKE ?"
-        params = [f"%{query}%"]
-        
-        if tags:
-            tag_conditions = " OR ".join(["tags LIKE ?" for _ in tags])
-            sql += f" AND ({tag_conditions})"
-            params.extend([f"%{tag}%" for tag in tags])
-        
-        cursor.execute(sql, params)
-        results = [dict(row) for row in cursor.fetchall()]
-        
-        # Also search in meetings
-        sql = "SELECT * FROM meetings WHERE transcript LIKE ?"
-        params = [f"%{query}%"]
+    def _build_fts_query(self, query: str) -> Optional[str]:
+        """Turn free text into an FTS5 query of quoted terms (implicit AND, porter-stemmed by the index)"""
+        terms = re.findall(r"\w+", query.lower())
+        if not terms:
+            return None
+        return " ".join(f'"{term}"' for term in terms)
+    
+    def _tag_filter(self, tags: Optional[List[str]]) -> tuple:
+        """SQL fragment restricting insights to any of the given tags via the insight_tags index"""
+        tags = split_tags(tags)
+        if not tags:
+            return "", []
+        placeholders = ", ".join("?" for _ in tags)
+        return f" AND insights.id IN (SELECT insight_id FROM insight_tags WHERE tag IN ({placeholders}))", tags
+    
+    def search_knowledge_base(self, query: str, tags: Optional[List[str]] = None,
+                              limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Search knowledge base by query and tags, ranked by BM25 with highlighted snippets"""
+        fts_query = self._build_fts_query(query)
+        if not self.fts_enabled or fts_query is None:
+            return self._search_knowledge_base_like(query, tags, limit, offset)
+        
+        tag_filter, tag_params = self._tag_filter(tags)
+        
+        with self.reader() as conn:
+            insight_rows = conn.execute(f"""
+                SELECT insights.*,
+                       snippet(insights_fts, 0, '<mark>', '</mark>', '...', 16) AS snippet,
+                       bm25(insights_fts, 1.0, 0.5) AS score
+                FROM insights_fts
+                JOIN insights ON insights.id = insights_fts.rowid
+                WHERE insights_fts MATCH ?{tag_filter}
+                ORDER BY score
+                LIMIT ? OFFSET ?
+            """, [f"content : ({fts_query})"] + tag_params + [limit, offset]).fetchall()
+            
+            meeting_rows = conn.execute("""
+                SELECT meetings.*,
+                       snippet(meetings_fts, 0, '<mark>', '</mark>', '...', 24) AS snippet,
+                       bm25(meetings_fts) AS score
+                FROM meetings_fts
+                JOIN meetings ON meetings.id = meetings_fts.rowid
+                WHERE meetings_fts MATCH ?
+                ORDER BY score
+                LIMIT ? OFFSET ?
+            """, (fts_query, limit, offset)).fetchall()
         
-        cursor.execute(sql, params)
-        meeting_results = [dict(row) for row in cursor.fetchall()]
+        return {
+            "insights": [dict(row) for row in insight_rows],
+            "meetings": [dict(row) for row in meeting_rows],
+            "limit": limit,
+            "offset": offset
+        }
+    
+    def _search_knowledge_base_like(self, query: str, tags: Optional[List[str]] = None,
+                                    limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Substring search with LIKE scans, used when FTS5 is unavailable"""
+        with self.reader() as conn:
+            cursor = conn.cursor()
+            
+            # Search in insights table
+            tag_filter, tag_params = self._tag_filter(tags)
+            cursor.execute(
+                f"SELECT * FROM insights WHERE content LIKE ?{tag_filter} ORDER BY id DESC LIMIT ? OFFSET ?",
+                [f"%{query}%"] + tag_params + [limit, offset]
+            )
+            results = [dict(row) for row in cursor.fetchall()]
+            
+            # Also search in meetings
+            cursor.execute(
+                "SELECT * FROM meetings WHERE transcript LIKE ? ORDER BY id DESC LIMIT ? OFFSET ?",
+                (f"%{query}%", limit, offset)
+            )
+            meeting_results = [dict(row) for row in cursor.fetchall()]
         
         return {
             "insights": results,
-            "meetings": meeting_results
+            "meetings": meeting_results,
+            "limit": limit,
+            "offset": offset
         }
     
     def store_validation(self, output_id: int, relevant: bool, feedback: Optional[str] = None):
         """Store user validation feedback"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO validations (output_id, relevant, feedback)
-            VALUES (?, ?, ?)
-        """, (output_id, relevant, feedback))
+        with self.writer() as conn:
+            conn.execute("""
+                INSERT INTO validations (output_id, relevant, feedback)
+                VALUES (?, ?, ?)
+            """, (output_id, relevant, feedback))
         
-        conn.commit()
         logger.info(f"Validation stored for output {output_id}")
\ No newline at end of file
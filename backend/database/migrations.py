@@ -0,0 +1,369 @@
+import json
+import sqlite3
+import logging
+from typing import Any, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+def _add_secondary_indexes(conn: sqlite3.Connection):
+    """Indexes for the hot lookups on client_name, insight_type and created_at"""
+    statements = [
+        "CREATE INDEX IF NOT EXISTS idx_use_cases_client ON use_cases(client_name)",
+        "CREATE INDEX IF NOT EXISTS idx_profiles_client_name ON profiles(client_name)",
+        "CREATE INDEX IF NOT EXISTS idx_profiles_created_at ON profiles(created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_insights_type_created ON insights(insight_type, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_insights_client_type ON insights(client_name, insight_type, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_meetings_client_created ON meetings(client_name, created_at)",
+        # Covers the sentiment GROUP BY without touching the (large) transcript rows
+        "CREATE INDEX IF NOT EXISTS idx_meetings_sentiment ON meetings(sentiment_category, sentiment_score)",
+        "CREATE INDEX IF NOT EXISTS idx_validations_output ON validations(output_id)",
+        "CREATE INDEX IF NOT EXISTS idx_setup_sessions_created ON setup_sessions(created_at)"
+    ]
+    for statement in statements:
+        conn.execute(statement)
+
+def split_tags(tags) -> List[str]:
+    """Split a comma-joined tag string (or list) into clean, de-duplicated tags"""
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        tags = tags.split(",")
+    seen = {}
+    for tag in tags:
+        tag = str(tag).strip()
+        if tag and tag.lower() not in seen:
+            seen[tag.lower()] = tag
+    return list(seen.values())
+
+def _normalize_insight_tags(conn: sqlite3.Connection):
+    """Move comma-joined insights.tags into an indexed insight_tags join table"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS insight_tags (
+            tag TEXT NOT NULL COLLATE NOCASE,
+            insight_id INTEGER NOT NULL,
+            PRIMARY KEY (tag, insight_id)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_insight_tags_insight ON insight_tags(insight_id)")
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS insight_tags_ad AFTER DELETE ON insights BEGIN
+            DELETE FROM insight_tags WHERE insight_id = old.id;
+        END
+    """)
+
+    rows = conn.execute("SELECT id, tags FROM insights WHERE tags IS NOT NULL AND tags != ''").fetchall()
+    conn.executemany(
+        "INSERT OR IGNORE INTO insight_tags (tag, insight_id) VALUES (?, ?)",
+        [(tag, row[0]) for row in rows for tag in split_tags(row[1])]
+    )
+
+def _profile_dict(profile_data: str) -> Dict[str, Any]:
+    """Profile JSON as a dict, or {} for unparseable or non-object data"""
+    try:
+        data = json.loads(profile_data)
+    except (TypeError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _add_client_key(conn: sqlite3.Connection):
+    """Case-insensitive unique client key on profiles, merging any duplicates into the newest row"""
+    conn.execute(
+        "ALTER TABLE profiles ADD COLUMN client_key TEXT "
+        "GENERATED ALWAYS AS (lower(trim(client_name))) VIRTUAL"
+    )
+    rows = conn.execute("""
+        SELECT id, client_name, client_key, profile_data FROM profiles
+        WHERE client_key IN (SELECT client_key FROM profiles GROUP BY client_key HAVING COUNT(*) > 1)
+        ORDER BY client_key, updated_at DESC, id DESC
+    """).fetchall()
+    duplicates: Dict[str, list] = {}
+    for row in rows:
+        duplicates.setdefault(row[2], []).append(row)
+    for (kept_id, kept_name, _, kept_data), *older in duplicates.values():
+        # The newest profile wins; fields only present in older duplicates are carried over
+        merged = _profile_dict(kept_data)
+        for _, _, _, data in older:
+            for field, value in _profile_dict(data).items():
+                merged.setdefault(field, value)
+        if merged != _profile_dict(kept_data):
+            conn.execute("UPDATE profiles SET profile_data = ? WHERE id = ?", (json.dumps(merged), kept_id))
+        removed = [f"{name!r} (id {row_id})" for row_id, name, _, _ in older]
+        conn.execute(
+            f"DELETE FROM profiles WHERE id IN ({', '.join('?' * len(older))})",
+            [row_id for row_id, _, _, _ in older]
+        )
+        logger.warning(
+            f"Merged duplicate client profiles {', '.join(removed)} into {kept_name!r} (id {kept_id}) and removed them"
+        )
+    conn.execute("DROP INDEX IF EXISTS idx_profiles_client_name")
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_profiles_client_key ON profiles(client_key)")
+
+# JSON array of a profile's regions: "regions" as a list (or single string), else the
+# legacy comma-separated "region" string rewritten into a JSON array
+PROFILE_REGIONS_JSON = """
+    CASE json_type({row}.profile_data, '$.regions')
+        WHEN 'array' THEN json_extract({row}.profile_data, '$.regions')
+        WHEN 'text' THEN json_array(json_extract({row}.profile_data, '$.regions'))
+        ELSE CASE json_type({row}.profile_data, '$.region')
+            WHEN 'text' THEN '["' || replace(replace(replace(
+                json_extract({row}.profile_data, '$.region'), '\\', '\\\\'), '"', '\\"'), ',', '","') || '"]'
+            ELSE '[]'
+        END
+    END
+"""
+
+def _insert_profile_regions(row: str) -> str:
+    return f"""
+        INSERT OR IGNORE INTO profile_regions (region, profile_id)
+        SELECT trim(value), {row}.id FROM json_each({PROFILE_REGIONS_JSON.format(row=row)})
+        WHERE trim(value) != ''
+    """
+
+def _add_profile_field_columns(conn: sqlite3.Connection):
+    """Generated columns and a regions table over profile_data for filtering in SQL"""
+    conn.execute(
+        "ALTER TABLE profiles ADD COLUMN industry TEXT COLLATE NOCASE "
+        "GENERATED ALWAYS AS (trim(json_extract(profile_data, '$.industry'))) VIRTUAL"
+    )
+    conn.execute(
+        "ALTER TABLE profiles ADD COLUMN completeness_score REAL "
+        "GENERATED ALWAYS AS (json_extract(profile_data, '$.completeness_score')) VIRTUAL"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_profiles_industry ON profiles(industry)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_profiles_completeness ON profiles(completeness_score)")
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS profile_regions (
+            region TEXT NOT NULL COLLATE NOCASE,
+            profile_id INTEGER NOT NULL,
+            PRIMARY KEY (region, profile_id)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_profile_regions_profile ON profile_regions(profile_id)")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS profile_regions_ai AFTER INSERT ON profiles BEGIN
+            {_insert_profile_regions("new")};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS profile_regions_au AFTER UPDATE OF profile_data ON profiles BEGIN
+            DELETE FROM profile_regions WHERE profile_id = old.id;
+            {_insert_profile_regions("new")};
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS profile_regions_ad AFTER DELETE ON profiles BEGIN
+            DELETE FROM profile_regions WHERE profile_id = old.id;
+        END
+    """)
+    # Backfill existing profiles
+    conn.execute(f"""
+        INSERT OR IGNORE INTO profile_regions (region, profile_id)
+        SELECT trim(regions.value), profiles.id
+        FROM profiles, json_each({PROFILE_REGIONS_JSON.format(row="profiles")}) AS regions
+        WHERE trim(regions.value) != ''
+    """)
+
+# Numeric "engagement" from a meeting's engagement_metrics, as a 0-1 fraction (percentages are scaled down)
+MEETING_ENGAGEMENT = """
+    CASE WHEN json_valid({row}.engagement_metrics)
+              AND json_type({row}.engagement_metrics, '$.engagement') IN ('integer', 'real')
+        THEN CASE WHEN json_extract({row}.engagement_metrics, '$.engagement') > 1
+            THEN json_extract({row}.engagement_metrics, '$.engagement') / 100.0
+            ELSE json_extract({row}.engagement_metrics, '$.engagement')
+        END
+    END
+"""
+
+MEETING_ACTION_ITEMS = "CASE WHEN json_valid({row}.action_items) THEN json_array_length({row}.action_items) END"
+
+# Adds (sign=1) or removes (sign=-1) one meeting row from its client's and the global ('*') aggregates
+MEETING_STATS_DELTA = """
+    INSERT INTO meeting_stats (
+        scope, meetings, positive, neutral, negative, polarity_sum, polarity_count,
+        engagement_sum, engagement_count, action_items
+    )
+    SELECT scopes.scope, {sign}, {sign} * ({row}.sentiment_category IS 'positive'),
+           {sign} * ({row}.sentiment_category IS 'neutral'), {sign} * ({row}.sentiment_category IS 'negative'),
+           {sign} * coalesce({row}.sentiment_score, 0), {sign} * ({row}.sentiment_score IS NOT NULL),
+           {sign} * coalesce(delta.engagement, 0), {sign} * (delta.engagement IS NOT NULL),
+           {sign} * coalesce({action_items}, 0)
+    FROM (SELECT lower(trim({row}.client_name)) AS scope UNION ALL SELECT '*') AS scopes,
+         (SELECT {engagement} AS engagement) AS delta
+    WHERE true
+    ON CONFLICT(scope) DO UPDATE SET
+        meetings = meetings + excluded.meetings,
+        positive = positive + excluded.positive,
+        neutral = neutral + excluded.neutral,
+        negative = negative + excluded.negative,
+        polarity_sum = polarity_sum + excluded.polarity_sum,
+        polarity_count = polarity_count + excluded.polarity_count,
+        engagement_sum = engagement_sum + excluded.engagement_sum,
+        engagement_count = engagement_count + excluded.engagement_count,
+        action_items = action_items + excluded.action_items
+"""
+
+def _meeting_stats_delta(row: str, sign: int) -> str:
+    return MEETING_STATS_DELTA.format(
+        row=row, sign=sign,
+        engagement=MEETING_ENGAGEMENT.format(row=row),
+        action_items=MEETING_ACTION_ITEMS.format(row=row)
+    )
+
+def _add_meeting_stats(conn: sqlite3.Connection):
+    """Sentiment and engagement aggregates per client and overall, maintained by triggers on meetings"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS meeting_stats (
+            scope TEXT PRIMARY KEY,
+            meetings INTEGER NOT NULL DEFAULT 0,
+            positive INTEGER NOT NULL DEFAULT 0,
+            neutral INTEGER NOT NULL DEFAULT 0,
+            negative INTEGER NOT NULL DEFAULT 0,
+            polarity_sum REAL NOT NULL DEFAULT 0,
+            polarity_count INTEGER NOT NULL DEFAULT 0,
+            engagement_sum REAL NOT NULL DEFAULT 0,
+            engagement_count INTEGER NOT NULL DEFAULT 0,
+            action_items INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS meeting_stats_ai AFTER INSERT ON meetings BEGIN
+            {_meeting_stats_delta("new", 1)};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS meeting_stats_ad AFTER DELETE ON meetings BEGIN
+            {_meeting_stats_delta("old", -1)};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS meeting_stats_au AFTER UPDATE OF
+            client_name, sentiment_score, sentiment_category, engagement_metrics, action_items ON meetings
+        BEGIN
+            {_meeting_stats_delta("old", -1)};
+            {_meeting_stats_delta("new", 1)};
+        END
+    """)
+
+    # Backfill from existing meetings, each counted once for its client and once globally
+    conn.execute(f"""
+        INSERT OR REPLACE INTO meeting_stats
+        SELECT scope, COUNT(*),
+               CAST(TOTAL(sentiment_category = 'positive') AS INTEGER),
+               CAST(TOTAL(sentiment_category = 'neutral') AS INTEGER),
+               CAST(TOTAL(sentiment_category = 'negative') AS INTEGER),
+               TOTAL(sentiment_score), COUNT(sentiment_score),
+               TOTAL(engagement), COUNT(engagement), CAST(TOTAL(action_items) AS INTEGER)
+        FROM (
+            SELECT CASE scopes.overall WHEN 1 THEN '*' ELSE lower(trim(meetings.client_name)) END AS scope,
+                   meetings.sentiment_category, meetings.sentiment_score,
+                   {MEETING_ENGAGEMENT.format(row="meetings")} AS engagement,
+                   {MEETING_ACTION_ITEMS.format(row="meetings")} AS action_items
+            FROM meetings, (SELECT 0 AS overall UNION ALL SELECT 1) AS scopes
+        )
+        GROUP BY scope
+    """)
+
+def _add_workflow_runs(conn: sqlite3.Connection):
+    """Finished workflows: a compact record for status/listing, full results kept apart for on-demand reads"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS workflow_runs (
+            workflow_id TEXT PRIMARY KEY,
+            client_name TEXT,
+            client_key TEXT GENERATED ALWAYS AS (lower(trim(client_name))) VIRTUAL,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            finished_at TEXT,
+            record TEXT NOT NULL,
+            results TEXT
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_workflow_runs_client ON workflow_runs(client_key, created_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_workflow_runs_status ON workflow_runs(status)")
+
+def _index_workflow_runs_by_id(conn: sqlite3.Connection):
+    """Workflow ids are time-ordered, so listings page on workflow_id within a status or client"""
+    conn.execute("DROP INDEX IF EXISTS idx_workflow_runs_client")
+    conn.execute("DROP INDEX IF EXISTS idx_workflow_runs_status")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_workflow_runs_client ON workflow_runs(client_key, workflow_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_workflow_runs_status ON workflow_runs(status, workflow_id)")
+
+def _add_stage_cache(conn: sqlite3.Connection):
+    """Persistent tier of the content-addressed agent stage cache"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS stage_cache (
+            cache_key TEXT PRIMARY KEY,
+            stage TEXT NOT NULL,
+            result TEXT NOT NULL,
+            created_at REAL NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_stage_cache_stage ON stage_cache(stage)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_stage_cache_created_at ON stage_cache(created_at)")
+
+def _add_workflow_checkpoints(conn: sqlite3.Connection):
+    """Per-stage results of unfinished workflows, so a failed workflow can resume where it stopped"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS workflow_checkpoints (
+            workflow_id TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            result TEXT NOT NULL,
+            completed_at TEXT NOT NULL,
+            PRIMARY KEY (workflow_id, stage)
+        ) WITHOUT ROWID
+    """)
+
+def _add_insight_tags_update_trigger(conn: sqlite3.Connection):
+    """Re-derive insight_tags when insights.tags is updated in place (inserts add tags in Python)"""
+    tags_json = """'["' || replace(replace(replace(new.tags, '\\', '\\\\'), '"', '\\"'), ',', '","') || '"]'"""
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS insight_tags_au AFTER UPDATE OF tags ON insights BEGIN
+            DELETE FROM insight_tags WHERE insight_id = old.id;
+            INSERT OR IGNORE INTO insight_tags (tag, insight_id)
+            SELECT trim(value), new.id FROM json_each({tags_json})
+            WHERE trim(value) != '';
+        END
+    """)
+
+# (version, description, apply) - append new migrations, never edit applied ones
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "Secondary indexes on client_name, insight_type and created_at", _add_secondary_indexes),
+    (2, "Normalized insight_tags table", _normalize_insight_tags),
+    (3, "Unique case-insensitive client key on profiles", _add_client_key),
+    (4, "Industry, completeness and region columns for profile filters", _add_profile_field_columns),
+    (5, "Trigger-maintained meeting sentiment and engagement aggregates", _add_meeting_stats),
+    (6, "Persistent workflow_runs table for finished workflows", _add_workflow_runs),
+    (7, "Workflow listing indexes ordered by workflow id", _index_workflow_runs_by_id),
+    (8, "Persistent stage_cache table for agent stage results", _add_stage_cache),
+    (9, "Per-stage workflow_checkpoints table for resumable workflows", _add_workflow_checkpoints),
+    (10, "Keep insight_tags in sync when insights.tags is updated", _add_insight_tags_update_trigger)
+]
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Get the schema version recorded in PRAGMA user_version"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def apply_migrations(conn: sqlite3.Connection) -> int:
+    """Apply pending migrations, each in its own transaction; returns the resulting schema version"""
+    if conn.in_transaction:
+        conn.commit()
+
+    version = get_schema_version(conn)
+    for target, description, apply in MIGRATIONS:
+        if target <= version:
+            continue
+
+        conn.execute("BEGIN")
+        try:
+            apply(conn)
+            conn.execute(f"PRAGMA user_version = {target}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            logger.error(f"Schema migration {target} ({description}) failed")
+            raise
+
+        version = target
+        logger.info(f"Applied schema migration {target}: {description}")
+
+    return version
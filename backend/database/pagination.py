@@ -0,0 +1,45 @@
+import base64
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+FIELD_NAME = re.compile(r"^\w+$")
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode a cursor into its sort key values; raises ValueError if it is malformed"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+def next_cursor(items: Sequence[Dict[str, Any]], limit: Optional[int],
+                key: Callable[[Dict[str, Any]], Sequence[Any]]) -> Optional[str]:
+    """Cursor for the page after items, or None when the page was not full"""
+    if not limit or len(items) < limit:
+        return None
+    return encode_cursor(*key(items[-1]))
+
+def parse_fields(fields: Union[str, Iterable[str], None],
+                 allowed: Optional[Iterable[str]] = None) -> Optional[List[str]]:
+    """Parse a fields= projection ("a,b" or a list); raises ValueError for unknown fields"""
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+
+    names = list(dict.fromkeys(f.strip() for f in fields if f.strip()))
+    allowed = set(allowed) if allowed is not None else None
+    invalid = [f for f in names if not FIELD_NAME.match(f) or (allowed is not None and f not in allowed)]
+    if invalid:
+        raise ValueError(f"Unknown fields: {', '.join(invalid)}")
+    return names or None
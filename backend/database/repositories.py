@@ -0,0 +1,212 @@
+import json
+import logging
+from typing import Dict, List, Optional, Tuple, Any
+from datetime import datetime
+
+from .pagination import decode_cursor, next_cursor, parse_fields
+
+logger = logging.getLogger(__name__)
+
+def _profile_document(fields: Optional[str]) -> Tuple[str, List[Any]]:
+    """SQL expression (and params) for a profile document, projected to fields when given"""
+    names = parse_fields(fields)
+    if not names:
+        return "profile_data", []
+    pairs = ", ".join("?, json_extract(profile_data, ?)" for _ in names)
+    params: List[Any] = []
+    for name in names:
+        params.extend([name, f"$.{name}"])
+    return f"json_object({pairs})", params
+
+class Repository:
+    """Base for repositories over a DatabaseManager"""
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+
+    @property
+    def aio(self):
+        """Awaitable versions of this repository's methods, run on the database executor"""
+        return self.db_manager.aio.bind(self)
+
+class ClientProfileRepository(Repository):
+    """Client profile data access on top of DatabaseManager's pooled connections"""
+
+    def list_profiles(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                      fields: Optional[str] = None) -> Dict[str, Any]:
+        """Get profile documents newest first as {"items", "next_cursor"}, keyset-paged on (created_at, id).
+
+        With fields, only those top-level keys are extracted from each document (in SQL).
+        """
+        document, params = _profile_document(fields)
+        sql = f"SELECT id, created_at, {document} AS document FROM profiles"
+        if cursor:
+            sql += " WHERE (created_at, id) < (?, ?)"
+            params.extend(decode_cursor(cursor, 2))
+        sql += " ORDER BY created_at DESC, id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self.db_manager.reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        # The cursor follows the last fetched row, so rows without a document don't end paging early
+        return {
+            "items": [json.loads(row["document"]) for row in rows if row["document"]],
+            "next_cursor": next_cursor(rows, limit, lambda row: (row["created_at"], row["id"]))
+        }
+
+    def get_profile(self, client_name: str) -> Optional[Dict[str, Any]]:
+        """Get the profile document for a client, or None"""
+        with self.db_manager.reader() as conn:
+            row = conn.execute(
+                "SELECT profile_data FROM profiles WHERE client_key = lower(trim(?))", (client_name,)
+            ).fetchone()
+
+        if row and row["profile_data"]:
+            return json.loads(row["profile_data"])
+        return None
+
+    def filter_profiles(self, industry: Optional[str] = None, region: Optional[str] = None,
+                        min_completeness: Optional[float] = None, max_completeness: Optional[float] = None,
+                        limit: int = 50) -> List[Dict[str, Any]]:
+        """Get projected profile fields matching the filters without decoding profile_data.
+
+        Completeness range queries are ordered most complete first, everything else newest first.
+        """
+        conditions = []
+        params: List[Any] = []
+        if industry:
+            conditions.append("industry = ?")
+            params.append(industry.strip())
+        if region:
+            conditions.append("id IN (SELECT profile_id FROM profile_regions WHERE region = ?)")
+            params.append(region.strip())
+        if min_completeness is not None:
+            conditions.append("completeness_score >= ?")
+            params.append(min_completeness)
+        if max_completeness is not None:
+            conditions.append("completeness_score <= ?")
+            params.append(max_completeness)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        if min_completeness is not None or max_completeness is not None:
+            order = "completeness_score DESC, id DESC"
+        else:
+            order = "id DESC"
+        with self.db_manager.reader() as conn:
+            rows = conn.execute(f"""
+                SELECT id, client_name, industry, completeness_score,
+                       json_extract(profile_data, '$.company_size') AS company_size,
+                       (SELECT json_group_array(region) FROM profile_regions
+                        WHERE profile_id = profiles.id) AS regions,
+                       updated_at
+                FROM profiles {where}
+                ORDER BY {order} LIMIT ?
+            """, (*params, limit)).fetchall()
+
+        profiles = []
+        for row in rows:
+            profile = dict(row)
+            profile["regions"] = json.loads(profile["regions"])
+            profiles.append(profile)
+        return profiles
+
+    def get_latest_setup(self) -> Optional[Dict[str, Any]]:
+        """Get the most recent conversational setup data, or None"""
+        with self.db_manager.reader() as conn:
+            row = conn.execute(
+                "SELECT setup_data FROM setup_sessions ORDER BY created_at DESC LIMIT 1"
+            ).fetchone()
+
+        if row and row["setup_data"]:
+            return json.loads(row["setup_data"])
+        return None
+
+    def save_profile(self, client_name: str, profile: Dict[str, Any]):
+        """Insert a profile document, or replace the existing one for the same client"""
+        self.db_manager.save_client_profile(client_name, profile)
+
+    def update_profile(self, client_name: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Merge changes into an existing profile; returns the updated document or None if missing"""
+        with self.db_manager.writer() as conn:
+            row = conn.execute(
+                "SELECT profile_data FROM profiles WHERE client_key = lower(trim(?))", (client_name,)
+            ).fetchone()
+            if not row:
+                return None
+
+            profile = json.loads(row["profile_data"])
+            profile.update(changes)
+            profile["updated_at"] = datetime.now().isoformat()
+
+            conn.execute(
+                "UPDATE profiles SET profile_data = ?, updated_at = ? WHERE client_key = lower(trim(?))",
+                (json.dumps(profile), profile["updated_at"], client_name)
+            )
+
+        return profile
+
+    def delete_profile(self, profile_id: str) -> bool:
+        """Delete a profile by row id; returns False if nothing was deleted"""
+        with self.db_manager.writer() as conn:
+            cursor = conn.execute("DELETE FROM profiles WHERE id = ?", (profile_id,))
+            return cursor.rowcount > 0
+
+class DashboardRepository(Repository):
+    """Read-side queries backing the dashboard endpoint"""
+
+    def get_dashboard_data(self, limit: Optional[int] = None, fields: Optional[str] = None,
+                           meeting_fields: Optional[str] = None, profiles_cursor: Optional[str] = None,
+                           meetings_cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get knowledge base data for the dashboard.
+
+        limit bounds each list to its newest rows; fields and meeting_fields project the
+        client profiles and meeting insights. profiles_cursor and meetings_cursor (the
+        returned next_cursor values) page those two lists. Totals are counted in SQL.
+        """
+        document, profile_params = _profile_document(fields)
+        limit_sql = " LIMIT ?" if limit else ""
+        limit_params = (limit,) if limit else ()
+        profile_where = ""
+        if profiles_cursor:
+            profile_where = " WHERE (created_at, id) < (?, ?)"
+            profile_params.extend(decode_cursor(profiles_cursor, 2))
+
+        with self.db_manager.reader() as conn:
+            profile_rows = conn.execute(
+                f"SELECT id, created_at, {document} AS document FROM profiles{profile_where} "
+                f"ORDER BY created_at DESC, id DESC{limit_sql}",
+                (*profile_params, *limit_params)
+            ).fetchall()
+            domain_rows = conn.execute(
+                "SELECT * FROM insights WHERE insight_type = 'domain_knowledge' "
+                f"ORDER BY created_at DESC, id DESC{limit_sql}", limit_params
+            ).fetchall()
+            recommendation_rows = conn.execute(
+                "SELECT * FROM insights WHERE insight_type = 'recommendations' "
+                f"ORDER BY created_at DESC, id DESC{limit_sql}", limit_params
+            ).fetchall()
+            industry_rows = conn.execute(
+                "SELECT lower(industry) AS industry, COUNT(*) AS count FROM profiles GROUP BY profiles.industry"
+            ).fetchall()
+            insights_count = conn.execute("SELECT COUNT(*) FROM insights").fetchone()[0]
+
+        meeting_stats = self.db_manager.get_meeting_stats()
+        meeting_insights = self.db_manager.get_meeting_insights(limit=limit, cursor=meetings_cursor, fields=meeting_fields)
+
+        return {
+            "client_profiles": [json.loads(row["document"]) for row in profile_rows if row["document"]],
+            "domain_knowledge": [dict(row) for row in domain_rows],
+            "meeting_insights": meeting_insights,
+            "recommendations": [dict(row) for row in recommendation_rows],
+            "insights_count": insights_count,
+            "profiles_count": sum(row["count"] for row in industry_rows),
+            "industry_counts": {row["industry"] or "unknown": row["count"] for row in industry_rows},
+            "meeting_stats": meeting_stats,
+            "next_cursor": {
+                "client_profiles": next_cursor(profile_rows, limit, lambda row: (row["created_at"], row["id"])),
+                "meeting_insights": next_cursor(meeting_insights, limit, lambda row: (row["id"],))
+            }
+        }
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Keys that vary between otherwise identical results and must not affect a cache key
+VOLATILE_KEYS = frozenset({
+    "execution_time", "generated_at", "analysis_timestamp", "last_updated", "created_at", "updated_at", "cached"
+})
+
+def normalize_inputs(value: Any) -> Any:
+    """Canonical form of stage inputs: volatile keys dropped, dict keys sorted, whitespace collapsed"""
+    if isinstance(value, dict):
+        return {str(key): normalize_inputs(value[key]) for key in sorted(value, key=str) if key not in VOLATILE_KEYS}
+    if isinstance(value, (list, tuple)):
+        return [normalize_inputs(item) for item in value]
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+def stage_cache_key(stage: str, version: str, inputs: Dict[str, Any]) -> str:
+    """Content address of a stage result: hash of the stage, agent version and normalized inputs"""
+    payload = json.dumps([stage, version, normalize_inputs(inputs)], sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class StageCache:
+    """Content-addressed cache of deterministic agent stage results.
+
+    Entries live in an in-memory LRU (max_entries, stored as JSON so every hit is a
+    fresh copy) over an optional SQLite tier (the stage_cache table) when a
+    db_manager is given. Entries expire after ttl seconds. Since the key covers every
+    input a stage reads, changed inputs simply miss; invalidate() drops entries
+    outright, e.g. after an agent's knowledge base is edited in place.
+    """
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, db_manager=None, max_entries: int = 512, ttl: float = 86400.0):
+        self.db_manager = db_manager
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[str, float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+        self._disk_hits: Counter = Counter()
+        self._writes = 0
+
+    async def get_or_compute(self, stage: str, key: str,
+                             compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Cached result for key (marked "cached": True), else compute it and cache it if it succeeded"""
+        result = self._get_memory(key)
+        if result is None and self.db_manager is not None:
+            result = await self.db_manager.aio.run(self._get_disk, stage, key)
+            if result is not None:
+                self._disk_hits[stage] += 1
+        if result is not None:
+            self._hits[stage] += 1
+            result["cached"] = True
+            return result
+
+        self._misses[stage] += 1
+        result = await compute()
+        if result.get("status") == "success":
+            document = json.dumps(result, default=str)
+            self._put_memory(stage, key, document, time.time())
+            if self.db_manager is not None:
+                await self.db_manager.aio.run(self._put_disk, stage, key, document)
+        return result
+
+    def invalidate(self, stage: Optional[str] = None) -> int:
+        """Drop cached results of one stage (or all stages); returns the number of memory entries removed"""
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if stage is None or entry[0] == stage]
+            for key in keys:
+                del self._entries[key]
+        if self.db_manager is not None:
+            with self.db_manager.writer() as conn:
+                if stage is None:
+                    conn.execute("DELETE FROM stage_cache")
+                else:
+                    conn.execute("DELETE FROM stage_cache WHERE stage = ?", (stage,))
+        logger.info(f"Stage cache invalidated for {stage or 'all stages'}")
+        return len(keys)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get hit rate per stage and memory-tier size"""
+        stages = {}
+        for stage in sorted(set(self._hits) | set(self._misses)):
+            lookups = self._hits[stage] + self._misses[stage]
+            stages[stage] = {
+                "hits": self._hits[stage],
+                "disk_hits": self._disk_hits[stage],
+                "misses": self._misses[stage],
+                "hit_rate": round(self._hits[stage] / lookups, 3) if lookups else 0.0
+            }
+        with self._lock:
+            cached = len(self._entries)
+        return {
+            "stages": stages,
+            "entries": cached,
+            "max_entries": self.max_entries,
+            "persistent": self.db_manager is not None
+        }
+
+    def _get_memory(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            _, created_at, document = entry
+            if time.time() - created_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return json.loads(document)
+
+    def _put_memory(self, stage: str, key: str, document: str, created_at: float):
+        with self._lock:
+            self._entries[key] = (stage, created_at, document)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_disk(self, stage: str, key: str) -> Optional[Dict[str, Any]]:
+        with self.db_manager.reader() as conn:
+            row = conn.execute(
+                "SELECT result, created_at FROM stage_cache WHERE cache_key = ? AND created_at > ?",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+        if row is None:
+            return None
+        # Promote to the memory tier, keeping the original age so the TTL still applies
+        self._put_memory(stage, key, row["result"], row["created_at"])
+        return json.loads(row["result"])
+
+    def _put_disk(self, stage: str, key: str, document: str):
+        with self.db_manager.writer() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO stage_cache (cache_key, stage, result, created_at) VALUES (?, ?, ?, ?)",
+                (key, stage, document, time.time())
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                conn.execute("DELETE FROM stage_cache WHERE created_at <= ?", (time.time() - self.ttl,))
@@ -0,0 +1,372 @@
+import json
+import logging
+import secrets
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .pagination import decode_cursor, next_cursor
+from .repositories import Repository
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_STATUSES = ("queued", "running", "completed", "failed", "cancelled")
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+RESUMABLE_STATUSES = frozenset({"failed", "cancelled"})
+
+# Fields of each item in a workflow listing
+LISTING_FIELDS = ("status", "client_name", "queued_at", "start_time", "end_time",
+                  "current_step", "execution_time", "parallel_speedup", "error")
+
+# Parts of a workflow record that only finished-workflow readers of full results need
+SPILLED_FIELDS = ("client_data", "agent_results")
+
+CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+class MonotonicULID:
+    """ULID generator: 48-bit millisecond timestamp + 80 random bits in Crockford base32.
+
+    Ids sort by creation time. Within one millisecond (or if the clock steps back) the
+    random part is incremented instead of redrawn, so ids from this process are strictly
+    increasing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new(self) -> str:
+        with self._lock:
+            ms = time.time_ns() // 1_000_000
+            if ms > self._last_ms:
+                random = secrets.randbits(80)
+            else:
+                ms = self._last_ms
+                random = self._last_random + 1
+                if random >> 80:
+                    # Random part exhausted within one millisecond: move on to the next one
+                    ms, random = ms + 1, secrets.randbits(79)
+            self._last_ms, self._last_random = ms, random
+
+        value = (ms << 80) | random
+        return "".join(CROCKFORD_BASE32[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+def client_key(client_name: Any) -> str:
+    """Case- and whitespace-insensitive client identity, matching workflow_runs.client_key"""
+    return str(client_name or "").strip().lower()
+
+class WorkflowStore(Repository):
+    """Workflow state with a bounded memory footprint.
+
+    Queued and running workflows are held as live records that the orchestrator updates
+    in place. When a workflow finishes, its full record is written to workflow_runs and
+    memory keeps only a compact copy (no client_data or agent_results) in an LRU of at
+    most max_cached entries, each dropped after ttl seconds. Finished workflows that are
+    no longer cached are read back from SQLite, so they also survive a restart.
+
+    Workflow ids are time-ordered ULIDs. A client -> workflow ids index and per-status
+    counts are kept in memory (loaded from workflow_runs on first use), so the latest
+    workflow of a client and the status counts are answered without a scan. Status
+    changes must go through update() to keep the counts right.
+
+    Each stage result is checkpointed to workflow_checkpoints as it succeeds. A failed or
+    cancelled workflow can be reopened and re-run from its checkpoints; they are deleted
+    once the workflow completes.
+    """
+
+    def __init__(self, db_manager, max_cached: int = 1000, ttl: float = 3600.0):
+        super().__init__(db_manager)
+        self.max_cached = max_cached
+        self.ttl = ttl
+        self._active: Dict[str, Dict[str, Any]] = {}
+        self._cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # The store is used from the event loop and from database executor threads
+        self._lock = threading.Lock()
+        self._metrics = {"cache_hits": 0, "cache_misses": 0, "evictions": 0, "spilled": 0}
+        self._ids = MonotonicULID()
+        # client_key -> workflow ids, oldest first; ids are only ever appended
+        self._client_index: Dict[str, List[str]] = {}
+        self._status_counts: Counter = Counter()
+        self._index_loaded = False
+
+    def new_id(self) -> str:
+        """New unique, time-sortable workflow id"""
+        return f"workflow_{self._ids.new()}"
+
+    def load_index(self):
+        """Build the client index and status counts from workflow_runs (once, e.g. at startup)"""
+        if self._index_loaded:
+            return
+        with self.db_manager.reader() as conn:
+            rows = conn.execute(
+                "SELECT client_key, workflow_id, status FROM workflow_runs ORDER BY created_at, workflow_id"
+            ).fetchall()
+
+        with self._lock:
+            if self._index_loaded:
+                return
+            client_index: Dict[str, List[str]] = {}
+            status_counts: Counter = Counter()
+            for row in rows:
+                client_index.setdefault(row["client_key"] or "", []).append(row["workflow_id"])
+                status_counts[row["status"]] += 1
+            # Workflows added before the index was loaded are newer than anything on disk
+            for workflow_id, record in self._active.items():
+                client_index.setdefault(client_key(record.get("client_data", {}).get("client_name")), []).append(workflow_id)
+                status_counts[record.get("status")] += 1
+            self._client_index, self._status_counts = client_index, status_counts
+            self._index_loaded = True
+        logger.info(f"Workflow index loaded: {len(rows)} finished workflows for {len(self._client_index)} clients")
+
+    def add(self, workflow_id: str, record: Dict[str, Any]):
+        """Register the live record of a new workflow"""
+        self.load_index()
+        with self._lock:
+            self._active[workflow_id] = record
+            self._client_index.setdefault(client_key(record.get("client_data", {}).get("client_name")), []).append(workflow_id)
+            self._status_counts[record.get("status")] += 1
+
+    def update(self, workflow_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a state transition to an active workflow, keeping the status counts current"""
+        with self._lock:
+            record = self._active[workflow_id]
+            previous = record.get("status")
+            record.update(fields)
+            if record.get("status") != previous:
+                self._status_counts[previous] -= 1
+                self._status_counts[record.get("status")] += 1
+        return record
+
+    def reopen(self, workflow_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a failed or cancelled workflow active again with fields applied.
+
+        Raises KeyError for an unknown workflow and ValueError if it is active, completed
+        or its full results were never persisted.
+        """
+        record = self.get(workflow_id)
+        if record is None:
+            raise KeyError(workflow_id)
+        if record.get("status") not in RESUMABLE_STATUSES:
+            raise ValueError(f"Workflow {workflow_id} is {record.get('status')}; only failed or cancelled workflows can be resumed")
+        results = self.get_results(workflow_id)
+        if results is None:
+            raise ValueError(f"Workflow {workflow_id} cannot be resumed: its results were not persisted")
+
+        reopened = {key: value for key, value in record.items() if key not in ("client_name", "summary", "persisted")}
+        reopened.update(results)
+        reopened.update(fields)
+        with self._lock:
+            if workflow_id in self._active:
+                raise ValueError(f"Workflow {workflow_id} is already running")
+            self._cache.pop(workflow_id, None)
+            self._active[workflow_id] = reopened
+            self._status_counts[record.get("status")] -= 1
+            self._status_counts[reopened.get("status")] += 1
+        return reopened
+
+    def save_checkpoint(self, workflow_id: str, stage: str, result: Dict[str, Any]):
+        """Persist the result of a stage that succeeded"""
+        with self.db_manager.writer() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO workflow_checkpoints (workflow_id, stage, result, completed_at)
+                   VALUES (?, ?, ?, ?)""",
+                (workflow_id, stage, json.dumps(result, default=str), datetime.now().isoformat())
+            )
+
+    def get_checkpoints(self, workflow_id: str) -> Dict[str, Dict[str, Any]]:
+        """Checkpointed stage results of a workflow by stage name"""
+        with self.db_manager.reader() as conn:
+            rows = conn.execute(
+                "SELECT stage, result FROM workflow_checkpoints WHERE workflow_id = ?", (workflow_id,)
+            ).fetchall()
+        return {row["stage"]: json.loads(row["result"]) for row in rows}
+
+    def get_active(self, workflow_id: str) -> Dict[str, Any]:
+        """Live record of a queued or running workflow; raises KeyError otherwise"""
+        return self._active[workflow_id]
+
+    def get(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Live record of an active workflow or compact record of a finished one, None if unknown"""
+        with self._lock:
+            record = self._active.get(workflow_id)
+            if record is not None:
+                return record
+            record = self._get_cached(workflow_id)
+        if record is not None:
+            return record
+
+        with self.db_manager.reader() as conn:
+            row = conn.execute("SELECT record FROM workflow_runs WHERE workflow_id = ?", (workflow_id,)).fetchone()
+        if row is None:
+            return None
+        record = json.loads(row["record"])
+        with self._lock:
+            self._cache_record(workflow_id, record)
+        return record
+
+    def get_results(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """client_data and agent_results of a workflow (read from disk once it has finished)"""
+        record = self._active.get(workflow_id)
+        if record is not None:
+            return {field: record.get(field, {}) for field in SPILLED_FIELDS}
+
+        with self.db_manager.reader() as conn:
+            row = conn.execute("SELECT results FROM workflow_runs WHERE workflow_id = ?", (workflow_id,)).fetchone()
+        return json.loads(row["results"]) if row and row["results"] else None
+
+    def finish(self, workflow_id: str, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Persist a workflow that reached a terminal status and keep only its compact record in memory"""
+        record = self._active[workflow_id]
+        if record.get("status") not in TERMINAL_STATUSES:
+            raise ValueError(f"Workflow {workflow_id} is {record.get('status')}, not finished")
+
+        compact = {key: value for key, value in record.items() if key not in SPILLED_FIELDS}
+        compact["client_name"] = record.get("client_data", {}).get("client_name")
+        if summary is not None:
+            compact["summary"] = summary
+        results = {field: record.get(field, {}) for field in SPILLED_FIELDS}
+
+        try:
+            with self.db_manager.writer() as conn:
+                conn.execute(
+                    """INSERT OR REPLACE INTO workflow_runs
+                       (workflow_id, client_name, status, created_at, finished_at, record, results)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    (workflow_id, compact["client_name"], compact["status"],
+                     compact.get("queued_at") or compact.get("start_time"), compact.get("end_time"),
+                     json.dumps(compact, default=str), json.dumps(results, default=str))
+                )
+                if compact["status"] == "completed":
+                    # The full results now live in workflow_runs
+                    conn.execute("DELETE FROM workflow_checkpoints WHERE workflow_id = ?", (workflow_id,))
+            self._metrics["spilled"] += 1
+        except Exception as e:
+            # Keep serving the compact record from memory; only the full results are lost
+            logger.error(f"Failed to persist workflow {workflow_id}: {e}")
+            compact["persisted"] = False
+
+        with self._lock:
+            self._active.pop(workflow_id, None)
+            self._cache_record(workflow_id, compact)
+        return compact
+
+    def latest_for_client(self, client_name: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(workflow_id, record) of the most recently created workflow for a client"""
+        workflow_ids = self.get_client_workflow_ids(client_name, limit=1)
+        if not workflow_ids:
+            return None
+        record = self.get(workflow_ids[0])
+        return (workflow_ids[0], record) if record is not None else None
+
+    def get_client_workflow_ids(self, client_name: str, limit: Optional[int] = None) -> List[str]:
+        """Ids of a client's workflows, newest first"""
+        self.load_index()
+        with self._lock:
+            workflow_ids = self._client_index.get(client_key(client_name), [])
+            newest = workflow_ids[::-1] if limit is None else workflow_ids[:-limit - 1:-1]
+        return newest
+
+    def count_by_status(self) -> Dict[str, int]:
+        """Number of workflows in each status, active and finished"""
+        self.load_index()
+        with self._lock:
+            return {status: count for status, count in self._status_counts.items() if count}
+
+    def list_workflows(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                       status: Optional[str] = None, client_name: Optional[str] = None) -> Dict[str, Any]:
+        """Workflows newest first as {"items", "next_cursor"}, keyset-paged on workflow_id.
+
+        Active workflows come from memory and finished ones from workflow_runs; both are
+        optionally filtered by status and client. Raises ValueError for an unknown status.
+        """
+        if status is not None and status not in WORKFLOW_STATUSES:
+            raise ValueError(f"Unknown status: {status}")
+        before = decode_cursor(cursor, 1)[0] if cursor else None
+        key = client_key(client_name) if client_name else None
+
+        def matches(workflow_id: str, record: Dict[str, Any]) -> bool:
+            return ((before is None or workflow_id < before)
+                    and (status is None or record.get("status") == status)
+                    and (key is None or client_key(record.get("client_data", {}).get("client_name")) == key))
+
+        with self._lock:
+            active = [(workflow_id, record) for workflow_id, record in self._active.items() if matches(workflow_id, record)]
+
+        conditions, params = [], []
+        if before is not None:
+            conditions.append("workflow_id < ?")
+            params.append(before)
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if key is not None:
+            conditions.append("client_key = ?")
+            params.append(key)
+        sql = "SELECT workflow_id, record FROM workflow_runs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY workflow_id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        if status is None or status in TERMINAL_STATUSES:
+            with self.db_manager.reader() as conn:
+                finished = [(row["workflow_id"], json.loads(row["record"])) for row in conn.execute(sql, params)]
+        else:
+            finished = []
+
+        # A workflow can be in memory and on disk for a moment while it is being finished
+        merged = dict(finished)
+        merged.update(active)
+        workflows = sorted(merged.items(), reverse=True)[:limit or None]
+        items = [self._listing_item(workflow_id, record) for workflow_id, record in workflows]
+        return {
+            "items": items,
+            "next_cursor": next_cursor(items, limit, lambda item: (item["workflow_id"],))
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get memory-tier sizes and cache hit/miss counts"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics.update({"active": len(self._active), "cached": len(self._cache), "max_cached": self.max_cached})
+        return metrics
+
+    @staticmethod
+    def _listing_item(workflow_id: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        item = {"workflow_id": workflow_id}
+        item.update({field: record.get(field) for field in LISTING_FIELDS})
+        if item["client_name"] is None:
+            item["client_name"] = record.get("client_data", {}).get("client_name")
+        return item
+
+    def __contains__(self, workflow_id: str) -> bool:
+        return self.get(workflow_id) is not None
+
+    def _get_cached(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(workflow_id)
+        if entry is None:
+            self._metrics["cache_misses"] += 1
+            return None
+        cached_at, record = entry
+        if time.monotonic() - cached_at > self.ttl:
+            del self._cache[workflow_id]
+            self._metrics["evictions"] += 1
+            self._metrics["cache_misses"] += 1
+            return None
+        self._cache.move_to_end(workflow_id)
+        self._metrics["cache_hits"] += 1
+        return record
+
+    def _cache_record(self, workflow_id: str, record: Dict[str, Any]):
+        self._cache[workflow_id] = (time.monotonic(), record)
+        self._cache.move_to_end(workflow_id)
+        now = time.monotonic()
+        # Least recently used first; also drop expired entries at the cold end
+        while self._cache and (len(self._cache) > self.max_cached or now - next(iter(self._cache.values()))[0] > self.ttl):
+            self._cache.popitem(last=False)
+            self._metrics["evictions"] += 1
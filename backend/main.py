@@ -1,8 +1,9 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Depends, Query, Body
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from typing import Dict, List, Optional, Any
-import sqlite3
+import os
 import json
 import logging
 from datetime import datetime
@@ -13,8 +14,14 @@ from .agents.domain_knowledge import DomainKnowledgeAgent
 from .agents.client_profile import ClientProfileAgent
 from .agents.actionable_insights import ActionableInsightsAgent
 from .agents.meetings import MeetingsAgent
+from .agents.llm_cache import LLMResponseCache
 from .database.db_manager import DatabaseManager
+from .database.repositories import ClientProfileRepository, DashboardRepository
+from .database.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, next_cursor
+from .database.stage_cache import StageCache
 from .workflow_orchestrator import WorkflowOrchestrator
+from .resilience import StagePolicy
+from .workflow_queue import QueueFullError, WorkflowJobQueue
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,9 +38,58 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Batch workflow limits
+DEFAULT_BATCH_CONCURRENCY = int(os.getenv("KS_BATCH_CONCURRENCY", "4"))
+MAX_BATCH_CONCURRENCY = 32
+MAX_BATCH_SIZE = 1000
+
+# Background workflow queue
+WORKFLOW_WORKERS = int(os.getenv("KS_WORKFLOW_WORKERS", "4"))
+WORKFLOW_QUEUE_DEPTH = int(os.getenv("KS_WORKFLOW_QUEUE_DEPTH", "100"))
+WORKFLOW_RETRY_AFTER = 5
+
+# Content-addressed cache of deterministic workflow stage results
+STAGE_CACHE_SIZE = int(os.getenv("KS_STAGE_CACHE_SIZE", "512"))
+STAGE_CACHE_TTL = int(os.getenv("KS_STAGE_CACHE_TTL", "86400"))
+STAGE_CACHE_PERSIST = os.getenv("KS_STAGE_CACHE_PERSIST", "1") != "0"
+
+# Cache of prompt-independent LLM responses, such as the pool of conversation openings
+LLM_CACHE_SIZE = int(os.getenv("KS_LLM_CACHE_SIZE", "256"))
+LLM_CACHE_TTL = int(os.getenv("KS_LLM_CACHE_TTL", "3600"))
+OPENING_POOL_SIZE = int(os.getenv("KS_OPENING_POOL_SIZE", "4"))
+
+# Deadline, retries and circuit breaking for every workflow stage
+STAGE_POLICY = StagePolicy(
+    timeout=float(os.getenv("KS_STAGE_TIMEOUT", "120")),
+    retries=int(os.getenv("KS_STAGE_RETRIES", "2")),
+    backoff=float(os.getenv("KS_STAGE_BACKOFF", "0.5")),
+    failure_threshold=int(os.getenv("KS_BREAKER_THRESHOLD", "5")),
+    reset_timeout=float(os.getenv("KS_BREAKER_RESET_TIMEOUT", "30"))
+)
+
 # Initialize components
-db_manager = DatabaseManager("ks_onboarding.db")
-orchestrator = WorkflowOrchestrator(db_manager)
+DB_PATH = os.getenv("KS_DB_PATH", "ks_onboarding.db")
+DB_POOL_SIZE = int(os.getenv("KS_DB_POOL_SIZE", "4"))
+
+db_manager = DatabaseManager(DB_PATH, pool_size=DB_POOL_SIZE)
+stage_cache = StageCache(
+    db_manager if STAGE_CACHE_PERSIST else None,
+    max_entries=STAGE_CACHE_SIZE,
+    ttl=STAGE_CACHE_TTL
+)
+llm_cache = LLMResponseCache(max_entries=LLM_CACHE_SIZE, ttl=LLM_CACHE_TTL, responses_per_key=OPENING_POOL_SIZE)
+orchestrator = WorkflowOrchestrator(db_manager, stage_cache=stage_cache, stage_policy=STAGE_POLICY, llm_cache=llm_cache)
+workflow_queue = WorkflowJobQueue(orchestrator, workers=WORKFLOW_WORKERS, max_depth=WORKFLOW_QUEUE_DEPTH)
+profile_repository = ClientProfileRepository(db_manager)
+dashboard_repository = DashboardRepository(db_manager)
+
+def get_profile_repository() -> ClientProfileRepository:
+    """FastAPI dependency providing the shared client profile repository"""
+    return profile_repository
+
+def get_dashboard_repository() -> DashboardRepository:
+    """FastAPI dependency providing the shared dashboard repository"""
+    return dashboard_repository
 
 # Pydantic models
 class DirectSetupRequest(BaseModel):
@@ -50,9 +106,15 @@ class ValidationRequest(BaseModel):
 class WorkflowExecutionRequest(BaseModel):
     client_data: Dict[str, Any]
 
+class BatchWorkflowRequest(BaseModel):
+    clients: List[Dict[str, Any]] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+    concurrency: int = Field(DEFAULT_BATCH_CONCURRENCY, ge=1, le=MAX_BATCH_CONCURRENCY)
+
 class SearchRequest(BaseModel):
     query: str
     tags: Optional[List[str]] = None
+    limit: int = Field(20, ge=1, le=100)
+    offset: int = Field(0, ge=0)
 
 class ConversationRequest(BaseModel):
     message: str
@@ -71,20 +133,39 @@ class ConversationResponse(BaseModel):
 async def startup_event():
     """Initialize database and load use cases on startup"""
     logger.info("Initializing K-Square Programme Onboarding Agent...")
-    db_manager.initialize_database()
-    db_manager.load_use_cases()
+    await db_manager.aio.initialize_database()
+    await db_manager.aio.load_use_cases()
+    await orchestrator.workflow_store.aio.load_index()
+    workflow_queue.start()
+    # Generate the first opening messages in the background
+    orchestrator.natural_conversational_agent.refresh_openings()
     logger.info("System initialized successfully")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the workflow workers, cancelling anything still queued or running, and the opening refill"""
+    await workflow_queue.stop()
+    await orchestrator.natural_conversational_agent.stop_opening_refresh()
+
 @app.get("/")
 async def root():
     return {"message": "K-Square Programme Onboarding Agent API", "status": "running"}
 
 @app.get("/api/use-cases")
-async def get_use_cases():
+async def get_use_cases(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+):
     """Get available use cases for selection"""
     try:
-        use_cases = db_manager.get_use_cases()
-        return {"use_cases": use_cases}
+        use_cases = await db_manager.aio.get_use_cases(limit=limit, cursor=cursor, fields=fields)
+        return {
+            "use_cases": use_cases,
+            "next_cursor": next_cursor(use_cases, limit, lambda use_case: (use_case["id"],))
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching use cases: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch use cases")
@@ -136,6 +217,48 @@ async def send_message(request: ConversationRequest):
         logger.error(f"Error processing conversation message: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to process message: {str(e)}")
 
+@app.post("/api/conversation/message/stream")
+async def stream_message(request: ConversationRequest):
+    """Send a message and receive the reply as Server-Sent Events.
+    
+    "token" events carry reply text as it is generated; a final "done" event carries the
+    full reply, the extracted client_info and the time to first token ("error" on failure).
+    """
+    if not request.conversation_id:
+        raise HTTPException(status_code=400, detail="Conversation ID is required")
+    
+    async def events():
+        try:
+            async for event in orchestrator.natural_conversational_agent.stream_message(
+                request.conversation_id,
+                request.message
+            ):
+                name = event.pop("event")
+                yield f"event: {name}\ndata: {json.dumps(event, default=str)}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming conversation message: {e}")
+            yield f"event: error\ndata: {json.dumps({'message': f'Failed to process message: {str(e)}'})}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/api/metrics/conversation")
+async def get_conversation_metrics():
+    """Get time to first token of streamed conversation turns, LLM cache hit rate and LLM extraction calls saved"""
+    try:
+        agent = orchestrator.natural_conversational_agent
+        return {"status": "success", "data": {
+            **agent.get_stream_metrics(),
+            "llm_cache": agent.response_cache.get_metrics(),
+            "extraction": agent.get_extraction_metrics()
+        }}
+    except Exception as e:
+        logger.error(f"Error getting conversation metrics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get conversation metrics")
+
 @app.get("/api/conversation/{conversation_id}/status")
 async def get_conversation_status(conversation_id: str):
     """Get the current status of a conversation"""
@@ -161,7 +284,7 @@ async def get_conversation_status(conversation_id: str):
 async def validate_output(request: ValidationRequest):
     """Accept user validation for agent outputs"""
     try:
-        db_manager.store_validation(
+        await db_manager.aio.store_validation(
             output_id=request.output_id,
             relevant=request.relevant,
             feedback=request.feedback
@@ -173,55 +296,182 @@ async def validate_output(request: ValidationRequest):
         logger.error(f"Error storing validation: {e}")
         raise HTTPException(status_code=500, detail="Failed to store validation")
 
-@app.post("/api/execute-workflow")
+@app.post("/api/execute-workflow", status_code=202)
 async def execute_workflow(request: WorkflowExecutionRequest):
-    """Execute the full workflow for client onboarding"""
+    """Queue the full workflow for client onboarding; poll /api/workflow/{workflow_id}/status for progress"""
     try:
-        logger.info(f"Executing full workflow for client: {request.client_data.get('client_name', 'Unknown')}")
-        
-        start_time = datetime.now()
-        result = await orchestrator.execute_full_workflow(request.client_data)
-        execution_time = (datetime.now() - start_time).total_seconds()
-        
-        logger.info(f"Workflow completed in {execution_time:.2f} seconds")
+        workflow_id = workflow_queue.submit(request.client_data)
+        return {
+            "status": "success",
+            "message": "Workflow queued",
+            "workflow_id": workflow_id,
+            "queue_position": workflow_queue.get_position(workflow_id),
+            "status_url": f"/api/workflow/{workflow_id}/status"
+        }
+    except QueueFullError as e:
+        logger.warning(f"Rejecting workflow for client {request.client_data.get('client_name', 'Unknown')}: {e}")
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(WORKFLOW_RETRY_AFTER)})
+    except Exception as e:
+        logger.error(f"Error queueing workflow: {e}")
+        raise HTTPException(status_code=500, detail=f"Workflow submission failed: {str(e)}")
+
+@app.get("/api/workflows")
+async def list_workflows(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    client_name: Optional[str] = None
+):
+    """List workflows newest first, optionally filtered by status and client, keyset-paged"""
+    try:
+        page = await orchestrator.list_workflows(limit=limit, cursor=cursor, status=status, client_name=client_name)
+        return {"status": "success", "data": page["items"], "next_cursor": page["next_cursor"]}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error listing workflows: {e}")
+        raise HTTPException(status_code=500, detail="Failed to list workflows")
+
+@app.get("/api/workflow/{workflow_id}/status")
+async def get_workflow_status(workflow_id: str):
+    """Get a workflow's state and progress by current step"""
+    try:
+        status = await orchestrator.get_workflow_status(workflow_id)
+        if status["status"] != "success":
+            raise HTTPException(status_code=404, detail=status["message"])
         
+        status["progress"]["queue_position"] = workflow_queue.get_position(workflow_id)
+        return status
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting workflow status: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get workflow status")
+
+@app.get("/api/workflow/{workflow_id}/results")
+async def get_workflow_results(workflow_id: str):
+    """Get the full agent results of a workflow"""
+    try:
+        results = await orchestrator.get_workflow_results(workflow_id)
+        if results["status"] != "success":
+            raise HTTPException(status_code=404, detail=results["message"])
+        return results
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting workflow results: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get workflow results")
+
+@app.post("/api/workflow/{workflow_id}/cancel")
+async def cancel_workflow(workflow_id: str):
+    """Cancel a queued or running workflow"""
+    try:
+        status = await orchestrator.get_workflow_status(workflow_id)
+        if status["status"] != "success":
+            raise HTTPException(status_code=404, detail=status["message"])
+        if not await workflow_queue.cancel(workflow_id):
+            raise HTTPException(
+                status_code=409,
+                detail=f"Workflow is {status['workflow_state'].get('status')} and can no longer be cancelled"
+            )
+        
+        return {"status": "success", "message": "Workflow cancelled", "workflow_id": workflow_id}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error cancelling workflow: {e}")
+        raise HTTPException(status_code=500, detail="Failed to cancel workflow")
+
+@app.post("/api/workflow/{workflow_id}/resume", status_code=202)
+async def resume_workflow(workflow_id: str):
+    """Queue a failed or cancelled workflow to run again, skipping the stages it already finished"""
+    try:
+        await workflow_queue.resume(workflow_id)
         return {
             "status": "success",
-            "message": "Workflow executed successfully",
-            "result": result,
-            "execution_time": execution_time
+            "message": "Workflow queued to resume",
+            "workflow_id": workflow_id,
+            "queue_position": workflow_queue.get_position(workflow_id),
+            "status_url": f"/api/workflow/{workflow_id}/status"
         }
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Workflow {workflow_id} not found")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(WORKFLOW_RETRY_AFTER)})
     except Exception as e:
-        logger.error(f"Error executing workflow: {e}")
-        raise HTTPException(status_code=500, detail=f"Workflow execution failed: {str(e)}")
+        logger.error(f"Error resuming workflow: {e}")
+        raise HTTPException(status_code=500, detail="Failed to resume workflow")
+
+@app.post("/api/execute-workflow/batch")
+async def execute_workflow_batch(request: BatchWorkflowRequest):
+    """Execute the full workflow for many clients, streaming one NDJSON line per client as it completes.
+    
+    The last line is the batch report (type "report") with throughput and shared cache stats.
+    """
+    logger.info(f"Executing workflow batch for {len(request.clients)} clients (concurrency {request.concurrency})")
+    
+    async def stream_results():
+        try:
+            async for item in orchestrator.execute_workflow_batch(request.clients, request.concurrency):
+                if item["type"] == "report":
+                    logger.info(f"Workflow batch finished: {item['completed']}/{item['total_clients']} completed, "
+                                f"{item['throughput_per_second']} workflows/s")
+                yield json.dumps(item, default=str) + "\n"
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            logger.error(f"Error executing workflow batch: {e}")
+            yield json.dumps({"type": "error", "message": f"Batch execution failed: {str(e)}"}) + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+@app.get("/api/agents")
+async def list_agents():
+    """List the registered agents with their input schemas"""
+    return {"status": "success", "data": orchestrator.agents.describe()}
+
+@app.post("/api/agent/{agent_name}")
+async def execute_agent(agent_name: str, params: Dict[str, Any] = Body(default_factory=dict)):
+    """Run one registered agent on its own; params must match the agent's input schema"""
+    try:
+        entry = orchestrator.agents.get(agent_name)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown agent: {agent_name}")
+    
+    try:
+        result = await entry(**entry.validate(params))
+        if result.get("status") != "success":
+            raise HTTPException(status_code=500, detail=result.get("message", f"Agent {agent_name} failed"))
+        return result
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid input for agent {agent_name}: {e}")
+    except Exception as e:
+        logger.error(f"Error executing agent {agent_name}: {e}")
+        raise HTTPException(status_code=500, detail=f"Agent execution failed: {str(e)}")
 
 @app.get("/api/dashboard")
-async def get_dashboard_data():
+async def get_dashboard_data(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
+    meeting_fields: Optional[str] = None,
+    profiles_cursor: Optional[str] = None,
+    meetings_cursor: Optional[str] = None,
+    dashboard: DashboardRepository = Depends(get_dashboard_repository)
+):
     """Retrieve tagged data from Knowledge Base for dashboard display"""
     try:
-        # Get data from database
-        client_profiles = db_manager.get_client_profiles()
-        domain_knowledge = db_manager.get_domain_knowledge()
-        meeting_insights = db_manager.get_meeting_insights()
-        recommendations = db_manager.get_recommendations()
-        
-        # Get actual client profiles from the profiles table
-        conn = sqlite3.connect('ks_onboarding.db')
-        cursor = conn.cursor()
-        
-        # Get all profiles
-        cursor.execute("SELECT profile_data FROM profiles ORDER BY created_at DESC")
-        profile_results = cursor.fetchall()
-        
-        actual_profiles = []
-        for result in profile_results:
-            if result[0]:
-                profile_data = json.loads(result[0])
-                actual_profiles.append(profile_data)
-        
-        # Get insights count
-        cursor.execute("SELECT COUNT(*) FROM insights")
-        insights_count = cursor.fetchone()[0]
+        # Get data from database, each list bounded to its newest `limit` rows; the
+        # next_cursor values are passed back as profiles_cursor / meetings_cursor
+        kb_data = await dashboard.aio.get_dashboard_data(
+            limit=limit, fields=fields, meeting_fields=meeting_fields,
+            profiles_cursor=profiles_cursor, meetings_cursor=meetings_cursor
+        )
+        actual_profiles = kb_data["client_profiles"]
+        insights_count = kb_data["insights_count"]
+        profiles_count = kb_data["profiles_count"]
         
         # Get meetings data (using our mock data)
         meetings_data = [
@@ -245,28 +495,33 @@ async def get_dashboard_data():
             }
         ]
         
-        conn.close()
-        
         # Structure data for frontend
         dashboard_data = {
             "client_profiles": actual_profiles,
-            "domain_knowledge": domain_knowledge,
-            "meeting_insights": meeting_insights,
-            "recommendations": recommendations,
-            "insights": [{"id": i, "type": "insight"} for i in range(insights_count)],
+            "domain_knowledge": kb_data["domain_knowledge"],
+            "meeting_insights": kb_data["meeting_insights"],
+            "recommendations": kb_data["recommendations"],
+            "insights": [{"id": i, "type": "insight"} for i in range(min(insights_count, limit))],
+            "insights_count": insights_count,
+            "profiles_count": profiles_count,
+            "industry_counts": kb_data["industry_counts"],
             "meetings": meetings_data,
+            "meeting_stats": kb_data["meeting_stats"],
             "system_metrics": {
-                "total_workflows": len(actual_profiles),
-                "active_workflows": len(actual_profiles),
-                "completed_workflows": len(actual_profiles),
+                "total_workflows": profiles_count,
+                "active_workflows": profiles_count,
+                "completed_workflows": profiles_count,
                 "failed_workflows": 0
-            }
+            },
+            "next_cursor": kb_data["next_cursor"]
         }
         
         return {
             "status": "success",
             "data": dashboard_data
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching dashboard data: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch dashboard data")
@@ -275,9 +530,11 @@ async def get_dashboard_data():
 async def search_knowledge_base(request: SearchRequest):
     """Query Knowledge Base for specific tags or keywords"""
     try:
-        results = db_manager.search_knowledge_base(
+        results = await db_manager.aio.search_knowledge_base(
             query=request.query,
-            tags=request.tags
+            tags=request.tags,
+            limit=request.limit,
+            offset=request.offset
         )
         return {"results": results}
     except Exception as e:
@@ -285,29 +542,23 @@ async def search_knowledge_base(request: SearchRequest):
         raise HTTPException(status_code=500, detail="Failed to search knowledge base")
 
 @app.get("/api/clients")
-async def get_client_profiles():
-    """Get all client profiles"""
+async def get_client_profiles(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    profiles: ClientProfileRepository = Depends(get_profile_repository)
+):
+    """Get client profiles, newest first, one keyset page at a time"""
     try:
-        conn = sqlite3.connect('ks_onboarding.db')
-        cursor = conn.cursor()
-        
-        # Get all profiles from the profiles table
-        cursor.execute("SELECT profile_data FROM profiles ORDER BY created_at DESC")
-        results = cursor.fetchall()
-        
-        profiles = []
-        for result in results:
-            if result[0]:
-                profile_data = json.loads(result[0])
-                profiles.append(profile_data)
+        # Get a page of profiles from the profiles table
+        page = await profiles.aio.list_profiles(limit=limit, cursor=cursor, fields=fields)
+        client_profiles = page["items"]
         
         # If no profiles exist, check for setup data as fallback
-        if not profiles:
-            cursor.execute("SELECT setup_data FROM setup_sessions ORDER BY created_at DESC LIMIT 1")
-            result = cursor.fetchone()
+        if not client_profiles and not cursor:
+            setup_data = await profiles.aio.get_latest_setup()
             
-            if result and result[0]:
-                setup_data = json.loads(result[0])
+            if setup_data:
                 client_profile = {
                     "id": "1",
                     "company_name": setup_data.get("client_name", "Unknown"),
@@ -326,63 +577,71 @@ async def get_client_profiles():
                     "created_at": datetime.now().isoformat(),
                     "updated_at": datetime.now().isoformat()
                 }
-                profiles.append(client_profile)
+                client_profiles.append(client_profile)
         
-        conn.close()
-        return {"status": "success", "data": profiles}
+        return {"status": "success", "data": client_profiles, "next_cursor": page["next_cursor"]}
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting client profiles: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/profiles")
+async def filter_client_profiles(
+    industry: Optional[str] = None,
+    region: Optional[str] = None,
+    min_completeness: Optional[float] = Query(None, ge=0, le=100),
+    max_completeness: Optional[float] = Query(None, ge=0, le=100),
+    limit: int = Query(50, ge=1, le=500),
+    profiles: ClientProfileRepository = Depends(get_profile_repository)
+):
+    """List client profile summaries filtered by industry, region and completeness range"""
+    try:
+        results = await profiles.aio.filter_profiles(industry, region, min_completeness, max_completeness, limit)
+        return {"status": "success", "data": results, "count": len(results)}
+        
+    except Exception as e:
+        logger.error(f"Error filtering client profiles: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/clients/{client_name}")
-async def get_client_profile(client_name: str):
+async def get_client_profile(client_name: str, profiles: ClientProfileRepository = Depends(get_profile_repository)):
     """Get specific client profile"""
     try:
-        conn = sqlite3.connect('ks_onboarding.db')
-        cursor = conn.cursor()
-        
         # First, try to find the profile in the profiles table
-        cursor.execute("SELECT profile_data FROM profiles WHERE client_name = ?", (client_name,))
-        result = cursor.fetchone()
+        profile_data = await profiles.aio.get_profile(client_name)
         
-        if result and result[0]:
-            profile_data = json.loads(result[0])
-            conn.close()
+        if profile_data:
             return {"status": "success", "data": profile_data}
         
         # If not found in profiles, check setup_sessions as fallback
-        cursor.execute("SELECT setup_data FROM setup_sessions ORDER BY created_at DESC LIMIT 1")
-        result = cursor.fetchone()
+        setup_data = await profiles.aio.get_latest_setup()
         
-        if result and result[0]:
-            setup_data = json.loads(result[0])
-            if setup_data.get("client_name", "").lower() == client_name.lower():
-                client_profile = {
-                    "id": "1",
-                    "company_name": setup_data.get("client_name", "Unknown"),
-                    "industry": setup_data.get("industry", "Unknown"),
-                    "problem_statement": setup_data.get("problem_statement", ""),
-                    "tech_stack": setup_data.get("tech_stack", ""),
-                    "timeline": setup_data.get("timeline", ""),
-                    "company_size": "150 employees",
-                    "founding_year": 2010,
-                    "regions": ["North America"],
-                    "stakeholders": ["CEO", "CTO", "Operations Manager"],
-                    "completeness_score": 85,
-                    "insights": {
-                        "market_position": "Mid-market leader",
-                        "growth_potential": "High",
-                        "risk_factors": ["Technology debt", "Market competition"],
-                        "recommendations": ["Modernize tech stack", "Improve data integration"]
-                    },
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat()
-                }
-                conn.close()
-                return {"status": "success", "data": client_profile}
+        if setup_data and setup_data.get("client_name", "").lower() == client_name.lower():
+            client_profile = {
+                "id": "1",
+                "company_name": setup_data.get("client_name", "Unknown"),
+                "industry": setup_data.get("industry", "Unknown"),
+                "problem_statement": setup_data.get("problem_statement", ""),
+                "tech_stack": setup_data.get("tech_stack", ""),
+                "timeline": setup_data.get("timeline", ""),
+                "company_size": "150 employees",
+                "founding_year": 2010,
+                "regions": ["North America"],
+                "stakeholders": ["CEO", "CTO", "Operations Manager"],
+                "completeness_score": 85,
+                "insights": {
+                    "market_position": "Mid-market leader",
+                    "growth_potential": "High",
+                    "risk_factors": ["Technology debt", "Market competition"],
+                    "recommendations": ["Modernize tech stack", "Improve data integration"]
+                },
+                "created_at": datetime.now().isoformat(),
+                "updated_at": datetime.now().isoformat()
+            }
+            return {"status": "success", "data": client_profile}
         
-        conn.close()
         raise HTTPException(status_code=404, detail="Client not found")
     except HTTPException:
         raise
@@ -391,12 +650,9 @@ async def get_client_profile(client_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/clients")
-async def create_client_profile(profile_data: Dict[str, Any]):
-    """Create a new client profile"""
+async def create_client_profile(profile_data: Dict[str, Any], profiles: ClientProfileRepository = Depends(get_profile_repository)):
+    """Create a client profile, or update the existing one for the same company name"""
     try:
-        conn = sqlite3.connect('ks_onboarding.db')
-        cursor = conn.cursor()
-        
         # Create a new profile with generated ID
         profile_id = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
@@ -420,16 +676,10 @@ async def create_client_profile(profile_data: Dict[str, Any]):
             "updated_at": datetime.now().isoformat()
         }
         
-        # Store in profiles table
-        cursor.execute(
-            "INSERT INTO profiles (client_name, profile_data, created_at, updated_at) VALUES (?, ?, ?, ?)",
-            (client_profile["company_name"], json.dumps(client_profile), datetime.now().isoformat(), datetime.now().isoformat())
-        )
-        
-        conn.commit()
-        conn.close()
+        # Store in profiles table (replaces an existing profile for the same company)
+        await profiles.aio.save_profile(client_profile["company_name"], client_profile)
         
-        logger.info(f"Created new client profile: {client_profile['company_name']}")
+        logger.info(f"Saved client profile: {client_profile['company_name']}")
         return {"status": "success", "data": client_profile, "message": "Profile created successfully"}
         
     except Exception as e:
@@ -437,34 +687,15 @@ async def create_client_profile(profile_data: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/clients/{profile_id}")
-async def update_client_profile(profile_id: str, profile_data: Dict[str, Any]):
+async def update_client_profile(profile_id: str, profile_data: Dict[str, Any], profiles: ClientProfileRepository = Depends(get_profile_repository)):
     """Update an existing client profile"""
     try:
-        conn = sqlite3.connect('ks_onboarding.db')
-        cursor = conn.cursor()
+        # Merge the changes into the existing profile
+        existing_profile = await profiles.aio.update_profile(profile_data.get("company_name", ""), profile_data)
         
-        # Get existing profile
-        cursor.execute("SELECT profile_data FROM profiles WHERE client_name = ?", (profile_data.get("company_name", ""),))
-        result = cursor.fetchone()
-        
-        if not result:
-            conn.close()
+        if existing_profile is None:
             raise HTTPException(status_code=404, detail="Profile not found")
         
-        # Update profile data
-        existing_profile = json.loads(result[0])
-        existing_profile.update(profile_data)
-        existing_profile["updated_at"] = datetime.now().isoformat()
-        
-        # Update in database
-        cursor.execute(
-            "UPDATE profiles SET profile_data = ?, updated_at = ? WHERE client_name = ?",
-            (json.dumps(existing_profile), datetime.now().isoformat(), profile_data.get("company_name", ""))
-        )
-        
-        conn.commit()
-        conn.close()
-        
         logger.info(f"Updated client profile: {profile_data.get('company_name', '')}")
         return {"status": "success", "data": existing_profile, "message": "Profile updated successfully"}
         
@@ -475,22 +706,13 @@ async def update_client_profile(profile_id: str, profile_data: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/clients/{profile_id}")
-async def delete_client_profile(profile_id: str):
+async def delete_client_profile(profile_id: str, profiles: ClientProfileRepository = Depends(get_profile_repository)):
     """Delete a client profile"""
     try:
-        conn = sqlite3.connect('ks_onboarding.db')
-        cursor = conn.cursor()
-        
         # Delete profile
-        cursor.execute("DELETE FROM profiles WHERE id = ?", (profile_id,))
-        
-        if cursor.rowcount == 0:
-            conn.close()
+        if not await profiles.aio.delete_profile(profile_id):
             raise HTTPException(status_code=404, detail="Profile not found")
         
-        conn.commit()
-        conn.close()
-        
         logger.info(f"Deleted client profile: {profile_id}")
         return {"status": "success", "message": "Profile deleted successfully"}
         
@@ -715,16 +937,22 @@ async def get_meetings(client_name: Optional[str] = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/meetings/summary")
-async def get_meetings_summary():
-    """Get meetings summary statistics"""
-    return {
-        "total_meetings": 2,
-        "total_duration": 105.0,  # Total minutes from both meetings
-        "average_sentiment": 0.80,  # Average of 0.78 and 0.82
-        "average_engagement": 0.875,  # Average of 0.85 and 0.90
-        "completed_action_items": 6,
-        "total_action_items": 8
-    }
+async def get_meetings_summary(client_name: Optional[str] = None):
+    """Get meetings summary statistics from the maintained aggregates"""
+    try:
+        stats = await db_manager.aio.get_meeting_stats(client_name)
+        return {
+            "total_meetings": stats["total_meetings"],
+            "total_duration": 0.0,  # Meeting durations are not recorded
+            "average_sentiment": round(stats["average_sentiment"], 3),
+            "average_engagement": round(stats["average_engagement"], 3),
+            "sentiment_counts": stats["sentiment_counts"],
+            "completed_action_items": 0,  # Action item completion is not tracked yet
+            "total_action_items": stats["total_action_items"]
+        }
+    except Exception as e:
+        logger.error(f"Error getting meetings summary: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/meetings/upload")
 async def upload_meeting(meeting_data: dict):
@@ -736,6 +964,51 @@ async def upload_meeting(meeting_data: dict):
         "status": "processing"
     }
 
+@app.get("/api/metrics/workflows")
+async def get_workflow_metrics():
+    """Get workflow counts by status, job queue depth, workflow store, per-stage cache and circuit breaker metrics"""
+    try:
+        return {
+            "status": "success",
+            "data": {
+                "workflows": orchestrator.get_workflow_metrics(),
+                "queue": workflow_queue.get_metrics(),
+                "store": orchestrator.workflow_store.get_metrics(),
+                "stage_cache": orchestrator.get_stage_cache_metrics(),
+                "circuit_breakers": orchestrator.get_circuit_breaker_states()
+            }
+        }
+    except Exception as e:
+        logger.error(f"Error getting workflow metrics: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to get workflow metrics")
+
+@app.post("/api/cache/stages/invalidate")
+async def invalidate_stage_cache(stage: Optional[str] = None):
+    """Drop cached stage results for one stage, or for all stages when none is given"""
+    try:
+        removed = await orchestrator.invalidate_stage_cache(stage)
+        return {
+            "status": "success",
+            "stage": stage,
+            "removed": removed
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error invalidating stage cache: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to invalidate stage cache")
+
+@app.get("/api/metrics/database")
+async def get_database_metrics():
+    """Get connection pool checkout/wait metrics and async executor queue metrics"""
+    try:
+        metrics = db_manager.get_pool_metrics()
+        metrics["executor"] = db_manager.aio.get_metrics()
+        return {"status": "success", "data": metrics}
+    except Exception as e:
+        logger.error(f"Error getting database metrics: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -743,7 +1016,7 @@ async def health_check():
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "version": "1.0.0",
-        "database": "connected" if db_manager.check_connection() else "disconnected"
+        "database": "connected" if await db_manager.aio.check_connection() else "disconnected"
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+import logging
+import random
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class StagePolicy:
+    """How a workflow stage is called: deadline per attempt, retries and circuit breaker settings.
+
+    Attempts that raise or exceed timeout seconds are retried up to retries times, sleeping
+    a random delay of up to backoff * 2^(attempt - 1) seconds (capped at max_backoff) in
+    between. A stage's circuit opens after failure_threshold consecutive failures and
+    lets a trial call through after reset_timeout seconds.
+    """
+
+    def __init__(self, timeout: Optional[float] = 120.0, retries: int = 2, backoff: float = 0.5,
+                 max_backoff: float = 8.0, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        if retries < 0 or failure_threshold < 1:
+            raise ValueError("retries must be at least 0 and failure_threshold at least 1")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Jittered delay before retrying after the given (1-based) failed attempt"""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one dependency.
+
+    Closed: calls go through. After failure_threshold consecutive failures it opens and
+    calls are refused until reset_timeout has passed; then it is half-open and lets a
+    single trial call through, closing again if that succeeds and reopening if it fails.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._metrics = {"successes": 0, "failures": 0, "short_circuited": 0, "opened": 0}
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now; a refused call counts as short-circuited"""
+        if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        self._metrics["short_circuited"] += 1
+        return False
+
+    def record_success(self):
+        """A call finished successfully"""
+        self._metrics["successes"] += 1
+        self._failures = 0
+        self._trial_in_flight = False
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit for {self.name} closed")
+        self.state = self.CLOSED
+
+    def record_failure(self):
+        """A call failed or timed out"""
+        self._metrics["failures"] += 1
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self._failures >= self.failure_threshold):
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._metrics["opened"] += 1
+            logger.warning(f"Circuit for {self.name} opened after {self._failures} consecutive failures")
+
+    def release(self):
+        """A call was abandoned (e.g. cancelled) without an outcome"""
+        self._trial_in_flight = False
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get the breaker state, consecutive failures and call counts"""
+        state = dict(self._metrics)
+        state.update({"state": self.state, "consecutive_failures": self._failures})
+        return state
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the agent registry: registration checks, input validation, and
+single-agent runs dispatched to the agents' real entry points.
+"""
+
+import asyncio
+import pytest
+from backend.agents.registry import AgentRegistry, DomainKnowledgeInput
+from backend.workflow_orchestrator import WorkflowOrchestrator
+from backend.database.db_manager import DatabaseManager
+
+@pytest.fixture
+def orchestrator():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    return WorkflowOrchestrator(db_manager)
+
+class EchoAgent:
+    name = "Echo Agent"
+
+    async def run(self, industry, problem_statement, tech_stack):
+        return {"status": "success", "args": [industry, problem_statement, tech_stack]}
+
+    def sync_run(self):
+        return {}
+
+def test_register_rejects_duplicates_and_non_coroutines():
+    registry = AgentRegistry()
+    registry.register("echo", EchoAgent(), "run", DomainKnowledgeInput)
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register("echo", EchoAgent(), "run", DomainKnowledgeInput)
+    with pytest.raises(ValueError, match="not a coroutine"):
+        registry.register("sync", EchoAgent(), "sync_run", DomainKnowledgeInput)
+    with pytest.raises(ValueError, match="not a coroutine"):
+        registry.register("missing", EchoAgent(), "analyze_domain", DomainKnowledgeInput)
+
+def test_execute_validates_and_normalizes_inputs():
+    registry = AgentRegistry()
+    registry.register("echo", EchoAgent(), "run", DomainKnowledgeInput)
+
+    result = asyncio.run(registry.execute("echo", {"industry": "Retail", "tech_stack": ["React", "AWS"]}))
+    assert result["args"] == ["Retail", "", "React, AWS"]
+
+    with pytest.raises(ValueError):
+        asyncio.run(registry.execute("echo", {"industry": "Retail", "industy": "typo"}))
+    with pytest.raises(KeyError):
+        asyncio.run(registry.execute("nope", {}))
+    assert registry.describe()[0]["input_schema"]["required"] == ["industry"]
+
+@pytest.mark.parametrize("agent_name, params, key", [
+    ("domain_knowledge", {"industry": "Healthcare", "problem_statement": "Patient records", "tech_stack": "Python"}, "domain_knowledge"),
+    ("client_profile", {"client_name": "Registry Health", "industry": "Healthcare"}, "client_profile"),
+    ("meetings", {"client_name": "Registry Health", "transcript": "John: We will ship the pilot next week."}, "meeting_analysis"),
+    ("actionable_insights", {"client_name": "Registry Health"}, "insights"),
+])
+def test_single_agent_runs_reach_real_entry_points(orchestrator, agent_name, params, key):
+    result = asyncio.run(orchestrator.execute_single_agent(agent_name, **params))
+    assert result["status"] == "success", result
+    assert key in result
+
+def test_single_agent_errors(orchestrator):
+    unknown = asyncio.run(orchestrator.execute_single_agent("astrology"))
+    invalid = asyncio.run(orchestrator.execute_single_agent("meetings", client_name="Acme"))
+
+    assert unknown["status"] == "error" and "Unknown agent" in unknown["message"]
+    assert invalid["status"] == "error" and "Invalid input" in invalid["message"]
+
+def test_knowledge_search_with_industry_uses_domain_agent(orchestrator):
+    result = asyncio.run(orchestrator.search_knowledge_base("data security", industry="Healthcare"))
+
+    assert result["status"] == "success"
+    assert result["search_results"]["domain_insights"]["best_practices"]
+
+def test_stages_dispatch_through_registry(orchestrator):
+    calls = []
+    original = orchestrator.domain_knowledge_agent.process_domain_knowledge
+
+    async def process_domain_knowledge(*args):
+        calls.append(args)
+        return await original(*args)
+
+    # Replaced after registration: the registry resolves the entry method per call
+    orchestrator.domain_knowledge_agent.process_domain_knowledge = process_domain_knowledge
+    result = asyncio.run(orchestrator.execute_full_workflow({
+        "client_name": "Registry Retail",
+        "industry": "Retail",
+        "problem_statement": "Checkout conversion is dropping",
+        "tech_stack": "React"
+    }))
+
+    assert result["status"] == "completed"
+    assert calls == [("Retail", "Checkout conversion is dropping", "React")]
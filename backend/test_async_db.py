@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the async data-access path (DatabaseManager.aio)
+"""
+
+import asyncio
+import threading
+import pytest
+from database.async_db import AsyncDatabase
+from database.db_manager import DatabaseManager
+from database.repositories import ClientProfileRepository
+
+def make_db():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    return db_manager
+
+def test_calls_run_on_the_database_executor():
+    db_manager = make_db()
+
+    async def scenario():
+        thread = await db_manager.aio.run(lambda: threading.current_thread().name)
+        use_cases = await db_manager.aio.get_use_cases(limit=2)
+        profile = await ClientProfileRepository(db_manager).aio.get_profile("gt automotive")
+        return thread, use_cases, profile
+
+    thread, use_cases, profile = asyncio.run(scenario())
+    assert thread.startswith("ks-db") and thread != threading.current_thread().name
+    assert len(use_cases) == 2
+    assert profile["name"] == "GT Automotive"
+
+def test_pending_calls_are_bounded():
+    db_manager = make_db()
+    aio = AsyncDatabase(db_manager, max_workers=2, max_pending=2)
+    release = threading.Event()
+
+    async def scenario():
+        calls = [asyncio.create_task(aio.run(release.wait, 5)) for _ in range(6)]
+        await asyncio.sleep(0.05)
+        during = aio.get_metrics()
+        release.set()
+        await asyncio.gather(*calls)
+        return during, aio.get_metrics()
+
+    during, after = asyncio.run(scenario())
+    assert (during["in_flight"], during["waiting"]) == (2, 4)
+    assert (after["in_flight"], after["waiting"], after["calls"], after["max_waiting"]) == (0, 0, 6, 4)
+    aio.close()
+
+def test_errors_propagate_and_free_their_slot():
+    aio = AsyncDatabase(make_db(), max_workers=1, max_pending=1)
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await aio.run(int, "not a number")
+        return await aio.run(int, "42")
+
+    assert asyncio.run(scenario()) == 42
+    assert aio.get_metrics()["errors"] == 1
+    aio.close()
+
+def test_health_probe_is_not_queued_behind_queries():
+    db_manager = make_db()
+    aio = AsyncDatabase(db_manager, max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def scenario():
+        blocked = [asyncio.create_task(aio.run(release.wait, 5)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        healthy = await asyncio.wait_for(aio.check_connection(), timeout=1)
+        release.set()
+        await asyncio.gather(*blocked)
+        return healthy
+
+    assert asyncio.run(scenario()) is True
+    aio.close()
+
+def test_cancelled_call_keeps_its_slot_until_its_thread_finishes():
+    aio = AsyncDatabase(make_db(), max_workers=2, max_pending=1)
+    release = threading.Event()
+
+    async def scenario():
+        blocked = asyncio.create_task(aio.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        blocked.cancel()
+        follower = asyncio.create_task(aio.run(lambda: "done"))
+        await asyncio.sleep(0.05)
+        during = aio.get_metrics()
+        release.set()
+        return during, await asyncio.wait_for(follower, timeout=1)
+
+    during, result = asyncio.run(scenario())
+    assert (during["in_flight"], during["waiting"]) == (1, 1)
+    assert result == "done"
+    assert aio.get_metrics()["in_flight"] == 0
+    aio.close()
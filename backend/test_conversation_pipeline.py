@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for pipelined conversation turns: extraction and reply generation overlap,
+the reply is prompted with the pre-extraction state, and questions about fields
+the same message answered are reconciled away. Also covers streamed replies and
+the incremental reply cleaner, and that prompts are compiled once per agent.
+"""
+
+import asyncio
+import json
+import time
+import pytest
+from typing import Any, AsyncIterator, List, Optional
+from langchain_core.language_models.llms import LLM
+from langchain_core.outputs import GenerationChunk
+from langchain_core.prompts import ChatPromptTemplate
+from agents.conversational_setup import ConversationalSetupAgent
+from agents.natural_conversational_agent import ClientInfo, NaturalConversationalAgent, StreamingMessageCleaner
+
+class DelayedLLM(LLM):
+    """Fake LLM: answers extraction prompts with `extraction` and others with `reply` after `delay`"""
+    delay: float = 0.1
+    extraction: str = "{}"
+    reply: str = "Thanks! Which industry are you in?"
+    prompts: List[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "delayed-fake"
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, **kwargs: Any) -> str:
+        raise NotImplementedError
+
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None, **kwargs: Any) -> str:
+        self.prompts.append(prompt)
+        await asyncio.sleep(self.delay)
+        return self.extraction if "Extract any business information" in prompt else self.reply
+
+    async def _astream(self, prompt: str, stop: Optional[List[str]] = None, run_manager=None,
+                       **kwargs: Any) -> AsyncIterator[GenerationChunk]:
+        """Stream the reply word by word, the first word after `delay`"""
+        self.prompts.append(prompt)
+        await asyncio.sleep(self.delay)
+        for word in self.reply.split(" "):
+            yield GenerationChunk(text=word + " ")
+            await asyncio.sleep(self.delay / 10)
+
+def agent_with(llm: DelayedLLM, pipelined: bool) -> NaturalConversationalAgent:
+    agent = NaturalConversationalAgent(None, pipelined=pipelined)
+    agent.llm = llm
+    return agent
+
+def turn(agent: NaturalConversationalAgent, message: str):
+    async def scenario():
+        await agent.start_conversation("s")
+        llm_prompts = agent.llm.prompts
+        llm_prompts.clear()
+        start = time.perf_counter()
+        result = await agent.process_message("s", message)
+        return result, time.perf_counter() - start
+    return asyncio.run(scenario())
+
+def test_pipelined_turn_overlaps_llm_calls():
+    extraction = json.dumps({"company_name": "Zulu.riverside"})
+    sequential, sequential_time = turn(agent_with(DelayedLLM(extraction=extraction), False), "We are Zulu.riverside")
+    pipelined, pipelined_time = turn(agent_with(DelayedLLM(extraction=extraction), True), "We are Zulu.riverside")
+
+    assert sequential_time > 0.2
+    assert pipelined_time < 0.18
+    assert pipelined["client_info"] == sequential["client_info"] == {"company_name": "Zulu.riverside"}
+
+def test_reply_uses_pre_extraction_state_and_is_reconciled():
+    llm = DelayedLLM(
+        extraction=json.dumps({"industry": "IT"}),
+        reply="Great to meet you! Which industry are you in? And what challenges are you facing?"
+    )
+    agent = agent_with(llm, True)
+    result, _ = turn(agent, "We're an IT consultancy")
+
+    # The opening pool is refilled in the background, so pick the reply prompt by its content
+    reply_prompt = next(prompt for prompt in llm.prompts if "User just said" in prompt)
+    assert "Current information collected: {}" in reply_prompt
+    assert result["client_info"] == {"industry": "IT"}
+    assert result["response"] == "Great to meet you! And what challenges are you facing?"
+
+def test_reconcile_keeps_a_question():
+    agent = NaturalConversationalAgent(None)
+    before, after = ClientInfo(), ClientInfo(industry="IT")
+
+    reply = agent._reconcile_response("Great! Which industry are you in?", before, after)
+    assert reply == "Great! What's the name of your company?"
+    # Nothing new was extracted: the reply is untouched
+    assert agent._reconcile_response("Which industry are you in?", before, before) == "Which industry are you in?"
+
+def test_turns_reuse_compiled_prompts(monkeypatch):
+    llm = DelayedLLM(delay=0, extraction=json.dumps({"industry": "IT"}))
+    agent = agent_with(llm, True)
+    setup_agent = ConversationalSetupAgent(None)
+    setup_agent.llm = DelayedLLM(delay=0, reply=json.dumps({"company_name": "Zulu", "industry": "IT"}))
+
+    def from_template(*args, **kwargs):
+        raise AssertionError("prompt template built per call")
+
+    monkeypatch.setattr(ChatPromptTemplate, "from_template", from_template)
+    result, _ = turn(agent, "We're an IT consultancy")
+    assert result["client_info"] == {"industry": "IT"}
+    # The chains follow the model they were last given
+    assert llm in agent.chains["response"].steps
+    extracted = asyncio.run(setup_agent._extract_information_with_llm("Zulu, we do IT", "company_and_industry"))
+    assert extracted == {"company_name": "Zulu", "industry": "IT"}
+    assert asyncio.run(setup_agent._extract_information_with_llm("We do IT", "horoscope")) == {}
+
+def stream(agent: NaturalConversationalAgent, message: str):
+    async def scenario():
+        await agent.start_conversation("s")
+        return [event async for event in agent.stream_message("s", message)]
+    return asyncio.run(scenario())
+
+def test_stream_sends_tokens_then_done_event():
+    llm = DelayedLLM(
+        delay=0.1,
+        extraction=json.dumps({"industry": "IT"}),
+        reply="Great to meet you! Which industry are you in? And what challenges are you facing right now?"
+    )
+    agent = agent_with(llm, True)
+    events = stream(agent, "We're an IT consultancy")
+    tokens, done = events[:-1], events[-1]
+
+    assert len(tokens) > 1 and all(event["event"] == "token" for event in tokens)
+    assert "".join(event["text"] for event in tokens).startswith("Great to meet you! Which industry")
+    assert done["event"] == "done"
+    assert done["client_info"] == {"industry": "IT"}
+    assert done["response"] == "Great to meet you! And what challenges are you facing right now?"
+    # The first token arrives after one model delay, not after the whole reply
+    assert 100 <= done["ttft_ms"] < 180
+    assert agent.get_stream_metrics()["streamed_turns"] == 1
+    assert agent.sessions["s"].messages[-1]["content"] == done["response"]
+
+def feed_chars(text: str):
+    cleaner = StreamingMessageCleaner()
+    pieces = [cleaner.feed(char) for char in text] + [cleaner.finish()]
+    return "".join(pieces), cleaner
+
+@pytest.mark.parametrize("raw", [
+    "Hello there! What does your company do?",
+    '"Welcome aboard! Which industry are you in?"',
+    "Hi!\n* a bullet to skip\nWhat problem are you solving?",
+    "That's great. What is your timeline?",
+])
+def test_streaming_cleaner_matches_batch_cleaner(raw):
+    streamed, cleaner = feed_chars(raw)
+    assert streamed == cleaner.text == NaturalConversationalAgent(None)._extract_clean_message(raw)
+
+def test_streaming_cleaner_cuts_meta_commentary_and_long_replies():
+    streamed, _ = feed_chars("What industry are you in?\n**Notes on why this works")
+    assert streamed == "What industry are you in?"
+
+    long_reply = " ".join(f"word{i}" for i in range(60))
+    streamed, cleaner = feed_chars(long_reply)
+    assert streamed == " ".join(f"word{i}" for i in range(45)) + "?"
+    assert cleaner.stopped
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled SQLite connections in DatabaseManager
+"""
+
+import threading
+import pytest
+from database.db_manager import DatabaseManager, PoolTimeoutError
+
+def make_db(tmp_path, **kwargs):
+    db_manager = DatabaseManager(str(tmp_path / "pool.db"), **kwargs)
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    return db_manager
+
+def test_pragmas_applied(tmp_path):
+    db_manager = make_db(tmp_path)
+    with db_manager.writer() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    with db_manager.reader() as conn:
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] < 0
+    db_manager.close()
+
+def test_concurrent_readers_are_bounded(tmp_path):
+    db_manager = make_db(tmp_path, pool_size=2)
+    errors = []
+
+    def read():
+        try:
+            for _ in range(20):
+                assert len(db_manager.get_use_cases()) == 3
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    metrics = db_manager.get_pool_metrics()
+    assert not errors
+    assert metrics["readers_open"] <= 2
+    assert metrics["reader_checkouts"] >= 160
+    assert metrics["readers_in_use"] == 0
+    db_manager.close()
+
+def test_reader_checkout_timeout(tmp_path):
+    db_manager = make_db(tmp_path, pool_size=1, checkout_timeout=0.05)
+    with db_manager.reader():
+        with pytest.raises(PoolTimeoutError):
+            with db_manager.reader():
+                pass
+    assert db_manager.get_pool_metrics()["checkout_timeouts"] == 1
+    db_manager.close()
+
+def test_writer_rolls_back_on_error(tmp_path):
+    db_manager = make_db(tmp_path)
+    with pytest.raises(RuntimeError):
+        with db_manager.writer() as conn:
+            conn.execute("DELETE FROM use_cases")
+            raise RuntimeError("boom")
+    assert len(db_manager.get_use_cases()) == 3
+    db_manager.close()
+
+def test_in_memory_database_shares_one_connection():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    assert len(db_manager.get_use_cases()) == 3
+    assert db_manager.get_pool_metrics()["readers_open"] == 0
+    db_manager.close()
+
+def test_health_check_does_not_wait_for_the_writer(tmp_path):
+    db_manager = make_db(tmp_path)
+    result = []
+    with db_manager.writer():
+        probe = threading.Thread(target=lambda: result.append(db_manager.check_connection()))
+        probe.start()
+        probe.join(timeout=1)
+    assert result == [True]
+    db_manager.close()
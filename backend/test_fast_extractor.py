@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the deterministic fast-path extractor and the conversational agents
+calling the LLM only for fields it could not resolve.
+"""
+
+import asyncio
+import json
+import pytest
+from typing import List
+from agents.conversational_setup import ConversationalSetupAgent
+from agents.fast_extractor import FastExtractor
+from agents.natural_conversational_agent import NaturalConversationalAgent
+from test_conversation_pipeline import DelayedLLM
+
+@pytest.mark.parametrize("message, expected", [
+    ("We use Salesforce, Java", {"tech_stack": ["Salesforce", "Java"]}),
+    ("budget is $50k", {"budget": "$50k"}),
+    ("team of 12", {"team_size": 12}),
+    ("Mail me at jane.doe@acme.io", {"contact_info": {"email": "jane.doe@acme.io"}}),
+    ("Hi there! My company is Zulu.riverside and we're in the IT industry",
+     {"company_name": "Zulu.riverside", "industry": "IT"}),
+    ("We have a team of about 15 developers and we're located in San Francisco",
+     {"team_size": 15, "location": "San Francisco"}),
+    ("We'd like to complete it within 12 months on around $500K of budget",
+     {"timeline": "within 12 months", "budget": "around $500K"}),
+])
+def test_trivial_messages_resolve_without_llm(message, expected):
+    extractor = FastExtractor()
+    matches = extractor.extract(message)
+
+    assert extractor.resolved(matches) == expected
+    assert extractor.unresolved(message, matches) == []
+
+@pytest.mark.parametrize("message, unresolved", [
+    ("hello?", []),
+    ("We're struggling with scalability in our payment processing", ["problem_statement"]),
+    # Frobnicator is not in the gazetteer, so the listed stack is only partly known
+    ("Our stack is Java and Frobnicator", ["tech_stack"]),
+    ("We're Acme, based in Austin", ["company_name"]),
+    # A place, not a company: the match is below the threshold, so the LLM decides
+    ("I am calling from New York", ["company_name"]),
+    ("We have 20 years of experience in the industry.", ["industry"]),
+])
+def test_unresolved_fields_go_to_llm(message, unresolved):
+    extractor = FastExtractor()
+    assert extractor.unresolved(message, extractor.extract(message)) == unresolved
+
+def test_natural_agent_asks_llm_only_for_unresolved_fields():
+    llm = DelayedLLM(delay=0, extraction=json.dumps({"problem_statement": "Scaling payments", "industry": "Banking"}),
+                     reply="Thanks, that helps.")
+    agent = NaturalConversationalAgent(None)
+    agent.llm = llm
+
+    async def scenario():
+        await agent.start_conversation("s")
+        await agent.process_message("s", "We're in the fintech industry and struggling to scale payments")
+        # Every field of this message is resolved and the problem statement is already known
+        await agent.process_message("s", "We use Salesforce, Java")
+
+    asyncio.run(scenario())
+    extraction_prompts = [prompt for prompt in llm.prompts if "Extract any business information" in prompt]
+
+    assert len(extraction_prompts) == 1
+    assert "- problem_statement:" in extraction_prompts[0]
+    assert "- industry:" not in extraction_prompts[0]
+    # The rule match wins over the LLM's reading of a resolved field
+    assert agent.sessions["s"].client_info.to_dict() == {
+        "industry": "Fintech", "problem_statement": "Scaling payments", "tech_stack": ["Salesforce", "Java"]
+    }
+    assert agent.get_extraction_metrics() == {
+        "messages": 2, "llm_calls": 1, "llm_calls_saved": 1, "fast_path_fields": 2
+    }
+
+@pytest.mark.parametrize("message", [
+    "Our invoices are processed by hand and it takes forever",
+    "Customers complain that checkout is slow"
+])
+def test_problem_statement_goes_to_llm_until_known(message):
+    llm = DelayedLLM(delay=0, extraction=json.dumps({"problem_statement": "Manual invoicing"}), reply="Thanks, that helps.")
+    agent = NaturalConversationalAgent(None)
+    agent.llm = llm
+
+    async def scenario():
+        await agent.start_conversation("s")
+        await agent.process_message("s", message)
+        await agent.process_message("s", "budget is $50k")
+
+    asyncio.run(scenario())
+    extraction_prompts = [prompt for prompt in llm.prompts if "Extract any business information" in prompt]
+
+    assert len(extraction_prompts) == 1
+    assert "- problem_statement:" in extraction_prompts[0]
+    assert agent.sessions["s"].client_info.problem_statement == "Manual invoicing"
+
+class ScriptedLLM(DelayedLLM):
+    """DelayedLLM answering successive extraction prompts from `extractions`"""
+    extractions: List[dict] = []
+    extraction_prompts: List[str] = []
+
+    async def _acall(self, prompt, stop=None, **kwargs):
+        if "Extract any business information" in prompt:
+            self.extraction_prompts.append(prompt)
+            return json.dumps(self.extractions.pop(0))
+        return await super()._acall(prompt, stop, **kwargs)
+
+@pytest.mark.parametrize("reply, answer, expected", [
+    # The answer to the reply's question is sent for the fields it asked about
+    ("Thanks! Where are you based?", "Toronto, Canada", {"location": "Toronto, Canada"}),
+    ("Thanks! How big is your team?", "around 20", {"team_size": 20}),
+    # Nothing resolved from the message: it is sent for every missing field
+    ("Thanks, that helps.", "Zulu Riverside", {"company_name": "Zulu Riverside"}),
+    ("Thanks, that helps.", "50k", {"budget": "50k"}),
+])
+def test_bare_answers_after_the_problem_is_known_reach_the_llm(reply, answer, expected):
+    llm = ScriptedLLM(delay=0, reply=reply, prompts=[], extraction_prompts=[],
+                      extractions=[{"problem_statement": "Legacy systems"}, expected])
+    agent = NaturalConversationalAgent(None)
+    agent.llm = llm
+
+    async def scenario():
+        await agent.start_conversation("s")
+        await agent.process_message("s", "We're struggling with our legacy systems")
+        await agent.process_message("s", answer)
+
+    asyncio.run(scenario())
+    field = next(iter(expected))
+
+    assert len(llm.extraction_prompts) == 2
+    assert f"- {field}:" in llm.extraction_prompts[1]
+    assert "- problem_statement:" not in llm.extraction_prompts[1]
+    assert agent.sessions["s"].client_info.to_dict() == {"problem_statement": "Legacy systems", **expected}
+
+def test_list_and_dict_fields_accumulate_across_messages():
+    agent = NaturalConversationalAgent(None)
+    agent.llm = DelayedLLM(delay=0, extraction=json.dumps({"problem_statement": "Legacy systems"}))
+
+    async def scenario():
+        await agent.start_conversation("s")
+        for message in ("We use Java, Oracle", "We also run Docker and Kubernetes now, and Java",
+                        "Mail me at jane@acme.io", "Call me on +1 415 555 0100"):
+            await agent.process_message("s", message)
+
+    asyncio.run(scenario())
+    client_info = agent.sessions["s"].client_info
+    assert client_info.tech_stack == ["Java", "Oracle", "Docker", "Kubernetes"]
+    assert set(client_info.contact_info) == {"email", "phone"}
+
+def test_setup_agent_skips_llm_when_rules_resolve_the_stage():
+    agent = ConversationalSetupAgent(None)
+    agent.llm = DelayedLLM(delay=0, reply=json.dumps({"tech_stack": ["Oracle"]}), prompts=[])
+
+    resolved = asyncio.run(agent._extract_information_with_llm("We use Salesforce, Java", "tech_stack"))
+    fallback = asyncio.run(agent._extract_information_with_llm("Mostly in-house tools", "tech_stack"))
+
+    assert resolved == {"tech_stack": ["Salesforce", "Java"]}
+    assert fallback == {"tech_stack": ["Oracle"]}
+    assert len(agent.llm.prompts) == 1
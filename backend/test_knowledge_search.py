@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the FTS5-backed knowledge base search
+"""
+
+from database.db_manager import DatabaseManager
+
+def make_db():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    return db_manager
+
+def test_search_uses_full_text_index():
+    db_manager = make_db()
+    assert db_manager.fts_enabled
+
+    results = db_manager.search_knowledge_base("encryption")
+    assert [m["client_name"] for m in results["meetings"]] == ["MediCare Solutions"]
+    assert "<mark>encryption</mark>" in results["meetings"][0]["snippet"]
+
+    # Porter stemming and prefix terms: "checkout" matches "Checkout"/"checkout"
+    insights = db_manager.search_knowledge_base("checkout")["insights"]
+    assert {i["client_name"] for i in insights} == {"ShopTrend Inc."}
+
+def test_search_ranks_and_paginates():
+    db_manager = make_db()
+    with db_manager.writer() as conn:
+        conn.executemany(
+            "INSERT INTO insights (client_name, insight_type, content, tags) VALUES (?, ?, ?, ?)",
+            [("Acme", "domain_knowledge", "kpi " * (i + 1) + "filler text", "Best Practices") for i in range(5)]
+        )
+
+    first = db_manager.search_knowledge_base("kpi", limit=2)["insights"]
+    second = db_manager.search_knowledge_base("kpi", limit=2, offset=2)["insights"]
+    assert len(first) == 2 and len(second) == 2
+    assert not {i["id"] for i in first} & {i["id"] for i in second}
+    assert first[0]["score"] <= first[1]["score"] <= second[0]["score"]
+
+def test_search_filters_by_tags():
+    db_manager = make_db()
+    results = db_manager.search_knowledge_base("checkout", tags=["Recommendations"])
+    assert [i["insight_type"] for i in results["insights"]] == ["recommendations"]
+
+def test_index_follows_updates_and_deletes():
+    db_manager = make_db()
+    with db_manager.writer() as conn:
+        conn.execute("UPDATE meetings SET transcript = 'Kickoff about blockchain' WHERE client_name = 'GT Automotive'")
+        conn.execute("DELETE FROM meetings WHERE client_name = 'MediCare Solutions'")
+
+    assert len(db_manager.search_knowledge_base("blockchain")["meetings"]) == 1
+    assert db_manager.search_knowledge_base("lead management")["meetings"] == []
+    assert db_manager.search_knowledge_base("encryption")["meetings"] == []
+
+def test_like_fallback_without_fts():
+    db_manager = make_db()
+    db_manager.fts_enabled = False
+    results = db_manager.search_knowledge_base("encryption")
+    assert [m["client_name"] for m in results["meetings"]] == ["MediCare Solutions"]
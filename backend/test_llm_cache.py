@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the LLM response cache (keys, TTL, size bounds) and the pool of
+conversation opening messages served from it.
+"""
+
+import asyncio
+import time
+import pytest
+from agents.llm_cache import LLMResponseCache
+from agents.natural_conversational_agent import OPENING_FALLBACK, NaturalConversationalAgent
+from test_conversation_pipeline import DelayedLLM
+
+def test_key_buckets_temperature_and_hashes_prompt():
+    key = LLMResponseCache.key("gemma3", "Say hello", 0.8)
+
+    assert key == LLMResponseCache.key("gemma3", "Say hello", 0.8000001)
+    assert key != LLMResponseCache.key("gemma3", "Say hello", 0.7)
+    assert key != LLMResponseCache.key("llama3", "Say hello", 0.8)
+    assert key != LLMResponseCache.key("gemma3", "Say hi", 0.8)
+    assert "Say hello" not in key
+
+def test_responses_expire_and_are_bounded(monkeypatch):
+    cache = LLMResponseCache(max_entries=2, ttl=60, responses_per_key=2)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    for response in ("a", "b", "c"):
+        cache.put(("m", "1", None), response)
+
+    assert cache.count(("m", "1", None)) == 2
+    assert cache.get(("m", "1", None)) in ("b", "c")
+
+    cache.put(("m", "2", None), "x")
+    cache.put(("m", "3", None), "y")
+    # The least recently used key is evicted
+    assert cache.get(("m", "1", None)) is None
+    assert cache.get(("m", "3", None)) == "y"
+
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get(("m", "3", None)) is None
+    assert cache.count(("m", "2", None)) == 0
+    assert cache.get_metrics()["entries"] == 0
+
+def test_get_or_generate_generates_once():
+    cache = LLMResponseCache(responses_per_key=1)
+    calls = []
+
+    async def generate():
+        calls.append(1)
+        return "Hello!"
+
+    async def scenario():
+        return [await cache.get_or_generate(("m", "p", 8), generate) for _ in range(3)]
+
+    assert asyncio.run(scenario()) == ["Hello!"] * 3
+    assert len(calls) == 1
+    assert cache.get_metrics()["hit_rate"] == pytest.approx(0.667, abs=0.001)
+
+def test_opening_served_from_pool_without_waiting():
+    agent = NaturalConversationalAgent(None, response_cache=LLMResponseCache(responses_per_key=3))
+    agent.llm = DelayedLLM(delay=0.05, reply="Welcome! What does your company do?")
+
+    async def scenario():
+        start = time.perf_counter()
+        cold = await agent.start_conversation("a")
+        cold_time = time.perf_counter() - start
+        await agent._opening_refill
+        warm = await agent.start_conversation("b")
+        return cold, cold_time, warm
+
+    cold, cold_time, warm = asyncio.run(scenario())
+    assert cold["message"] == OPENING_FALLBACK
+    assert cold_time < 0.05
+    assert warm["message"] == "Welcome! What does your company do?"
+    assert agent.sessions["b"].messages[0]["content"] == warm["message"]
+    # One prompt per pooled opening; a full pool is not refilled
+    assert len(agent.llm.prompts) == 3
+    assert agent.refresh_openings() is None
+
+def test_opening_refill_gives_up_on_errors():
+    class FailingLLM(DelayedLLM):
+        async def _acall(self, prompt, stop=None, **kwargs):
+            self.prompts.append(prompt)
+            raise ConnectionError("Ollama is down")
+
+    agent = NaturalConversationalAgent(None)
+    agent.llm = FailingLLM(prompts=[])
+
+    async def scenario():
+        result = await agent.start_conversation("a")
+        await agent._opening_refill
+        return result
+
+    assert asyncio.run(scenario())["message"] == OPENING_FALLBACK
+    assert len(agent.llm.prompts) == 1
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the trigger-maintained meeting_stats aggregates
+"""
+
+import random
+import pytest
+from database.db_manager import DatabaseManager
+
+CATEGORIES = ["positive", "neutral", "negative", None]
+
+def make_db():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    return db_manager
+
+def recomputed(conn, scope):
+    """The aggregates for a scope, recomputed from the meetings table"""
+    where, params = ("", ()) if scope == "*" else ("WHERE lower(trim(client_name)) = ?", (scope,))
+    rows = conn.execute(f"SELECT * FROM meetings {where}", params).fetchall()
+    engagement = [r["engagement_metrics"] for r in rows]
+    return {
+        "meetings": len(rows),
+        "positive": sum(r["sentiment_category"] == "positive" for r in rows),
+        "neutral": sum(r["sentiment_category"] == "neutral" for r in rows),
+        "negative": sum(r["sentiment_category"] == "negative" for r in rows),
+        "polarity_sum": pytest.approx(sum(r["sentiment_score"] or 0 for r in rows)),
+        "polarity_count": sum(r["sentiment_score"] is not None for r in rows),
+        "engagement_count": sum('"engagement"' in (e or "") for e in engagement)
+    }
+
+def stored(conn, scope):
+    row = conn.execute("SELECT * FROM meeting_stats WHERE scope = ?", (scope,)).fetchone()
+    return {key: row[key] for key in ("meetings", "positive", "neutral", "negative",
+                                      "polarity_sum", "polarity_count", "engagement_count")}
+
+def test_aggregates_track_inserts_updates_and_deletes():
+    db_manager = make_db()
+    rng = random.Random(7)
+    clients = ["Acme", "Globex", "GT Automotive"]
+
+    with db_manager.writer() as conn:
+        for i in range(300):
+            op = rng.random()
+            if op < 0.6:
+                conn.execute(
+                    "INSERT INTO meetings (client_name, transcript, engagement_metrics, sentiment_score, sentiment_category) "
+                    "VALUES (?, 'notes', ?, ?, ?)",
+                    (rng.choice(clients), rng.choice(['{"engagement": 55}', '{"engagement": 0.4}', '{}', None]),
+                     rng.choice([round(rng.uniform(-1, 1), 3), None]), rng.choice(CATEGORIES))
+                )
+            elif op < 0.8:
+                conn.execute(
+                    "UPDATE meetings SET sentiment_category = ?, sentiment_score = ?, client_name = ? "
+                    "WHERE id = (SELECT id FROM meetings ORDER BY random() LIMIT 1)",
+                    (rng.choice(CATEGORIES), round(rng.uniform(-1, 1), 3), rng.choice(clients))
+                )
+            else:
+                conn.execute("DELETE FROM meetings WHERE id = (SELECT id FROM meetings ORDER BY random() LIMIT 1)")
+
+        for scope in ["*", "acme", "globex", "gt automotive"]:
+            assert stored(conn, scope) == recomputed(conn, scope), scope
+
+def test_aggregates_roll_back_with_the_insert():
+    db_manager = make_db()
+    before = db_manager.get_meeting_stats()
+    with pytest.raises(RuntimeError):
+        with db_manager.writer() as conn:
+            db_manager._insert_meeting(conn, "Acme", "Great meeting, very productive!", ["Send recap"], {"engagement": 90})
+            raise RuntimeError("abort")
+    assert db_manager.get_meeting_stats() == before
+
+def test_save_meeting_updates_client_and_global_stats():
+    db_manager = make_db()
+    db_manager.save_meeting("Acme", "Great meeting, very productive!", ["Send recap", "Book demo"], {"engagement": 90})
+    db_manager.save_meeting(" ACME ", "Terrible, awful delays.", [], {"engagement": 0.5})
+
+    acme = db_manager.get_meeting_stats("acme")
+    assert acme["total_meetings"] == 2
+    assert acme["sentiment_counts"] == {"positive": 1, "neutral": 0, "negative": 1}
+    assert acme["average_engagement"] == pytest.approx(0.7)
+    assert acme["total_action_items"] == 2
+    assert db_manager.get_meeting_stats()["total_meetings"] == 5
+    assert db_manager.get_sentiment_data("Acme") == {"positive": 50.0, "neutral": 0.0, "negative": 50.0}
+    assert db_manager.get_meeting_stats("Nobody")["total_meetings"] == 0
+
+def test_stats_lookup_normalizes_like_the_triggers():
+    db_manager = make_db()
+    with db_manager.writer() as conn:
+        conn.execute(
+            "INSERT INTO meetings (client_name, transcript, sentiment_score, sentiment_category) "
+            "VALUES ('Ärzte Group\t', 'Call', 0.5, 'positive')"
+        )
+
+    assert db_manager.get_meeting_stats("Ärzte Group\t")["total_meetings"] == 1
+    assert db_manager.get_meeting_stats("  ÄRZTE GROUP\t")["total_meetings"] == 1
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for keyset pagination and fields= projection on the list queries
+"""
+
+import pytest
+from database.db_manager import DatabaseManager
+from database.pagination import decode_cursor, encode_cursor, next_cursor, parse_fields
+from database.repositories import ClientProfileRepository, DashboardRepository
+
+def make_db(profiles=25, meetings=25):
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    db_manager.save_client_profiles(
+        (f"Client {i:02d}", {"company_name": f"Client {i:02d}", "industry": "Retail", "regions": ["USA"]})
+        for i in range(profiles)
+    )
+    with db_manager.writer() as conn:
+        conn.executemany(
+            "INSERT INTO meetings (client_name, transcript, action_items, engagement_metrics, sentiment_score, sentiment_category) "
+            "VALUES (?, ?, '[\"Follow up\"]', '{\"engagement\": 50}', 0.2, 'positive')",
+            [(f"Client {i:02d}", "A long transcript " * 50) for i in range(meetings)]
+        )
+    return db_manager
+
+def walk(fetch, limit):
+    """Follow next_cursor until exhausted, returning every page"""
+    pages, cursor = [], None
+    while True:
+        items, cursor = fetch(limit, cursor)
+        pages.append(items)
+        if not cursor:
+            return pages
+
+def test_cursor_round_trip_and_validation():
+    assert decode_cursor(encode_cursor("2026-01-01 00:00:00", 7), 2) == ["2026-01-01 00:00:00", 7]
+    for bad in ["not-a-cursor", encode_cursor(1)]:
+        with pytest.raises(ValueError):
+            decode_cursor(bad, 2)
+    assert next_cursor([{"id": 1}], 2, lambda item: (item["id"],)) is None
+
+def test_parse_fields():
+    assert parse_fields("industry, company_name,industry") == ["industry", "company_name"]
+    assert parse_fields("") is None
+    with pytest.raises(ValueError):
+        parse_fields("industry,$.secret")
+    with pytest.raises(ValueError):
+        parse_fields("transcript", allowed=("id", "client_name"))
+
+def test_profiles_pages_cover_every_profile_once():
+    repository = ClientProfileRepository(make_db())
+
+    def fetch(limit, cursor):
+        page = repository.list_profiles(limit=limit, cursor=cursor)
+        return page["items"], page["next_cursor"]
+
+    pages = walk(fetch, 10)
+    names = [p.get("company_name", p.get("name")) for page in pages for p in page]
+    assert [len(page) for page in pages] == [10, 10, 8]
+    assert len(set(names)) == 28
+    assert names == [p.get("company_name", p.get("name")) for p in repository.list_profiles()["items"]]
+
+def test_profile_pages_continue_past_rows_without_a_document():
+    # Only a legacy (unmigrated) table can hold empty documents; JSON-derived columns reject them
+    db_manager = DatabaseManager()
+    with db_manager.writer() as conn:
+        db_manager._create_tables(conn.cursor())
+        conn.executemany(
+            "INSERT INTO profiles (client_name, profile_data) VALUES (?, ?)",
+            [(f"Client {i}", "" if i in (4, 5) else f'{{"company_name": "Client {i}"}}') for i in range(7)]
+        )
+    repository = ClientProfileRepository(db_manager)
+
+    def fetch(limit, cursor):
+        page = repository.list_profiles(limit=limit, cursor=cursor)
+        return page["items"], page["next_cursor"]
+
+    pages = walk(fetch, 3)
+    names = [p["company_name"] for page in pages for p in page]
+    # The newest page loses two rows to the filter but still links to the next one
+    assert len(pages[0]) == 1
+    assert names == ["Client 6", "Client 3", "Client 2", "Client 1", "Client 0"]
+
+def test_profile_projection_extracts_fields_in_sql():
+    repository = ClientProfileRepository(make_db())
+    items = repository.list_profiles(limit=2, fields="company_name,regions,missing")["items"]
+    assert items[0] == {"company_name": "Client 24", "regions": ["USA"], "missing": None}
+
+def test_use_cases_and_meetings_pages():
+    db_manager = make_db()
+
+    def fetch_meetings(limit, cursor):
+        items = db_manager.get_meeting_insights(limit=limit, cursor=cursor, fields="client_name,action_items")
+        return items, next_cursor(items, limit, lambda item: (item["id"],))
+
+    pages = walk(fetch_meetings, 7)
+    ids = [m["id"] for page in pages for m in page]
+    assert ids == sorted(ids, reverse=True) and len(ids) == 28
+    assert set(pages[0][0]) == {"id", "client_name", "action_items"}
+    assert pages[0][0]["action_items"] == ["Follow up"]
+
+    first = db_manager.get_use_cases(limit=2, fields="client_name")
+    rest = db_manager.get_use_cases(limit=2, cursor=encode_cursor(first[-1]["id"]))
+    assert [u["client_name"] for u in first + rest] == ["GT Automotive", "MediCare Solutions", "ShopTrend Inc."]
+
+def test_dashboard_is_bounded_with_totals():
+    data = DashboardRepository(make_db()).get_dashboard_data(limit=5, fields="industry", meeting_fields="sentiment_score")
+    assert len(data["client_profiles"]) == 5 and len(data["meeting_insights"]) == 5
+    assert data["client_profiles"][0] == {"industry": "Retail"}
+    assert "transcript" not in data["meeting_insights"][0]
+    assert data["profiles_count"] == 28
+    assert data["industry_counts"]["retail"] == 26
+    assert data["next_cursor"]["client_profiles"] and data["next_cursor"]["meeting_insights"]
+
+def test_dashboard_cursors_page_profiles_and_meetings():
+    repository = DashboardRepository(make_db())
+    first = repository.get_dashboard_data(limit=5)
+    second = repository.get_dashboard_data(
+        limit=5, profiles_cursor=first["next_cursor"]["client_profiles"],
+        meetings_cursor=first["next_cursor"]["meeting_insights"]
+    )
+    unpaged = repository.get_dashboard_data(limit=10)
+
+    assert first["client_profiles"] + second["client_profiles"] == unpaged["client_profiles"]
+    assert first["meeting_insights"] + second["meeting_insights"] == unpaged["meeting_insights"]
+    with pytest.raises(ValueError):
+        repository.get_dashboard_data(limit=5, profiles_cursor="not-a-cursor")
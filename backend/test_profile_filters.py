@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for filtering client profiles on the JSON1 generated columns and profile_regions
+"""
+
+from database.db_manager import DatabaseManager
+from database.repositories import ClientProfileRepository
+
+def make_repository():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    db_manager.save_client_profiles([
+        ("Acme Corp", {"industry": "Retail", "completeness_score": 90, "regions": ["Europe", " USA "], "company_size": "Large"}),
+        ("Globex", {"industry": "retail ", "completeness_score": 60, "regions": "Asia"}),
+        ("Initech", {"industry": "Software", "completeness_score": 75.5, "regions": []})
+    ])
+    return ClientProfileRepository(db_manager)
+
+def names(profiles):
+    return [p["client_name"] for p in profiles]
+
+def test_filter_by_industry_is_case_insensitive():
+    repository = make_repository()
+    assert names(repository.filter_profiles(industry="RETAIL")) == ["Globex", "Acme Corp", "ShopTrend Inc."]
+
+def test_filter_by_region_reads_lists_and_legacy_strings():
+    repository = make_repository()
+    assert names(repository.filter_profiles(region="usa")) == ["Acme Corp", "MediCare Solutions", "GT Automotive"]
+    assert names(repository.filter_profiles(region="Latin America")) == ["GT Automotive"]
+    assert names(repository.filter_profiles(region="asia")) == ["Globex"]
+
+def test_filter_by_completeness_range():
+    repository = make_repository()
+    assert names(repository.filter_profiles(min_completeness=70)) == ["Acme Corp", "Initech"]
+    assert names(repository.filter_profiles(min_completeness=50, max_completeness=80)) == ["Initech", "Globex"]
+
+def test_combined_filters_and_projection():
+    repository = make_repository()
+    [profile] = repository.filter_profiles(industry="retail", region="europe", min_completeness=80)
+    assert profile["client_name"] == "Acme Corp"
+    assert profile["completeness_score"] == 90
+    assert profile["company_size"] == "Large"
+    assert sorted(profile["regions"]) == ["Europe", "USA"]
+    assert "profile_data" not in profile
+
+def test_regions_follow_profile_updates_and_deletes():
+    repository = make_repository()
+    repository.save_profile("acme corp", {"industry": "Retail", "regions": ["Africa"]})
+    assert names(repository.filter_profiles(region="europe")) == []
+    assert names(repository.filter_profiles(region="africa")) == ["Acme Corp"]
+
+    with repository.db_manager.writer() as conn:
+        conn.execute("DELETE FROM profiles WHERE client_key = 'acme corp'")
+        assert conn.execute("SELECT COUNT(*) FROM profile_regions WHERE region = 'Africa'").fetchone()[0] == 0
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the unique client key, profile upserts and single-client lookups
+"""
+
+import sqlite3
+import pytest
+from database.db_manager import DatabaseManager
+from database.repositories import ClientProfileRepository
+
+def make_db():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    return db_manager
+
+def profile_rows(db_manager):
+    with db_manager.reader() as conn:
+        return conn.execute("SELECT client_name, profile_data FROM profiles ORDER BY id").fetchall()
+
+def test_save_client_profile_upserts_case_insensitively():
+    db_manager = make_db()
+    db_manager.save_client_profile("Acme Corp", {"industry": "Retail"})
+    db_manager.save_client_profile("  acme corp ", {"industry": "Logistics"})
+
+    rows = profile_rows(db_manager)
+    assert len(rows) == 1
+    assert rows[0]["client_name"] == "Acme Corp"
+    assert '"Logistics"' in rows[0]["profile_data"]
+
+def test_client_key_is_unique():
+    db_manager = make_db()
+    db_manager.save_client_profile("Acme Corp", {})
+    with pytest.raises(sqlite3.IntegrityError):
+        with db_manager.writer() as conn:
+            conn.execute("INSERT INTO profiles (client_name, profile_data) VALUES ('ACME CORP', '{}')")
+
+def test_bulk_save_in_one_transaction():
+    db_manager = make_db()
+    profiles = ((f"Client {i % 500}", {"n": i}) for i in range(1000))
+    assert db_manager.save_client_profiles(profiles) == 1000
+
+    assert len(profile_rows(db_manager)) == 500
+    repository = ClientProfileRepository(db_manager)
+    assert repository.get_profile("client 7") == {"n": 507}
+
+def test_bulk_save_rolls_back_on_error():
+    db_manager = make_db()
+
+    def profiles():
+        yield "Acme Corp", {}
+        raise ValueError("bad export row")
+
+    with pytest.raises(ValueError):
+        db_manager.save_client_profiles(profiles())
+    assert profile_rows(db_manager) == []
+
+def test_migration_merges_existing_duplicates(caplog):
+    db_manager = DatabaseManager()
+    with db_manager.writer() as conn:
+        db_manager._create_tables(conn.cursor())
+        conn.executemany(
+            "INSERT INTO profiles (client_name, profile_data) VALUES (?, ?)",
+            [("Acme Corp", '{"v": 1, "industry": "Retail"}'), ("ACME CORP", '{"v": 2}'), ("Globex", '{"v": 3}')]
+        )
+    with caplog.at_level("WARNING", logger="database.migrations"):
+        db_manager.initialize_database()
+
+    assert [tuple(row) for row in profile_rows(db_manager)] == [
+        ("ACME CORP", '{"v": 2, "industry": "Retail"}'), ("Globex", '{"v": 3}')
+    ]
+    assert "'Acme Corp' (id 1) into 'ACME CORP' (id 2)" in caplog.text
+
+def test_get_client_profile_by_normalized_name():
+    db_manager = make_db()
+    db_manager.save_client_profile("Acme Corp", {"industry": "Retail"})
+
+    profile = db_manager.get_client_profile(" ACME corp")
+    assert profile["client_name"] == "Acme Corp"
+    assert profile["profile_data"] == {"industry": "Retail"}
+    assert db_manager.get_client_profile("Acme") is None
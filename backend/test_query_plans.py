@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+EXPLAIN QUERY PLAN regression tests: every hot lookup must be served by an
+index. The SQL under test is captured from the real DatabaseManager and
+repository methods, so the test follows the code rather than a copy of it.
+"""
+
+import re
+import pytest
+from database.db_manager import DatabaseManager
+from database.migrations import MIGRATIONS, get_schema_version
+from database.pagination import encode_cursor
+from database.repositories import ClientProfileRepository, DashboardRepository
+from database.workflow_store import WorkflowStore
+
+# A bare "SCAN <table>" is a full table scan; index scans read "SCAN t USING [COVERING] INDEX ..."
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+# An unfiltered first page walks the rowid in order and stops at LIMIT, so its scan is bounded
+BOUNDED_PAGE = re.compile(r"^(?!.*\bWHERE\b).*\bLIMIT\b", re.S)
+
+# name -> (call, ranked); ranked queries sort by relevance, so only their lookups are checked
+HOT_LOOKUPS = {
+    "domain knowledge by type": (lambda db, repo: db.get_domain_knowledge(), False),
+    "recommendations by type": (lambda db, repo: db.get_recommendations(), False),
+    "meetings by client": (lambda db, repo: db.get_meetings_by_client("GT Automotive"), False),
+    "insights by tag": (lambda db, repo: db.get_insights_by_tag("best practices"), False),
+    "tag-filtered search": (lambda db, repo: db.search_knowledge_base("kpi", tags=["Best Practices"]), True),
+    "sentiment distribution": (lambda db, repo: db.get_sentiment_data(), False),
+    "profile by client": (lambda db, repo: repo.get_profile("GT Automotive"), False),
+    "single client profile": (lambda db, repo: db.get_client_profile("gt automotive"), False),
+    "profiles newest first": (lambda db, repo: repo.list_profiles(), False),
+    "profiles page": (lambda db, repo: repo.list_profiles(limit=2, cursor=encode_cursor("9999-12-31", 10**9)), False),
+    "meeting insights page": (lambda db, repo: db.get_meeting_insights(limit=2, cursor=encode_cursor(10**9)), False),
+    "dashboard": (lambda db, repo: DashboardRepository(db).get_dashboard_data(limit=5), False),
+    "use cases page": (lambda db, repo: db.get_use_cases(limit=2, cursor=encode_cursor(0)), False),
+    "latest setup session": (lambda db, repo: repo.get_latest_setup(), False),
+    "profiles by industry": (lambda db, repo: repo.filter_profiles(industry="healthcare"), False),
+    "profiles by region": (lambda db, repo: repo.filter_profiles(region="usa"), False),
+    "profiles by completeness": (lambda db, repo: repo.filter_profiles(min_completeness=80), False),
+    "finished workflow by id": (lambda db, repo: WorkflowStore(db).get("workflow_1"), False),
+    "workflows page": (lambda db, repo: WorkflowStore(db).list_workflows(limit=2, cursor=encode_cursor("workflow_Z")), False),
+    "workflows by status": (lambda db, repo: WorkflowStore(db).list_workflows(limit=2, status="failed"), False),
+    "workflows by client": (
+        lambda db, repo: WorkflowStore(db).list_workflows(limit=2, cursor=encode_cursor("workflow_Z"), client_name="Acme"), False
+    ),
+    "workflow checkpoints": (lambda db, repo: WorkflowStore(db).get_checkpoints("workflow_1"), False)
+}
+
+@pytest.fixture(scope="module")
+def db_manager():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    return db_manager
+
+def capture_selects(db_manager, call):
+    statements = []
+    with db_manager.writer() as conn:
+        conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        with db_manager.writer() as conn:
+            conn.set_trace_callback(None)
+    return [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+
+def test_migrations_applied(db_manager):
+    with db_manager.reader() as conn:
+        assert get_schema_version(conn) == MIGRATIONS[-1][0]
+        tags = conn.execute("SELECT tag FROM insight_tags ORDER BY tag").fetchall()
+    assert {row["tag"] for row in tags} == {"Best Practices", "Recommendations"}
+
+@pytest.mark.parametrize("name", sorted(HOT_LOOKUPS))
+def test_hot_query_uses_index(db_manager, name):
+    repository = ClientProfileRepository(db_manager)
+    call, ranked = HOT_LOOKUPS[name]
+    statements = capture_selects(db_manager, lambda: call(db_manager, repository))
+    assert statements, f"{name}: no SQL captured"
+
+    with db_manager.reader() as conn:
+        for sql in statements:
+            plan = [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+            bounded = BOUNDED_PAGE.match(sql) and not any("TEMP B-TREE" in detail for detail in plan)
+            for detail in plan:
+                assert bounded or not FULL_SCAN.match(detail), f"{name}: full table scan in {plan}\n{sql}"
+                assert ranked or "USE TEMP B-TREE" not in detail, f"{name}: sort without index in {plan}\n{sql}"
+
+def test_tag_filter_is_exact_and_case_insensitive(db_manager):
+    assert {i["insight_type"] for i in db_manager.get_insights_by_tag("RECOMMENDATIONS")} == {"recommendations"}
+    assert db_manager.get_insights_by_tag("Recommend") == []
+
+def test_deleting_insight_removes_its_tags(db_manager):
+    insight_id = db_manager.add_insight("Acme", "recommendations", "Temporary", ["Scratch", "scratch", " Temp "])
+    with db_manager.writer() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM insight_tags WHERE insight_id = ?", (insight_id,)).fetchone()[0] == 2
+        conn.execute("DELETE FROM insights WHERE id = ?", (insight_id,))
+        assert conn.execute("SELECT COUNT(*) FROM insight_tags WHERE insight_id = ?", (insight_id,)).fetchone()[0] == 0
+
+def test_updating_insight_tags_resyncs_insight_tags(db_manager):
+    insight_id = db_manager.add_insight("Acme", "recommendations", "Retagged", ["Old", "Stale"])
+    with db_manager.writer() as conn:
+        conn.execute("UPDATE insights SET tags = ? WHERE id = ?", ('New, "Quoted", new , ', insight_id))
+        tags = conn.execute("SELECT tag FROM insight_tags WHERE insight_id = ? ORDER BY tag", (insight_id,)).fetchall()
+        assert [row[0] for row in tags] == ['"Quoted"', "New"]
+        conn.execute("UPDATE insights SET tags = NULL WHERE id = ?", (insight_id,))
+        assert conn.execute("SELECT COUNT(*) FROM insight_tags WHERE insight_id = ?", (insight_id,)).fetchone()[0] == 0
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed stage cache: key normalization, memory and SQLite
+tiers, TTL, invalidation, and workflow re-runs served from the cache.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import pytest
+from backend.workflow_orchestrator import WorkflowOrchestrator
+from backend.database.db_manager import DatabaseManager
+from backend.database.stage_cache import StageCache, stage_cache_key
+
+CLIENT = {
+    "client_name": "Cache Corp",
+    "industry": "Retail",
+    "problem_statement": "Checkout conversion is dropping",
+    "tech_stack": "React, AWS"
+}
+
+@pytest.fixture
+def db_manager():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    return db_manager
+
+def counting(result, calls):
+    async def compute():
+        calls.append(1)
+        return dict(result)
+    return compute
+
+def test_key_ignores_volatile_fields_and_whitespace():
+    first = {"industry": "Retail", "result": {"execution_time": 0.5, "data": "a  b"}}
+    second = {"result": {"data": "a b", "execution_time": 1.2}, "industry": "Retail"}
+
+    assert stage_cache_key("domain_knowledge", "1.0", first) == stage_cache_key("domain_knowledge", "1.0", second)
+    assert stage_cache_key("domain_knowledge", "1.1", first) != stage_cache_key("domain_knowledge", "1.0", first)
+    assert stage_cache_key("client_profile", "1.0", first) != stage_cache_key("domain_knowledge", "1.0", first)
+
+def test_hit_returns_copy_and_failures_are_not_cached():
+    cache = StageCache()
+    calls = []
+
+    async def scenario():
+        first = await cache.get_or_compute("stage", "k", counting({"status": "success", "items": [1]}, calls))
+        first["items"].append(2)
+        second = await cache.get_or_compute("stage", "k", counting({"status": "success", "items": [1]}, calls))
+        await cache.get_or_compute("stage", "bad", counting({"status": "error"}, calls))
+        await cache.get_or_compute("stage", "bad", counting({"status": "error"}, calls))
+        return second
+
+    second = asyncio.run(scenario())
+    assert second == {"status": "success", "items": [1], "cached": True}
+    assert len(calls) == 3
+    assert cache.get_metrics()["stages"]["stage"] == {"hits": 1, "disk_hits": 0, "misses": 3, "hit_rate": 0.25}
+
+def test_memory_tier_is_bounded():
+    cache = StageCache(max_entries=2)
+    calls = []
+
+    async def scenario():
+        for key in ("a", "b", "c", "a"):
+            await cache.get_or_compute("stage", key, counting({"status": "success"}, calls))
+
+    asyncio.run(scenario())
+    # "a" was evicted when "c" arrived, so it is computed again
+    assert len(calls) == 4
+    assert cache.get_metrics()["entries"] == 2
+
+def test_disk_tier_survives_a_new_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(os.path.join(tmp, "cache.db"))
+        db_manager.initialize_database()
+        calls = []
+
+        asyncio.run(StageCache(db_manager).get_or_compute("stage", "k", counting({"status": "success"}, calls)))
+        fresh = StageCache(db_manager)
+        result = asyncio.run(fresh.get_or_compute("stage", "k", counting({"status": "success"}, calls)))
+
+        assert result["cached"] is True and len(calls) == 1
+        assert fresh.get_metrics()["stages"]["stage"]["disk_hits"] == 1
+        db_manager.close()
+
+def test_expired_entries_are_recomputed(db_manager):
+    cache = StageCache(db_manager, ttl=0.05)
+    calls = []
+
+    async def scenario():
+        await cache.get_or_compute("stage", "k", counting({"status": "success"}, calls))
+        await asyncio.sleep(0.1)
+        await cache.get_or_compute("stage", "k", counting({"status": "success"}, calls))
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
+
+def test_invalidate_one_stage(db_manager):
+    cache = StageCache(db_manager)
+    calls = []
+
+    async def scenario():
+        await cache.get_or_compute("one", "k1", counting({"status": "success"}, calls))
+        await cache.get_or_compute("two", "k2", counting({"status": "success"}, calls))
+        assert cache.invalidate("one") == 1
+        await cache.get_or_compute("one", "k1", counting({"status": "success"}, calls))
+        await cache.get_or_compute("two", "k2", counting({"status": "success"}, calls))
+
+    asyncio.run(scenario())
+    assert len(calls) == 3
+
+def test_rerun_is_served_from_the_stage_cache(db_manager):
+    orchestrator = WorkflowOrchestrator(db_manager)
+
+    async def scenario():
+        first = await orchestrator.execute_full_workflow(dict(CLIENT))
+        # The first run stores a profile, which is an input of the profile stage, so the
+        # second run recomputes it (and insights that depend on it); the third hits throughout
+        await orchestrator.execute_full_workflow(dict(CLIENT))
+        third = await orchestrator.execute_full_workflow(dict(CLIENT))
+        return first, third
+
+    first, third = asyncio.run(scenario())
+    assert first["status"] == "completed" and third["status"] == "completed"
+
+    stages = orchestrator.workflow_store.get(third["workflow_id"])["stages"]
+    assert stages["domain_knowledge"]["cached"] is True
+    assert stages["client_profile"]["cached"] is True
+    assert stages["actionable_insights"]["cached"] is True
+    assert stages["meetings"]["cached"] is False
+
+    metrics = orchestrator.get_stage_cache_metrics()["stages"]
+    assert metrics["domain_knowledge"] == {"hits": 2, "disk_hits": 0, "misses": 1, "hit_rate": 0.667}
+    assert metrics["client_profile"]["hits"] == 1
+
+def test_rerun_with_meetings_hits_profile_and_insights(db_manager):
+    # Real agents: the meeting analysis carries a fresh analysis_timestamp and the saved
+    # profile a fresh last_updated on every run, neither of which may change the keys
+    db_manager.save_meeting(CLIENT["client_name"], "Great demo, the team is excited. Action: send the proposal by Friday.")
+    orchestrator = WorkflowOrchestrator(db_manager)
+
+    async def scenario():
+        runs = [await orchestrator.execute_full_workflow(dict(CLIENT)) for _ in range(3)]
+        # Re-saving the same profile content under a new id must not change the profile key
+        profile = db_manager.get_client_profile(CLIENT["client_name"])["profile_data"]
+        profile.update(id="profile_resaved", last_updated="2030-01-01T00:00:00")
+        db_manager.save_client_profile(CLIENT["client_name"], profile)
+        return runs + [await orchestrator.execute_full_workflow(dict(CLIENT))]
+
+    runs = asyncio.run(scenario())
+    assert runs[0]["full_results"]["meetings"]["meeting_analysis"]["total_meetings"] == 1
+    for run in runs[2:]:
+        stages = orchestrator.workflow_store.get(run["workflow_id"])["stages"]
+        assert stages["client_profile"]["cached"] is True
+        assert stages["actionable_insights"]["cached"] is True
+
+    metrics = orchestrator.get_stage_cache_metrics()["stages"]
+    assert (metrics["client_profile"]["hits"], metrics["client_profile"]["misses"]) == (2, 2)
+    assert (metrics["actionable_insights"]["hits"], metrics["actionable_insights"]["misses"]) == (2, 2)
+
+def test_profile_change_invalidates_profile_stage(db_manager):
+    orchestrator = WorkflowOrchestrator(db_manager)
+
+    async def scenario():
+        await orchestrator.execute_full_workflow(dict(CLIENT))
+        await orchestrator.execute_full_workflow(dict(CLIENT))
+        profile = db_manager.get_client_profile(CLIENT["client_name"])["profile_data"]
+        profile["company_size"] = "Enterprise (10,000+ employees)"
+        db_manager.save_client_profile(CLIENT["client_name"], profile)
+        return await orchestrator.execute_full_workflow(dict(CLIENT))
+
+    result = asyncio.run(scenario())
+    stages = orchestrator.workflow_store.get(result["workflow_id"])["stages"]
+    assert stages["domain_knowledge"]["cached"] is True
+    assert stages["client_profile"]["cached"] is False
+
+def test_invalidate_rejects_unknown_stage(db_manager):
+    orchestrator = WorkflowOrchestrator(db_manager)
+    with pytest.raises(ValueError):
+        asyncio.run(orchestrator.invalidate_stage_cache("meetings"))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for stage call policies: per-attempt deadlines, retries with backoff,
+circuit breaking, and the outcome recorded for each stage.
+"""
+
+import asyncio
+import time
+import pytest
+from backend.resilience import CircuitBreaker, StagePolicy
+from backend.workflow_orchestrator import BatchCache, WorkflowOrchestrator, WorkflowStage
+from backend.database.db_manager import DatabaseManager
+
+FAST = dict(backoff=0.01, max_backoff=0.01)
+
+@pytest.fixture
+def db_manager():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    return db_manager
+
+def flaky(failures, hang=False):
+    """Stage that fails (raises, or hangs) the first `failures` calls"""
+    calls = []
+
+    async def run(client_data, inputs):
+        calls.append(1)
+        if len(calls) <= failures:
+            if hang:
+                await asyncio.sleep(10)
+            raise ConnectionError("Ollama unreachable")
+        return {"status": "success"}
+
+    return run, calls
+
+def run_stage(orchestrator, stage, workflow_id="wf"):
+    orchestrator.workflow_store.add(workflow_id, {"agent_results": {}, "stages": {}, "current_step": "starting"})
+    failed = asyncio.run(orchestrator._run_stages(workflow_id, {}, [stage]))
+    return failed, orchestrator.workflow_store.get_active(workflow_id)["stages"][stage.name]
+
+def test_hung_stage_times_out(db_manager):
+    orchestrator = WorkflowOrchestrator(db_manager, stage_policy=StagePolicy(timeout=0.05, retries=0))
+    run, calls = flaky(1, hang=True)
+
+    started = time.perf_counter()
+    failed, info = run_stage(orchestrator, WorkflowStage("slow", run))
+
+    assert time.perf_counter() - started < 1
+    assert info["status"] == "failed" and info["outcome"] == "timeout" and info["retries"] == 0
+    assert "timed out" in failed[0]
+
+def test_transient_failures_are_retried(db_manager):
+    orchestrator = WorkflowOrchestrator(db_manager, stage_policy=StagePolicy(timeout=0.05, retries=2, **FAST))
+    run, calls = flaky(2, hang=True)
+
+    failed, info = run_stage(orchestrator, WorkflowStage("flaky", run))
+
+    assert failed == []
+    assert info["status"] == "success" and info["outcome"] == "success" and info["retries"] == 2
+    assert len(calls) == 3
+
+def test_error_results_are_not_retried(db_manager):
+    orchestrator = WorkflowOrchestrator(db_manager, stage_policy=StagePolicy(retries=3, **FAST))
+    calls = []
+
+    async def run(client_data, inputs):
+        calls.append(1)
+        return {"status": "error", "message": "invalid industry"}
+
+    failed, info = run_stage(orchestrator, WorkflowStage("answer", run))
+    assert info["outcome"] == "error" and info["retries"] == 0 and len(calls) == 1
+
+def test_open_circuit_fails_fast(db_manager):
+    orchestrator = WorkflowOrchestrator(
+        db_manager,
+        stage_policy=StagePolicy(),
+        stage_policies={"llm": StagePolicy(retries=1, failure_threshold=2, reset_timeout=60, **FAST)}
+    )
+    run, calls = flaky(100)
+
+    first = run_stage(orchestrator, WorkflowStage("llm", run), "wf1")[1]
+    second = run_stage(orchestrator, WorkflowStage("llm", run), "wf2")[1]
+
+    assert first["outcome"] == "error" and first["retries"] == 1
+    assert second["outcome"] == "short_circuited" and "circuit open" in second["error"]
+    assert len(calls) == 2
+    assert orchestrator.get_circuit_breaker_states()["llm"]["state"] == "open"
+
+def test_breaker_half_open_trial():
+    breaker = CircuitBreaker("agent", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    # Only one trial call while half-open
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+    assert breaker.get_state()["short_circuited"] == 2
+
+def test_timed_out_batch_owner_does_not_cancel_waiters():
+    cache = BatchCache()
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def scenario():
+        owner = asyncio.create_task(asyncio.wait_for(cache.get_or_compute(("k",), slow), 0.05))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_compute(("k",), slow))
+        return await asyncio.gather(owner, waiter, return_exceptions=True)
+
+    owner, waiter = asyncio.run(scenario())
+    assert isinstance(owner, asyncio.TimeoutError)
+    assert isinstance(waiter, RuntimeError)
+
+def test_full_workflow_records_outcomes(db_manager):
+    orchestrator = WorkflowOrchestrator(db_manager)
+    result = asyncio.run(orchestrator.execute_full_workflow({
+        "client_name": "Policy Partners",
+        "industry": "Retail",
+        "problem_statement": "Checkout conversion is dropping",
+        "tech_stack": "React"
+    }))
+
+    stages = orchestrator.workflow_store.get(result["workflow_id"])["stages"]
+    assert {info["outcome"] for info in stages.values()} == {"success"}
+    assert orchestrator.get_circuit_breaker_states()["domain_knowledge"]["state"] == "closed"
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for batch workflow execution: bounded concurrency, per-batch result
+sharing, results streamed in completion order, and the throughput report.
+"""
+
+import asyncio
+import pytest
+from backend.workflow_orchestrator import BatchCache, WorkflowOrchestrator
+from backend.database.db_manager import DatabaseManager
+
+def client(name, industry="Retail", problem="Checkout conversion is dropping"):
+    return {"client_name": name, "industry": industry, "problem_statement": problem, "tech_stack": "React, AWS"}
+
+@pytest.fixture
+def orchestrator():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    return WorkflowOrchestrator(db_manager)
+
+def collect(orchestrator, clients, concurrency):
+    async def scenario():
+        return [item async for item in orchestrator.execute_workflow_batch(clients, concurrency)]
+    return asyncio.run(scenario())
+
+def slow_domain_agent(orchestrator, delays, calls):
+    """Replace domain knowledge with a call that sleeps per industry and counts calls"""
+    process = orchestrator.domain_knowledge_agent.process_domain_knowledge
+    state = {"running": 0, "peak": 0}
+
+    async def process_domain_knowledge(industry, problem_statement, tech_stack):
+        calls.append(industry)
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(delays.get(industry, 0.01))
+        state["running"] -= 1
+        return await process(industry, problem_statement, tech_stack)
+
+    orchestrator.domain_knowledge_agent.process_domain_knowledge = process_domain_knowledge
+    return state
+
+def test_batch_streams_results_and_report(orchestrator):
+    calls = []
+    slow_domain_agent(orchestrator, {"Healthcare": 0.2}, calls)
+    clients = [client("Slow Clinic", "Healthcare", "Patient records")] + [client(f"Shop {i}") for i in range(5)]
+
+    items = collect(orchestrator, clients, concurrency=3)
+    results, report = items[:-1], items[-1]
+
+    assert [item["type"] for item in results] == ["result"] * 6
+    assert {item["index"] for item in results} == set(range(6))
+    # The slow client started first but is streamed after the quick ones that finished earlier
+    assert results[-1]["client_name"] == "Slow Clinic"
+    assert all(item["status"] == "completed" for item in results)
+    assert len({item["result"]["workflow_id"] for item in results}) == 6
+
+    assert report["type"] == "report"
+    assert report["total_clients"] == 6 and report["completed"] == 6 and report["failed"] == 0
+    assert report["throughput_per_second"] > 0
+    assert report["elapsed"] < report["sequential_time"]
+
+def test_domain_knowledge_is_shared_within_a_batch(orchestrator):
+    calls = []
+    slow_domain_agent(orchestrator, {"Retail": 0.05}, calls)
+    clients = [client(f"Shop {i}") for i in range(8)] + [client("Clinic", "Healthcare", "Patient records")]
+
+    report = collect(orchestrator, clients, concurrency=4)[-1]
+
+    # Retail clients in flight together await one call instead of starting their own
+    assert sorted(calls) == ["Healthcare", "Retail"]
+    assert report["cache"]["hits"] >= 7
+    assert report["completed"] == 9
+
+def test_concurrency_limit_is_respected(orchestrator):
+    calls = []
+    state = slow_domain_agent(orchestrator, {}, calls)
+    clients = [client(f"Client {i}", industry=f"Industry {i}") for i in range(10)]
+
+    collect(orchestrator, clients, concurrency=2)
+
+    assert len(calls) == 10
+    assert state["peak"] == 2
+
+def test_failed_results_are_not_cached():
+    cache = BatchCache()
+    results = iter([{"status": "error"}, {"status": "success", "value": 1}])
+
+    async def compute():
+        return next(results)
+
+    async def scenario():
+        first = await cache.get_or_compute(("k",), compute)
+        second = await cache.get_or_compute(("k",), compute)
+        third = await cache.get_or_compute(("k",), compute)
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert first["status"] == "error"
+    assert second == third == {"status": "success", "value": 1}
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 2
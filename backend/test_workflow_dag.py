@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the workflow stage DAG: independent stages overlap, dependents wait
+for their inputs, and failures skip only the stages that need the failed result.
+"""
+
+import asyncio
+import pytest
+from backend.workflow_orchestrator import WorkflowOrchestrator, WorkflowStage
+from backend.database.db_manager import DatabaseManager
+
+CLIENT = {
+    "client_name": "Acme Retail",
+    "industry": "Retail",
+    "problem_statement": "Checkout conversion is dropping on mobile",
+    "tech_stack": "React, Node.js, AWS"
+}
+
+@pytest.fixture
+def orchestrator():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    return WorkflowOrchestrator(db_manager)
+
+def sleeper(seconds, status="success", log=None, name=None):
+    async def run(client_data, inputs):
+        if log is not None:
+            log.append(("start", name, sorted(inputs)))
+        await asyncio.sleep(seconds)
+        if log is not None:
+            log.append(("end", name))
+        if status == "raise":
+            raise RuntimeError(f"{name} exploded")
+        return {"status": status, "message": f"{name} {status}", "inputs": inputs}
+    return run
+
+def run_dag(orchestrator, stages):
+    orchestrator.workflow_store.add("wf", {"agent_results": {}, "stages": {}, "current_step": "starting"})
+    failed = asyncio.run(orchestrator._run_stages("wf", CLIENT, stages))
+    return failed, orchestrator.workflow_store.get_active("wf")
+
+def diamond(log, a="success", b="success", b_required=True):
+    return [
+        WorkflowStage("a", sleeper(0.1, a, log, "a")),
+        WorkflowStage("b", sleeper(0.1, b, log, "b"), required=b_required),
+        WorkflowStage("c", sleeper(0.05, "success", log, "c"), inputs=("a", "b"))
+    ]
+
+def test_independent_stages_overlap_and_dependents_wait(orchestrator):
+    log = []
+    failed, state = run_dag(orchestrator, diamond(log))
+
+    assert failed == []
+    # a and b both start before either finishes; c starts after both end, with their results
+    assert [entry[:2] for entry in log[:2]] == [("start", "a"), ("start", "b")]
+    assert log[-2] == ("start", "c", ["a", "b"])
+    assert state["agent_results"]["c"]["inputs"]["a"]["message"] == "a success"
+
+    assert state["critical_path"][-1] == "c" and len(state["critical_path"]) == 2
+    assert state["sequential_time"] == pytest.approx(0.25, abs=0.05)
+    assert state["stages_wall_time"] < 0.22
+    assert state["parallel_speedup"] > 1.1
+    assert set(state["stage_durations"]) == {"a", "b", "c"}
+
+def test_required_failure_skips_dependents_only(orchestrator):
+    log = []
+    failed, state = run_dag(orchestrator, diamond(log, a="raise"))
+
+    assert state["stages"]["a"]["status"] == "failed"
+    assert "exploded" in state["stages"]["a"]["error"]
+    assert state["stages"]["b"]["status"] == "success"
+    assert state["stages"]["c"]["status"] == "skipped"
+    assert not any(entry[1] == "c" for entry in log)
+    assert len(failed) == 2 and failed[0].startswith("a failed")
+
+def test_optional_failure_still_feeds_dependents(orchestrator):
+    failed, state = run_dag(orchestrator, diamond(None, b="error", b_required=False))
+
+    assert failed == []
+    assert state["stages"]["b"]["status"] == "failed"
+    assert state["stages"]["c"]["status"] == "success"
+    assert state["agent_results"]["c"]["inputs"]["b"]["status"] == "error"
+
+def test_stages_must_be_declared_after_their_inputs(orchestrator):
+    with pytest.raises(ValueError, match="undeclared"):
+        run_dag(orchestrator, [WorkflowStage("c", sleeper(0), inputs=("a",)), WorkflowStage("a", sleeper(0))])
+
+def test_full_workflow_records_stage_timings(orchestrator):
+    result = asyncio.run(orchestrator.execute_full_workflow(CLIENT))
+
+    assert result["status"] == "completed", result
+    state = orchestrator.workflow_store.get(result["workflow_id"])
+    assert set(state["stages"]) == {"domain_knowledge", "client_profile", "meetings", "actionable_insights"}
+    assert state["stages"]["actionable_insights"]["status"] == "success"
+    assert state["critical_path"][-1] == "actionable_insights"
+    assert result["timing"]["stage_durations"] == state["stage_durations"]
+    assert state["current_step"] == "completed"
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the background workflow queue: immediate ids, worker pool limits,
+progress by step, cancellation and backpressure at the maximum depth.
+"""
+
+import asyncio
+import pytest
+from backend.workflow_orchestrator import WorkflowOrchestrator
+from backend.workflow_queue import QueueFullError, WorkflowJobQueue
+from backend.database.db_manager import DatabaseManager
+
+def client(name):
+    return {"client_name": name, "industry": "Retail", "problem_statement": "Checkout", "tech_stack": "React"}
+
+@pytest.fixture
+def orchestrator():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    orchestrator = WorkflowOrchestrator(db_manager)
+    process = orchestrator.domain_knowledge_agent.process_domain_knowledge
+    orchestrator.release = None
+
+    async def gated_domain_knowledge(*args):
+        # Block until the test opens the gate, so queued/running states can be observed
+        await orchestrator.release.wait()
+        return await process(*args)
+
+    orchestrator.domain_knowledge_agent.process_domain_knowledge = gated_domain_knowledge
+    return orchestrator
+
+async def until(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+def state_of(orchestrator, workflow_id):
+    return orchestrator.workflow_store.get(workflow_id)["status"]
+
+def test_submit_returns_immediately_and_workers_drain_the_queue(orchestrator):
+    async def scenario():
+        orchestrator.release = asyncio.Event()
+        queue = WorkflowJobQueue(orchestrator, workers=2, max_depth=10)
+        ids = [queue.submit(client(f"Client {i}")) for i in range(5)]
+        assert all(state_of(orchestrator, workflow_id) == "queued" for workflow_id in ids)
+
+        await until(lambda: queue.get_metrics()["running"] == 2)
+        assert queue.get_metrics()["queued"] == 3
+        assert queue.get_position(ids[2]) == 1 and queue.get_position(ids[0]) is None
+
+        status = await orchestrator.get_workflow_status(ids[0])
+        assert status["progress"]["state"] == "running"
+        assert "domain_knowledge" in status["progress"]["current_step"]
+        assert status["progress"]["total_stages"] == 4
+
+        orchestrator.release.set()
+        await until(lambda: queue.get_metrics()["completed"] == 5)
+        status = await orchestrator.get_workflow_status(ids[-1])
+        await queue.stop()
+        return ids, status
+
+    ids, status = asyncio.run(scenario())
+    assert len(set(ids)) == 5
+    assert all(state_of(orchestrator, workflow_id) == "completed" for workflow_id in ids)
+    assert status["progress"]["percent"] == 100 and status["progress"]["current_step"] == "completed"
+
+def test_cancel_queued_and_running_workflows(orchestrator):
+    async def scenario():
+        orchestrator.release = asyncio.Event()
+        queue = WorkflowJobQueue(orchestrator, workers=1, max_depth=10)
+        running, queued, survivor = (queue.submit(client(name)) for name in ("A", "B", "C"))
+        await until(lambda: state_of(orchestrator, running) == "running")
+
+        assert await queue.cancel(queued) and await queue.cancel(running)
+        await until(lambda: state_of(orchestrator, running) == "cancelled")
+        orchestrator.release.set()
+        await until(lambda: state_of(orchestrator, survivor) == "completed")
+
+        assert not await queue.cancel(survivor)
+        metrics = queue.get_metrics()
+        await queue.stop()
+        return running, queued, metrics
+
+    running, queued, metrics = asyncio.run(scenario())
+    assert state_of(orchestrator, queued) == "cancelled"
+    assert "end_time" in orchestrator.workflow_store.get(running)
+    assert metrics["cancelled"] == 2 and metrics["completed"] == 1
+
+def test_submissions_beyond_max_depth_are_rejected(orchestrator):
+    async def scenario():
+        orchestrator.release = asyncio.Event()
+        queue = WorkflowJobQueue(orchestrator, workers=1, max_depth=2)
+        first = queue.submit(client("A"))
+        await until(lambda: state_of(orchestrator, first) == "running")
+        queue.submit(client("B"))
+        queue.submit(client("C"))
+        with pytest.raises(QueueFullError):
+            queue.submit(client("D"))
+
+        orchestrator.release.set()
+        await until(lambda: queue.get_metrics()["queued"] == 0)
+        queue.submit(client("E"))
+        metrics = queue.get_metrics()
+        await queue.stop()
+        return metrics
+
+    metrics = asyncio.run(scenario())
+    assert metrics["rejected"] == 1 and metrics["submitted"] == 4
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for resumable workflows: stage results are checkpointed as they succeed,
+and resuming a failed workflow re-runs only the stages that did not.
+"""
+
+import asyncio
+import pytest
+from backend.workflow_orchestrator import WorkflowOrchestrator
+from backend.database.db_manager import DatabaseManager
+from backend.database.stage_cache import StageCache
+
+CLIENT = {
+    "client_name": "Resume Retail",
+    "industry": "Retail",
+    "problem_statement": "Checkout conversion is dropping",
+    "tech_stack": "React, AWS"
+}
+
+@pytest.fixture
+def orchestrator():
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    # No stage caching, so every stage that runs calls its agent
+    return WorkflowOrchestrator(db_manager, stage_cache=StageCache(max_entries=0))
+
+def count_calls(agent, method, calls):
+    original = getattr(agent, method)
+
+    async def counted(*args, **kwargs):
+        calls.append(method)
+        return await original(*args, **kwargs)
+
+    setattr(agent, method, counted)
+
+def flaky_insights(orchestrator, failures):
+    """Make insight generation fail the first `failures` times"""
+    original = orchestrator.actionable_insights_agent.generate_insights
+    state = {"calls": 0}
+
+    async def generate_insights(*args):
+        state["calls"] += 1
+        if state["calls"] <= failures:
+            return {"status": "error", "message": "LLM timed out"}
+        return await original(*args)
+
+    orchestrator.actionable_insights_agent.generate_insights = generate_insights
+    return state
+
+def test_resume_skips_finished_stages(orchestrator):
+    calls = []
+    count_calls(orchestrator.domain_knowledge_agent, "process_domain_knowledge", calls)
+    count_calls(orchestrator.client_profile_agent, "build_client_profile", calls)
+    insights = flaky_insights(orchestrator, failures=1)
+
+    async def scenario():
+        failed = await orchestrator.execute_full_workflow(dict(CLIENT))
+        checkpoints = orchestrator.workflow_store.get_checkpoints(failed["workflow_id"])
+        resumed = await orchestrator.resume_workflow(failed["workflow_id"])
+        return failed, checkpoints, resumed
+
+    failed, checkpoints, resumed = asyncio.run(scenario())
+    workflow_id = failed["workflow_id"]
+
+    assert failed["status"] == "error"
+    assert set(checkpoints) == {"domain_knowledge", "client_profile", "meetings"}
+
+    assert resumed["status"] == "completed" and resumed["workflow_id"] == workflow_id
+    assert calls == ["process_domain_knowledge", "build_client_profile"]
+    assert insights["calls"] == 2
+
+    record = orchestrator.workflow_store.get(workflow_id)
+    assert record["attempts"] == 2
+    assert record["stages"]["domain_knowledge"]["resumed"] is True
+    assert "resumed" not in record["stages"]["actionable_insights"]
+    assert orchestrator.workflow_store.get_results(workflow_id)["agent_results"]["domain_knowledge"]["status"] == "success"
+    # Completed workflows keep their results in workflow_runs only
+    assert orchestrator.workflow_store.get_checkpoints(workflow_id) == {}
+    assert orchestrator.workflow_store.count_by_status() == {"completed": 1}
+
+def test_only_failed_or_cancelled_workflows_resume(orchestrator):
+    async def scenario():
+        completed = await orchestrator.execute_full_workflow(dict(CLIENT))
+        return (await orchestrator.resume_workflow(completed["workflow_id"]),
+                await orchestrator.resume_workflow("workflow_missing"))
+
+    completed, missing = asyncio.run(scenario())
+    assert completed["status"] == "error" and "only failed or cancelled" in completed["message"]
+    assert missing["status"] == "error" and "not found" in missing["message"]
+
+def test_cancelled_queued_workflow_resumes_from_scratch(orchestrator):
+    async def scenario():
+        workflow_id = orchestrator.create_workflow(dict(CLIENT))
+        await orchestrator.mark_workflow_cancelled(workflow_id)
+        return await orchestrator.resume_workflow(workflow_id)
+
+    result = asyncio.run(scenario())
+    assert result["status"] == "completed"
+    stages = orchestrator.workflow_store.get(result["workflow_id"])["stages"]
+    assert not any(stage.get("resumed") for stage in stages.values())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for WorkflowStore: live records for active workflows, compaction and
+spill to workflow_runs when they finish, and the bounded LRU/TTL memory tier.
+"""
+
+import time
+import pytest
+from database.db_manager import DatabaseManager
+from database.workflow_store import WorkflowStore
+
+def make_db(path=":memory:"):
+    db_manager = DatabaseManager(path)
+    db_manager.initialize_database()
+    return db_manager
+
+def add_finished(store, workflow_id, client_name="Acme", status="completed", queued_at="2024-01-01T00:00:00"):
+    store.add(workflow_id, {
+        "status": "running",
+        "queued_at": queued_at,
+        "client_data": {"client_name": client_name, "industry": "Retail"},
+        "agent_results": {"domain_knowledge": {"status": "success", "payload": "x" * 1000}},
+        "stages": {"domain_knowledge": {"status": "success", "duration": 0.1}},
+        "current_step": "actionable_insights"
+    })
+    store.update(workflow_id, {"status": status, "current_step": status})
+    return store.finish(workflow_id, {"domain_knowledge": {"industry": "Retail"}})
+
+def test_finished_workflows_are_compacted_and_spilled():
+    store = WorkflowStore(make_db())
+    compact = add_finished(store, "wf-1")
+
+    assert "agent_results" not in compact and "client_data" not in compact
+    assert compact["client_name"] == "Acme" and compact["summary"]["domain_knowledge"]["industry"] == "Retail"
+    assert store.get("wf-1") is compact
+    assert store.get_results("wf-1")["agent_results"]["domain_knowledge"]["payload"] == "x" * 1000
+    with pytest.raises(KeyError):
+        store.get_active("wf-1")
+
+def test_only_terminal_workflows_can_finish():
+    store = WorkflowStore(make_db())
+    store.add("wf-1", {"status": "running", "client_data": {}})
+    with pytest.raises(ValueError):
+        store.finish("wf-1")
+    assert store.get("wf-1")["status"] == "running"
+
+def test_memory_tier_is_bounded_and_misses_read_from_disk():
+    store = WorkflowStore(make_db(), max_cached=3)
+    for i in range(10):
+        add_finished(store, f"wf-{i}")
+
+    metrics = store.get_metrics()
+    assert metrics["cached"] == 3 and metrics["active"] == 0 and metrics["evictions"] == 7
+
+    record = store.get("wf-0")
+    assert record["status"] == "completed" and record["client_name"] == "Acme"
+    assert store.get_metrics()["cache_misses"] >= 1
+    assert store.get("missing") is None and "missing" not in store
+
+def test_expired_entries_are_reloaded():
+    store = WorkflowStore(make_db(), ttl=0.05)
+    first = add_finished(store, "wf-1")
+    time.sleep(0.1)
+    reloaded = store.get("wf-1")
+    assert reloaded is not first and reloaded == first
+
+def test_finished_workflows_survive_a_restart(tmp_path):
+    path = str(tmp_path / "workflows.db")
+    db_manager = make_db(path)
+    add_finished(WorkflowStore(db_manager), "wf-1", status="failed")
+    db_manager.close()
+
+    store = WorkflowStore(make_db(path))
+    assert store.get("wf-1")["status"] == "failed"
+    assert store.count_by_status() == {"failed": 1}
+
+def test_latest_for_client_and_status_counts():
+    store = WorkflowStore(make_db())
+    add_finished(store, "wf-old", queued_at="2024-01-01T00:00:00")
+    add_finished(store, "wf-new", queued_at="2024-02-01T00:00:00", status="failed")
+    add_finished(store, "wf-other", client_name="Globex")
+
+    assert store.latest_for_client("  ACME ")[0] == "wf-new"
+    store.add("wf-live", {"status": "running", "queued_at": "2024-03-01T00:00:00", "client_data": {"client_name": "Acme"}})
+    assert store.latest_for_client("acme")[0] == "wf-live"
+    assert store.latest_for_client("Initech") is None
+    assert store.count_by_status() == {"completed": 2, "failed": 1, "running": 1}
+    assert [item["workflow_id"] for item in store.list_workflows(status="running")["items"]] == ["wf-live"]
+
+def test_workflow_ids_are_unique_and_time_ordered():
+    store = WorkflowStore(make_db())
+    ids = [store.new_id() for _ in range(5000)]
+    assert len(set(ids)) == 5000
+    assert ids == sorted(ids)
+    assert all(len(workflow_id) == len("workflow_") + 26 for workflow_id in ids)
+
+    earlier = store.new_id()
+    time.sleep(0.002)
+    assert store.new_id() > earlier
+
+def test_client_index_and_counts_follow_transitions():
+    store = WorkflowStore(make_db())
+    first, second = store.new_id(), store.new_id()
+    store.add(first, {"status": "queued", "client_data": {"client_name": "Acme"}})
+    store.add(second, {"status": "queued", "client_data": {"client_name": " acme "}})
+    assert store.count_by_status() == {"queued": 2}
+
+    store.update(first, {"status": "running"})
+    assert store.count_by_status() == {"queued": 1, "running": 1}
+    store.update(first, {"status": "completed"})
+    store.finish(first)
+    assert store.count_by_status() == {"queued": 1, "completed": 1}
+
+    assert store.get_client_workflow_ids("ACME") == [second, first]
+    assert store.get_client_workflow_ids("acme", limit=1) == [second]
+    assert store.latest_for_client("Acme")[1]["status"] == "queued"
+
+def test_index_is_rebuilt_from_disk(tmp_path):
+    path = str(tmp_path / "workflows.db")
+    db_manager = make_db(path)
+    store = WorkflowStore(db_manager)
+    ids = [store.new_id() for _ in range(3)]
+    for workflow_id in ids:
+        add_finished(store, workflow_id)
+    db_manager.close()
+
+    restarted = WorkflowStore(make_db(path))
+    assert restarted.get_client_workflow_ids("acme") == ids[::-1]
+    assert restarted.count_by_status() == {"completed": 3}
+
+def test_listing_pages_across_active_and_finished_workflows():
+    store = WorkflowStore(make_db())
+    ids = [store.new_id() for _ in range(7)]
+    for i, workflow_id in enumerate(ids[:5]):
+        add_finished(store, workflow_id, client_name="Acme" if i % 2 else "Globex", status="failed" if i == 4 else "completed")
+    for workflow_id in ids[5:]:
+        store.add(workflow_id, {"status": "running", "client_data": {"client_name": "Acme"}})
+
+    pages, cursor = [], None
+    while True:
+        page = store.list_workflows(limit=3, cursor=cursor)
+        pages.append([item["workflow_id"] for item in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert [workflow_id for page in pages for workflow_id in page] == ids[::-1]
+    assert [len(page) for page in pages] == [3, 3, 1]
+
+    running = store.list_workflows(status="running")["items"]
+    assert [item["workflow_id"] for item in running] == ids[6:4:-1]
+    assert running[0]["client_name"] == "Acme" and running[0]["status"] == "running"
+    assert [item["workflow_id"] for item in store.list_workflows(status="failed")["items"]] == [ids[4]]
+    assert [item["workflow_id"] for item in store.list_workflows(client_name="acme ")["items"]] == [ids[6], ids[5], ids[3], ids[1]]
+    assert store.list_workflows(status="queued")["items"] == []
+
+    with pytest.raises(ValueError):
+        store.list_workflows(status="paused")
+    with pytest.raises(ValueError):
+        store.list_workflows(cursor="not-a-cursor")
@@ -1,8 +1,10 @@
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+import functools
 import json
+import time
 
 # Import all agents
 from .agents.conversational_setup import ConversationalSetupAgent
@@ -11,168 +13,627 @@ from .agents.domain_knowledge import DomainKnowledgeAgent
 from .agents.client_profile import ClientProfileAgent
 from .agents.actionable_insights import ActionableInsightsAgent
 from .agents.meetings import MeetingsAgent
+from .agents.llm_cache import LLMResponseCache
+from .agents.registry import (
+    ActionableInsightsInput, AgentRegistry, ClientProfileInput, DomainKnowledgeInput, MeetingAnalysisInput
+)
+from .database.repositories import DashboardRepository
+from .database.stage_cache import StageCache, stage_cache_key
+from .database.workflow_store import WorkflowStore
+from .resilience import CircuitBreaker, StagePolicy
 
 logger = logging.getLogger(__name__)
 
+class WorkflowStage:
+    """A workflow step, the stages whose results it consumes, and whether the workflow needs it to succeed"""
+    
+    def __init__(self, name: str, run: Callable[[Dict[str, Any], Dict[str, Dict]], Awaitable[Dict[str, Any]]],
+                 inputs: Tuple[str, ...] = (), required: bool = True):
+        self.name = name
+        self.run = run
+        self.inputs = tuple(inputs)
+        self.required = required
+
+class BatchCache:
+    """Results shared by the workflows of one batch.
+    
+    Entries hold futures, so clients that need the same result while it is still being
+    computed await the one in-flight call instead of starting their own. Failed calls
+    are evicted so a later client can retry them.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[Tuple, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    async def get_or_compute(self, key: Tuple, compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Return the cached result for key, computing it once if it is missing"""
+        future = self._entries.get(key)
+        if future is not None:
+            self.hits += 1
+            return dict(await asyncio.shield(future))
+        
+        self.misses += 1
+        future = self._entries[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await compute()
+        except BaseException as e:
+            del self._entries[key]
+            if not isinstance(e, Exception):
+                # The owner was cancelled (e.g. its stage timed out); the others get a plain
+                # failure they can retry rather than a cancellation of their own workflow
+                e = RuntimeError(f"Shared {key[0]} call was cancelled")
+            future.set_exception(e)
+            # Nobody may be waiting on the future; retrieve the exception so it is not logged
+            future.exception()
+            raise
+        if result.get("status") != "success":
+            del self._entries[key]
+        future.set_result(result)
+        return dict(result)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts for the batch"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
 class WorkflowOrchestrator:
     """Orchestrates the workflow between all agents in the K-Square Programme Onboarding system"""
     
-    def __init__(self, db_manager):
+    # Stages whose results depend only on their inputs and can be served from the stage cache
+    CACHED_STAGES = ("domain_knowledge", "client_profile", "actionable_insights")
+    
+    def __init__(self, db_manager, stage_cache: Optional[StageCache] = None,
+                 stage_policy: Optional[StagePolicy] = None, stage_policies: Optional[Dict[str, StagePolicy]] = None,
+                 llm_cache: Optional[LLMResponseCache] = None):
         self.db_manager = db_manager
         
         # Initialize all agents
         self.conversational_setup_agent = ConversationalSetupAgent(db_manager)
-        self.natural_conversational_agent = NaturalConversationalAgent(db_manager)
+        self.natural_conversational_agent = NaturalConversationalAgent(db_manager, response_cache=llm_cache)
         self.domain_knowledge_agent = DomainKnowledgeAgent(db_manager)
         self.client_profile_agent = ClientProfileAgent(db_manager)
         self.actionable_insights_agent = ActionableInsightsAgent(db_manager)
         self.meetings_agent = MeetingsAgent(db_manager)
         
-        self.workflow_state = {}
+        # Single-agent runs and workflow stages dispatch through the registry
+        self.agents = AgentRegistry()
+        self.agents.register(
+            "domain_knowledge", self.domain_knowledge_agent, "process_domain_knowledge", DomainKnowledgeInput,
+            "Industry best practices, challenges and recommendations for a problem and tech stack"
+        )
+        self.agents.register(
+            "client_profile", self.client_profile_agent, "build_client_profile", ClientProfileInput,
+            "Build or enhance a client's profile"
+        )
+        self.agents.register(
+            "meetings", self.meetings_agent, "analyze_meeting", MeetingAnalysisInput,
+            "Sentiment, action items, topics and engagement of a meeting transcript"
+        )
+        self.agents.register(
+            "actionable_insights", self.actionable_insights_agent, "generate_insights", ActionableInsightsInput,
+            "Recommendations synthesized from domain, profile and meeting results"
+        )
+        
+        self.dashboard_repository = DashboardRepository(db_manager)
+        self.workflow_store = WorkflowStore(db_manager)
+        self.stage_cache = stage_cache if stage_cache is not None else StageCache(db_manager)
+        
+        # Call policy for every stage, with optional per-stage overrides, and one circuit breaker per stage agent
+        self.stage_policy = stage_policy or StagePolicy()
+        self.stage_policies = dict(stage_policies or {})
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
         
         logger.info("WorkflowOrchestrator initialized with all agents")
     
-    async def execute_full_workflow(self, client_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute the complete workflow for a new client onboarding"""
-        workflow_id = f"workflow_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    def create_workflow(self, client_data: Dict[str, Any]) -> str:
+        """Register a queued workflow for client_data and return its id"""
+        workflow_id = self.workflow_store.new_id()
+        self.workflow_store.add(workflow_id, {
+            "status": "queued",
+            "queued_at": datetime.now().isoformat(),
+            "client_data": client_data,
+            "agent_results": {},
+            "stages": {},
+            "current_step": "queued"
+        })
+        return workflow_id
+    
+    async def mark_workflow_cancelled(self, workflow_id: str):
+        """Record that a queued or running workflow was cancelled"""
+        try:
+            workflow = self.workflow_store.get_active(workflow_id)
+        except KeyError:
+            # Already finished (or cancelled) and handed to the store
+            return
+        update = {"status": "cancelled", "end_time": datetime.now().isoformat()}
+        if "start_time" in workflow:
+            update["execution_time"] = (datetime.now() - datetime.fromisoformat(workflow["start_time"])).total_seconds()
+        self.workflow_store.update(workflow_id, update)
+        logger.info(f"Workflow {workflow_id} cancelled during {workflow.get('current_step')}")
+        await self._finish_workflow(workflow_id)
+    
+    async def reopen_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """Queue a failed or cancelled workflow again; it resumes from its stage checkpoints when run.
+        
+        Returns the reopened record. Raises KeyError for an unknown workflow and ValueError
+        if it cannot be resumed.
+        """
+        record = await self.workflow_store.aio.get(workflow_id)
+        attempts = (record or {}).get("attempts", 1) + 1
+        reopened = await self.workflow_store.aio.reopen(workflow_id, {
+            "status": "queued",
+            "current_step": "queued",
+            "resumed_at": datetime.now().isoformat(),
+            "attempts": attempts,
+            "agent_results": {},
+            "stages": {},
+            "error": None,
+            "end_time": None,
+            "execution_time": None
+        })
+        logger.info(f"Workflow {workflow_id} reopened for attempt {attempts}")
+        return reopened
+    
+    async def resume_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """Re-run a failed or cancelled workflow, skipping the stages that already succeeded"""
+        try:
+            record = await self.reopen_workflow(workflow_id)
+        except KeyError:
+            return {"status": "error", "message": f"Workflow {workflow_id} not found"}
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+        return await self.execute_full_workflow(record["client_data"], workflow_id=workflow_id)
+    
+    async def _finish_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """Hand a workflow that reached a terminal status to the store, which spills its full results to disk"""
+        summary = self._generate_workflow_summary(workflow_id)
+        await self.workflow_store.aio.finish(workflow_id, summary["summary"])
+        return summary
+    
+    async def execute_full_workflow(self, client_data: Dict[str, Any], cache: Optional[BatchCache] = None,
+                                    workflow_id: Optional[str] = None) -> Dict[str, Any]:
+        """Execute the complete workflow for a new client onboarding (or a workflow queued by create_workflow)"""
+        if workflow_id is None:
+            workflow_id = self.create_workflow(client_data)
         start_time = datetime.now()
         
         logger.info(f"Starting full workflow {workflow_id} for client: {client_data.get('client_name', 'Unknown')}")
         
+        workflow = self.workflow_store.get_active(workflow_id)
         try:
             # Initialize workflow state
-            self.workflow_state[workflow_id] = {
+            self.workflow_store.update(workflow_id, {
                 "status": "running",
                 "start_time": start_time.isoformat(),
-                "client_data": client_data,
-                "agent_results": {},
-                "current_step": "domain_knowledge"
-            }
-            
-            # Step 1: Domain Knowledge Analysis
-            logger.info(f"Workflow {workflow_id}: Starting Domain Knowledge Analysis")
-            domain_result = await self.domain_knowledge_agent.process_domain_knowledge(
-                client_data.get("industry", ""),
-                client_data.get("problem_statement", ""),
-                client_data.get("tech_stack", "")
-            )
-            self.workflow_state[workflow_id]["agent_results"]["domain_knowledge"] = domain_result
-            self.workflow_state[workflow_id]["current_step"] = "client_profile"
-            
-            if domain_result.get("status") != "success":
-                raise Exception(f"Domain Knowledge Analysis failed: {domain_result.get('message')}")
-            
-            # Step 2: Client Profile Building
-            logger.info(f"Workflow {workflow_id}: Starting Client Profile Building")
-            profile_result = await self.client_profile_agent.build_client_profile(
-                client_data.get("client_name", ""),
-                client_data.get("industry", ""),
-                client_data.get("problem_statement", ""),
-                client_data.get("tech_stack", "")
-            )
-            self.workflow_state[workflow_id]["agent_results"]["client_profile"] = profile_result
-            self.workflow_state[workflow_id]["current_step"] = "meetings_analysis"
-            
-            # Save client profile to database if successful
-            if profile_result.get("status") == "success" and profile_result.get("client_profile"):
-                try:
-                    self.db_manager.save_client_profile(
-                        client_data.get("client_name", ""),
-                        profile_result["client_profile"]
-                    )
-                    logger.info(f"Client profile saved to database for {client_data.get('client_name', '')}")
-                except Exception as save_error:
-                    logger.error(f"Failed to save client profile: {save_error}")
-            
-            if profile_result.get("status") != "success":
-                raise Exception(f"Client Profile Building failed: {profile_result.get('message')}")
-            
-            # Step 3: Meetings Analysis (if meeting data available)
-            logger.info(f"Workflow {workflow_id}: Starting Meetings Analysis")
-            meeting_result = await self._analyze_meetings_for_client(client_data.get("client_name", ""))
-            self.workflow_state[workflow_id]["agent_results"]["meetings"] = meeting_result
-            self.workflow_state[workflow_id]["current_step"] = "actionable_insights"
+                "current_step": "starting"
+            })
             
-            # Step 5: Generate Actionable Insights
-            logger.info(f"Workflow {workflow_id}: Generating Actionable Insights")
-            insights_result = await self.actionable_insights_agent.generate_insights(
-                client_data.get("client_name", ""),
-                domain_result,
-                profile_result,
-                meeting_result
-            )
-            self.workflow_state[workflow_id]["agent_results"]["actionable_insights"] = insights_result
-            self.workflow_state[workflow_id]["current_step"] = "completed"
+            # Only a resumed workflow can have checkpoints to restore
+            checkpoints = {}
+            if workflow.get("attempts", 1) > 1:
+                checkpoints = await self.workflow_store.aio.get_checkpoints(workflow_id)
             
-            if insights_result.get("status") != "success":
-                raise Exception(f"Actionable Insights generation failed: {insights_result.get('message')}")
+            failed = await self._run_stages(workflow_id, client_data, self._onboarding_stages(cache), checkpoints)
+            if failed:
+                raise Exception("; ".join(failed))
             
             # Finalize workflow
             end_time = datetime.now()
             execution_time = (end_time - start_time).total_seconds()
             
-            self.workflow_state[workflow_id].update({
+            self.workflow_store.update(workflow_id, {
                 "status": "completed",
+                "current_step": "completed",
                 "end_time": end_time.isoformat(),
                 "execution_time": execution_time
             })
             
-            # Generate final summary
-            final_result = self._generate_workflow_summary(workflow_id)
+            # Generate final summary and compact the stored state
+            final_result = await self._finish_workflow(workflow_id)
             
             logger.info(f"Workflow {workflow_id} completed successfully in {execution_time:.2f} seconds")
             return final_result
             
+        except asyncio.CancelledError:
+            await self.mark_workflow_cancelled(workflow_id)
+            raise
         except Exception as e:
             logger.error(f"Workflow {workflow_id} failed: {e}")
-            self.workflow_state[workflow_id].update({
+            self.workflow_store.update(workflow_id, {
                 "status": "failed",
                 "error": str(e),
-                "end_time": datetime.now().isoformat()
+                "end_time": datetime.now().isoformat(),
+                "execution_time": (datetime.now() - start_time).total_seconds()
             })
+            partial_results = workflow.get("agent_results", {})
+            await self._finish_workflow(workflow_id)
             
             return {
                 "status": "error",
                 "workflow_id": workflow_id,
                 "message": f"Workflow execution failed: {str(e)}",
-                "partial_results": self.workflow_state[workflow_id].get("agent_results", {})
+                "partial_results": partial_results
             }
     
-    async def execute_single_agent(self, agent_name: str, **kwargs) -> Dict[str, Any]:
-        """Execute a single agent independently"""
-        logger.info(f"Executing single agent: {agent_name}")
+    def _onboarding_stages(self, cache: Optional[BatchCache] = None) -> List[WorkflowStage]:
+        """Stages of the onboarding workflow; only actionable insights waits on the others"""
+        return [
+            WorkflowStage("domain_knowledge", functools.partial(self._domain_knowledge_stage, cache=cache)),
+            WorkflowStage("client_profile", self._client_profile_stage),
+            # Insights are still generated from an error result when meeting analysis fails
+            WorkflowStage("meetings", functools.partial(self._meetings_stage, cache=cache), required=False),
+            WorkflowStage(
+                "actionable_insights",
+                self._actionable_insights_stage,
+                inputs=("domain_knowledge", "client_profile", "meetings")
+            )
+        ]
+    
+    async def _run_stages(self, workflow_id: str, client_data: Dict[str, Any], stages: List[WorkflowStage],
+                          checkpoints: Optional[Dict[str, Dict]] = None) -> List[str]:
+        """Run stages as a DAG: each starts once its inputs finish, independent stages run concurrently.
         
-        try:
-            if agent_name == "domain_knowledge":
-                return await self.domain_knowledge_agent.analyze_domain(
-                    kwargs.get("industry", ""),
-                    kwargs.get("problem_statement", ""),
-                    kwargs.get("tech_stack", [])
-                )
+        Results land in the live record's agent_results and per-stage timings in its "stages".
+        Stages are called under their StagePolicy (see _call_stage). A stage fails when it raises,
+        times out, is short-circuited or returns a non-success status; stages that need a failed
+        required stage are skipped. Each successful result is checkpointed, and stages found in
+        checkpoints are restored instead of run. Returns the failure messages of required stages.
+        """
+        checkpoints = checkpoints or {}
+        state = self.workflow_store.get_active(workflow_id)
+        results = state["agent_results"]
+        stage_state = state["stages"]
+        by_name: Dict[str, WorkflowStage] = {}
+        for stage in stages:
+            unknown = [name for name in stage.inputs if name not in by_name]
+            if unknown:
+                raise ValueError(f"Stage {stage.name} depends on undeclared stages: {', '.join(unknown)}")
+            by_name[stage.name] = stage
+        
+        state["total_stages"] = len(stages)
+        running = set()
+        tasks: Dict[str, asyncio.Task] = {}
+        workflow_started = time.perf_counter()
+        
+        async def run_stage(stage: WorkflowStage):
+            if stage.name in checkpoints:
+                results[stage.name] = checkpoints[stage.name]
+                stage_state[stage.name] = {"status": "success", "inputs": list(stage.inputs), "resumed": True}
+                logger.info(f"Workflow {workflow_id}: {stage.name} restored from checkpoint")
+                return
             
-            elif agent_name == "client_profile":
-                return await self.client_profile_agent.build_profile(kwargs.get("client_data", {}))
+            if stage.inputs:
+                await asyncio.gather(*(tasks[name] for name in stage.inputs))
             
-            elif agent_name == "meetings":
-                return await self.meetings_agent.analyze_meeting(
-                    kwargs.get("meeting_id", ""),
-                    kwargs.get("transcript", "")
-                )
+            blocked = [
+                name for name in stage.inputs
+                if by_name[name].required and stage_state[name]["status"] != "success"
+            ]
+            if blocked:
+                stage_state[stage.name] = {
+                    "status": "skipped",
+                    "inputs": list(stage.inputs),
+                    "error": f"Skipped because {', '.join(blocked)} did not succeed"
+                }
+                logger.warning(f"Workflow {workflow_id}: {stage.name} skipped, blocked by {', '.join(blocked)}")
+                return
             
-            elif agent_name == "actionable_insights":
-                return await self.actionable_insights_agent.generate_insights(
-                    kwargs.get("client_name", ""),
-                    kwargs.get("domain_knowledge", {}),
-                    kwargs.get("client_profile", {}),
-                    kwargs.get("meeting_analysis", {})
+            logger.info(f"Workflow {workflow_id}: Starting {stage.name}")
+            started = time.perf_counter()
+            stage_state[stage.name] = {
+                "status": "running",
+                "inputs": list(stage.inputs),
+                "started_at": round(started - workflow_started, 4)
+            }
+            running.add(stage.name)
+            state["current_step"] = ", ".join(sorted(running))
+            
+            try:
+                result, outcome, attempts = await self._call_stage(
+                    stage, client_data, {name: results.get(name, {}) for name in stage.inputs}
                 )
+                error = None if outcome == "success" else result.get("message", "unknown error")
+            finally:
+                running.discard(stage.name)
+                state["current_step"] = ", ".join(sorted(running)) or stage.name
             
-            else:
+            results[stage.name] = result
+            stage_state[stage.name].update({
+                "status": "success" if error is None else "failed",
+                "outcome": outcome,
+                "retries": max(attempts - 1, 0),
+                "duration": round(time.perf_counter() - started, 4),
+                "cached": bool(result.get("cached"))
+            })
+            if error is not None:
+                stage_state[stage.name]["error"] = error
+                log = logger.error if stage.required else logger.warning
+                log(f"Workflow {workflow_id}: {stage.name} failed: {error}")
+                return
+            
+            try:
+                await self.workflow_store.aio.save_checkpoint(workflow_id, stage.name, result)
+            except Exception as e:
+                # The workflow goes on; a resume would just run this stage again
+                logger.error(f"Workflow {workflow_id}: failed to checkpoint {stage.name}: {e}")
+        
+        for stage in stages:
+            tasks[stage.name] = asyncio.create_task(run_stage(stage))
+        await asyncio.gather(*tasks.values())
+        
+        self._record_stage_timings(state, by_name, time.perf_counter() - workflow_started)
+        return [
+            f"{name} {info['status']}: {info.get('error')}" for name, info in stage_state.items()
+            if by_name[name].required and info["status"] != "success"
+        ]
+    
+    def get_stage_policy(self, stage_name: str) -> StagePolicy:
+        """Call policy of a stage: its override if one is configured, else the default"""
+        return self.stage_policies.get(stage_name, self.stage_policy)
+    
+    def _get_circuit_breaker(self, stage_name: str) -> CircuitBreaker:
+        breaker = self.circuit_breakers.get(stage_name)
+        if breaker is None:
+            policy = self.get_stage_policy(stage_name)
+            breaker = self.circuit_breakers[stage_name] = CircuitBreaker(
+                stage_name, policy.failure_threshold, policy.reset_timeout
+            )
+        return breaker
+    
+    async def _call_stage(self, stage: WorkflowStage, client_data: Dict[str, Any],
+                          inputs: Dict[str, Dict]) -> Tuple[Dict[str, Any], str, int]:
+        """Call a stage under its policy; returns (result, outcome, attempts).
+        
+        Each attempt gets the policy's deadline. Attempts that raise or time out are retried
+        with jittered backoff; an error result is the agent's own answer and is not. Failures
+        count against the stage's circuit breaker, and while it is open the stage fails at
+        once. The outcome is success, error, timeout or short_circuited.
+        """
+        policy = self.get_stage_policy(stage.name)
+        breaker = self._get_circuit_breaker(stage.name)
+        attempts = 0
+        while True:
+            if not breaker.allow():
+                logger.warning(f"{stage.name} short-circuited: circuit is {breaker.state}")
                 return {
                     "status": "error",
-                    "message": f"Unknown agent: {agent_name}"
+                    "message": f"{stage.name} is failing, circuit open; not called"
+                }, "short_circuited", attempts
+            
+            attempts += 1
+            try:
+                result = await asyncio.wait_for(stage.run(client_data, inputs), policy.timeout)
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except asyncio.TimeoutError:
+                outcome, result = "timeout", {"status": "error", "message": f"{stage.name} timed out after {policy.timeout}s"}
+            except Exception as e:
+                outcome, result = "error", {"status": "error", "message": str(e)}
+            else:
+                if result.get("status") == "success":
+                    breaker.record_success()
+                    return result, "success", attempts
+                breaker.record_failure()
+                return result, "error", attempts
+            
+            breaker.record_failure()
+            if attempts > policy.retries:
+                return result, outcome, attempts
+            delay = policy.backoff_delay(attempts)
+            logger.warning(f"{stage.name} attempt {attempts} failed ({outcome}): retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+    
+    def get_circuit_breaker_states(self) -> Dict[str, Dict[str, Any]]:
+        """State and call counts of each stage's circuit breaker"""
+        return {name: breaker.get_state() for name, breaker in self.circuit_breakers.items()}
+    
+    def _record_stage_timings(self, state: Dict[str, Any], stages: Dict[str, WorkflowStage], wall_time: float):
+        """Record stage durations, the critical path and the speedup over running stages back to back"""
+        stage_state = state["stages"]
+        durations = {name: info["duration"] for name, info in stage_state.items() if "duration" in info}
+        
+        # Longest chain of dependent stages; stages are declared in dependency order
+        finish: Dict[str, float] = {}
+        path: Dict[str, List[str]] = {}
+        for name, stage in stages.items():
+            if name not in durations:
+                continue
+            longest = max((i for i in stage.inputs if i in finish), key=finish.get, default=None)
+            finish[name] = durations[name] + (finish[longest] if longest else 0.0)
+            path[name] = (path[longest] if longest else []) + [name]
+        
+        last = max(finish, key=finish.get, default=None)
+        sequential_time = sum(durations.values())
+        state.update({
+            "stage_durations": durations,
+            "sequential_time": round(sequential_time, 4),
+            "critical_path": path.get(last, []),
+            "critical_path_time": round(finish.get(last, 0.0), 4),
+            "stages_wall_time": round(wall_time, 4),
+            "parallel_speedup": round(sequential_time / wall_time, 2) if wall_time > 0 else 1.0
+        })
+    
+    async def _cached_stage(self, stage: str, agent, key_inputs: Dict[str, Any],
+                            compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Serve a deterministic agent stage from the stage cache, keyed on its inputs and the agent version"""
+        key = stage_cache_key(stage, getattr(agent, "VERSION", "0"), key_inputs)
+        return await self.stage_cache.get_or_compute(stage, key, compute)
+    
+    async def _domain_knowledge_stage(self, client_data: Dict[str, Any], inputs: Dict[str, Dict],
+                                      cache: Optional[BatchCache] = None) -> Dict[str, Any]:
+        """Domain Knowledge Analysis, shared by batch clients with the same industry, problem and tech stack"""
+        industry = client_data.get("industry", "")
+        problem_statement = client_data.get("problem_statement", "")
+        tech_stack = client_data.get("tech_stack", "")
+        entry = self.agents.get("domain_knowledge")
+        agent = entry.agent
+        key_inputs = {
+            "industry": industry,
+            "problem_statement": problem_statement,
+            "tech_stack": tech_stack,
+            # The agent's built-in knowledge base is an input too; editing it changes the key
+            "knowledge_base": agent.knowledge_base
+        }
+        compute = lambda: self._cached_stage(
+            "domain_knowledge", agent, key_inputs,
+            lambda: entry(industry, problem_statement, tech_stack)
+        )
+        if cache is None:
+            return await compute()
+        
+        key = ("domain_knowledge", industry.strip().lower(), problem_statement.strip(), str(tech_stack).strip())
+        return await cache.get_or_compute(key, compute)
+    
+    async def _client_profile_stage(self, client_data: Dict[str, Any], inputs: Dict[str, Dict]) -> Dict[str, Any]:
+        """Client Profile Building, saving the profile when it succeeds"""
+        client_name = client_data.get("client_name", "")
+        entry = self.agents.get("client_profile")
+        agent = entry.agent
+        # The agent enhances the stored profile when there is one, so its content is part of the key;
+        # the id and timestamps are regenerated on every save and are left out (see VOLATILE_KEYS)
+        existing_profile = await self.db_manager.aio.get_client_profile(client_name)
+        profile_content = None
+        if existing_profile:
+            profile_content = {key: value for key, value in existing_profile["profile_data"].items() if key != "id"}
+        key_inputs = {
+            "client_name": client_name,
+            "industry": client_data.get("industry", ""),
+            "problem_statement": client_data.get("problem_statement", ""),
+            "tech_stack": client_data.get("tech_stack", ""),
+            "existing_profile": profile_content
+        }
+        profile_result = await self._cached_stage(
+            "client_profile", agent, key_inputs,
+            lambda: entry(
+                client_name,
+                client_data.get("industry", ""),
+                client_data.get("problem_statement", ""),
+                client_data.get("tech_stack", "")
+            )
+        )
+        
+        # Save client profile to database if successful
+        if profile_result.get("status") == "success" and profile_result.get("client_profile"):
+            try:
+                await self.db_manager.aio.save_client_profile(
+                    client_name,
+                    profile_result["client_profile"]
+                )
+                logger.info(f"Client profile saved to database for {client_name}")
+            except Exception as save_error:
+                logger.error(f"Failed to save client profile: {save_error}")
+        
+        return profile_result
+    
+    async def _meetings_stage(self, client_data: Dict[str, Any], inputs: Dict[str, Dict],
+                              cache: Optional[BatchCache] = None) -> Dict[str, Any]:
+        """Meetings Analysis (if meeting data available)"""
+        client_name = client_data.get("client_name", "")
+        compute = lambda: self._analyze_meetings_for_client(client_name)
+        if cache is None:
+            return await compute()
+        return await cache.get_or_compute(("meetings", client_name.strip().lower()), compute)
+    
+    async def execute_workflow_batch(self, clients: List[Dict[str, Any]],
+                                     concurrency: int = 4) -> AsyncIterator[Dict[str, Any]]:
+        """Execute the full workflow for many clients, yielding each result as it completes.
+        
+        At most `concurrency` workflows run at once and they share one BatchCache. After the
+        per-client results, a final "report" item carries the batch throughput and cache stats.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        
+        cache = BatchCache()
+        slots = asyncio.Semaphore(concurrency)
+        batch_started = time.perf_counter()
+        logger.info(f"Starting workflow batch of {len(clients)} clients with concurrency {concurrency}")
+        
+        async def run_client(index: int, client_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with slots:
+                started = time.perf_counter()
+                result = await self.execute_full_workflow(client_data, cache=cache)
+                return {
+                    "type": "result",
+                    "index": index,
+                    "client_name": client_data.get("client_name"),
+                    "status": "completed" if result.get("status") == "completed" else "failed",
+                    "duration": round(time.perf_counter() - started, 4),
+                    "result": result
                 }
-                
+        
+        tasks = [asyncio.create_task(run_client(index, client)) for index, client in enumerate(clients)]
+        durations = []
+        failed = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                item = await next_done
+                durations.append(item["duration"])
+                failed += item["status"] != "completed"
+                yield item
+        finally:
+            # The consumer stopped early (e.g. the client disconnected): stop the remaining workflows
+            for task in tasks:
+                task.cancel()
+        
+        elapsed = time.perf_counter() - batch_started
+        durations.sort()
+        yield {
+            "type": "report",
+            "total_clients": len(clients),
+            "completed": len(durations) - failed,
+            "failed": failed,
+            "concurrency": concurrency,
+            "elapsed": round(elapsed, 4),
+            "throughput_per_second": round(len(durations) / elapsed, 2) if elapsed > 0 else 0.0,
+            "average_duration": round(sum(durations) / len(durations), 4) if durations else 0.0,
+            "p95_duration": durations[min(len(durations) - 1, int(len(durations) * 0.95))] if durations else 0.0,
+            "sequential_time": round(sum(durations), 4),
+            "cache": cache.get_stats()
+        }
+    
+    async def _actionable_insights_stage(self, client_data: Dict[str, Any], inputs: Dict[str, Dict]) -> Dict[str, Any]:
+        """Generate Actionable Insights from the domain, profile and meeting results"""
+        client_name = client_data.get("client_name", "")
+        entry = self.agents.get("actionable_insights")
+        return await self._cached_stage(
+            "actionable_insights", entry.agent, {"client_name": client_name, **inputs},
+            lambda: entry(
+                client_name,
+                inputs["domain_knowledge"],
+                inputs["client_profile"],
+                inputs["meetings"]
+            )
+        )
+    
+    async def execute_single_agent(self, agent_name: str, **kwargs) -> Dict[str, Any]:
+        """Execute a single registered agent independently, with kwargs checked against its input schema"""
+        logger.info(f"Executing single agent: {agent_name}")
+        
+        if agent_name not in self.agents:
+            return {
+                "status": "error",
+                "message": f"Unknown agent: {agent_name}"
+            }
+        entry = self.agents.get(agent_name)
+        try:
+            params = entry.validate(kwargs)
+        except ValueError as e:
+            return {
+                "status": "error",
+                "message": f"Invalid input for agent {agent_name}: {e}"
+            }
+        
+        try:
+            return await entry(**params)
         except Exception as e:
             logger.error(f"Error executing agent {agent_name}: {e}")
             return {
@@ -182,51 +643,67 @@ class WorkflowOrchestrator:
     
     async def get_workflow_status(self, workflow_id: str) -> Dict[str, Any]:
         """Get the current status of a workflow"""
-        if workflow_id not in self.workflow_state:
+        workflow = await self.workflow_store.aio.get(workflow_id)
+        if workflow is None:
             return {
                 "status": "error",
                 "message": "Workflow not found"
             }
         
+        finished = sum(1 for stage in workflow.get("stages", {}).values() if stage["status"] != "running")
+        total = workflow.get("total_stages", 0)
         return {
             "status": "success",
-            "workflow_state": self.workflow_state[workflow_id]
+            "workflow_state": workflow,
+            "progress": {
+                "state": workflow.get("status"),
+                "current_step": workflow.get("current_step"),
+                "completed_stages": finished,
+                "total_stages": total,
+                "percent": round(finished / total * 100) if total else 0
+            }
+        }
+    
+    async def get_workflow_results(self, workflow_id: str) -> Dict[str, Any]:
+        """Get the client data and full agent results of a workflow (from disk once it has finished)"""
+        results = await self.workflow_store.aio.get_results(workflow_id)
+        if results is None:
+            return {
+                "status": "error",
+                "message": "Workflow not found"
+            }
+        
+        return {
+            "status": "success",
+            "workflow_id": workflow_id,
+            **results
         }
     
     async def get_dashboard_data(self, client_name: Optional[str] = None) -> Dict[str, Any]:
         """Get comprehensive dashboard data"""
         try:
             # Get basic dashboard data from database
-            dashboard_data = self.db_manager.get_dashboard_data()
+            dashboard_data = await self.dashboard_repository.aio.get_dashboard_data()
             
             # Enhance with workflow insights if client specified
             if client_name:
                 # Find the most recent workflow for this client
-                client_workflows = [
-                    (wf_id, wf_data) for wf_id, wf_data in self.workflow_state.items()
-                    if wf_data.get("client_data", {}).get("client_name") == client_name
-                ]
+                latest_workflow = await self.workflow_store.aio.latest_for_client(client_name)
                 
-                if client_workflows:
-                    # Get the most recent workflow
-                    latest_workflow = max(client_workflows, key=lambda x: x[1].get("start_time", ""))
+                if latest_workflow:
                     workflow_id, workflow_data = latest_workflow
+                    results = await self.workflow_store.aio.get_results(workflow_id) or {}
                     
                     # Add workflow-specific insights
                     dashboard_data["client_specific"] = {
                         "workflow_id": workflow_id,
                         "workflow_status": workflow_data.get("status"),
                         "current_step": workflow_data.get("current_step"),
-                        "agent_results": workflow_data.get("agent_results", {})
+                        "agent_results": results.get("agent_results", {})
                     }
             
             # Add system-wide metrics
-            dashboard_data["system_metrics"] = {
-                "total_workflows": len(self.workflow_state),
-                "active_workflows": len([wf for wf in self.workflow_state.values() if wf.get("status") == "running"]),
-                "completed_workflows": len([wf for wf in self.workflow_state.values() if wf.get("status") == "completed"]),
-                "failed_workflows": len([wf for wf in self.workflow_state.values() if wf.get("status") == "failed"])
-            }
+            dashboard_data["system_metrics"] = self.get_workflow_metrics()
             
             return {
                 "status": "success",
@@ -245,13 +722,13 @@ class WorkflowOrchestrator:
         try:
             # Use domain knowledge agent for enhanced search
             if industry:
-                domain_result = await self.domain_knowledge_agent.analyze_domain(industry, query, [])
+                domain_result = await self.agents.get("domain_knowledge")(industry, query, "")
                 knowledge_data = domain_result.get("domain_knowledge", {})
             else:
                 knowledge_data = {}
             
             # Get database search results
-            db_results = self.db_manager.search_knowledge_base(query)
+            db_results = await self.db_manager.aio.search_knowledge_base(query)
             
             return {
                 "status": "success",
@@ -274,7 +751,7 @@ class WorkflowOrchestrator:
         """Analyze all meetings for a specific client"""
         try:
             # Get meetings from database
-            meetings = self.db_manager.get_meetings_by_client(client_name)
+            meetings = await self.db_manager.aio.get_meetings_by_client(client_name)
             
             if not meetings:
                 return {
@@ -293,7 +770,7 @@ class WorkflowOrchestrator:
             # Analyze the most recent meeting
             latest_meeting = meetings[0]  # Assuming meetings are ordered by date
             
-            result = await self.meetings_agent.analyze_meeting(
+            result = await self.agents.get("meetings")(
                 latest_meeting.get("id", ""),
                 latest_meeting.get("transcript", "")
             )
@@ -322,7 +799,7 @@ class WorkflowOrchestrator:
     
     def _generate_workflow_summary(self, workflow_id: str) -> Dict[str, Any]:
         """Generate a comprehensive summary of the workflow execution"""
-        workflow_data = self.workflow_state[workflow_id]
+        workflow_data = self.workflow_store.get_active(workflow_id)
         agent_results = workflow_data.get("agent_results", {})
         
         # Extract key insights from each agent
@@ -338,11 +815,26 @@ class WorkflowOrchestrator:
                 "meetings": self._extract_meetings_summary(agent_results.get("meetings", {})),
                 "actionable_insights": self._extract_insights_summary(agent_results.get("actionable_insights", {}))
             },
+            "timing": {
+                "stage_durations": workflow_data.get("stage_durations", {}),
+                "sequential_time": workflow_data.get("sequential_time"),
+                "critical_path": workflow_data.get("critical_path", []),
+                "critical_path_time": workflow_data.get("critical_path_time"),
+                "parallel_speedup": workflow_data.get("parallel_speedup")
+            },
             "full_results": agent_results
         }
         
         return summary
     
+    def _extract_setup_summary(self, setup_result: Dict) -> Dict[str, Any]:
+        """Extract summary from programme setup results (absent when the workflow starts from client data)"""
+        return {
+            "completed": setup_result.get("status") == "success",
+            "client_name": setup_result.get("client_name", ""),
+            "questions_answered": len(setup_result.get("answers", {}))
+        }
+    
     def _extract_domain_summary(self, domain_result: Dict) -> Dict[str, Any]:
         """Extract summary from domain knowledge results"""
         domain_knowledge = domain_result.get("domain_knowledge", {})
@@ -387,18 +879,29 @@ class WorkflowOrchestrator:
             "risk_level": insights.get("risk_assessment", {}).get("risk_level", "unknown")
         }
     
-    def get_all_workflows(self) -> Dict[str, Any]:
-        """Get information about all workflows"""
+    async def list_workflows(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+                             status: Optional[str] = None, client_name: Optional[str] = None) -> Dict[str, Any]:
+        """List workflows newest first, filtered by status and client, one keyset page at a time"""
+        return await self.workflow_store.aio.list_workflows(limit=limit, cursor=cursor, status=status, client_name=client_name)
+    
+    def get_stage_cache_metrics(self) -> Dict[str, Any]:
+        """Hit rate per cached stage"""
+        return self.stage_cache.get_metrics()
+    
+    async def invalidate_stage_cache(self, stage: Optional[str] = None) -> int:
+        """Drop cached results for one stage (or all); raises ValueError for a stage that is not cached"""
+        if stage is not None and stage not in self.CACHED_STAGES:
+            raise ValueError(f"Unknown cached stage: {stage}")
+        return await self.db_manager.aio.run(self.stage_cache.invalidate, stage)
+    
+    def get_workflow_metrics(self) -> Dict[str, Any]:
+        """Workflow counts by status, from counters maintained on every state transition"""
+        counts = self.workflow_store.count_by_status()
         return {
-            "total_workflows": len(self.workflow_state),
-            "workflows": {
-                workflow_id: {
-                    "status": workflow_data.get("status"),
-                    "client_name": workflow_data.get("client_data", {}).get("client_name"),
-                    "start_time": workflow_data.get("start_time"),
-                    "current_step": workflow_data.get("current_step"),
-                    "execution_time": workflow_data.get("execution_time")
-                }
-                for workflow_id, workflow_data in self.workflow_state.items()
-            }
-        }
\ No newline at end of file
+            "total_workflows": sum(counts.values()),
+            "queued_workflows": counts.get("queued", 0),
+            "active_workflows": counts.get("running", 0),
+            "completed_workflows": counts.get("completed", 0),
+            "failed_workflows": counts.get("failed", 0),
+            "cancelled_workflows": counts.get("cancelled", 0)
+        }
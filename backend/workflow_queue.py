@@ -0,0 +1,153 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class QueueFullError(Exception):
+    """Raised when a workflow is submitted while the queue is at its maximum depth"""
+
+class WorkflowJobQueue:
+    """In-process job queue that runs submitted workflows on a fixed pool of worker tasks.
+
+    submit() registers the workflow with the orchestrator and returns its id at once; a
+    worker picks it up in submission order. Queued and running workflows can be cancelled,
+    and failed or cancelled ones resumed.
+    Once max_depth workflows are waiting, further submissions raise QueueFullError.
+    """
+
+    def __init__(self, orchestrator, workers: int = 4, max_depth: int = 100):
+        if workers < 1 or max_depth < 1:
+            raise ValueError("workers and max_depth must be at least 1")
+        self.orchestrator = orchestrator
+        self.workers = workers
+        self.max_depth = max_depth
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        # Waiting workflows in submission order; cancelled ones are removed and skipped by the workers
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._metrics = {
+            "submitted": 0,
+            "resumed": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0
+        }
+
+    def start(self):
+        """Start the worker tasks on the running event loop (no-op if already started)"""
+        if self._worker_tasks:
+            return
+        self._queue = asyncio.Queue()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"ks-workflow-{index}") for index in range(self.workers)
+        ]
+        logger.info(f"Workflow queue started with {self.workers} workers, max depth {self.max_depth}")
+
+    async def stop(self):
+        """Cancel running and queued workflows and stop the workers"""
+        tasks = self._worker_tasks + list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for workflow_id in list(self._pending):
+            await self.cancel(workflow_id)
+        self._worker_tasks = []
+        self._queue = None
+        logger.info("Workflow queue stopped")
+
+    def submit(self, client_data: Dict[str, Any]) -> str:
+        """Queue a workflow for client_data and return its id; raises QueueFullError at max depth"""
+        if len(self._pending) >= self.max_depth:
+            self._metrics["rejected"] += 1
+            raise QueueFullError(f"Workflow queue is full ({self.max_depth} waiting)")
+
+        self.start()
+        workflow_id = self.orchestrator.create_workflow(client_data)
+        self._pending[workflow_id] = client_data
+        self._queue.put_nowait(workflow_id)
+        self._metrics["submitted"] += 1
+        logger.info(f"Workflow {workflow_id} queued for client: {client_data.get('client_name', 'Unknown')}")
+        return workflow_id
+
+    async def resume(self, workflow_id: str) -> str:
+        """Queue a failed or cancelled workflow to resume from its checkpoints.
+
+        Raises QueueFullError at max depth, KeyError for an unknown workflow and
+        ValueError if it cannot be resumed.
+        """
+        if len(self._pending) >= self.max_depth:
+            self._metrics["rejected"] += 1
+            raise QueueFullError(f"Workflow queue is full ({self.max_depth} waiting)")
+
+        self.start()
+        record = await self.orchestrator.reopen_workflow(workflow_id)
+        self._pending[workflow_id] = record["client_data"]
+        self._queue.put_nowait(workflow_id)
+        self._metrics["resumed"] += 1
+        logger.info(f"Workflow {workflow_id} queued to resume")
+        return workflow_id
+
+    async def cancel(self, workflow_id: str) -> bool:
+        """Cancel a queued or running workflow; False if it is not queued or running"""
+        if self._pending.pop(workflow_id, None) is not None:
+            self._metrics["cancelled"] += 1
+            await self.orchestrator.mark_workflow_cancelled(workflow_id)
+            return True
+
+        task = self._running.get(workflow_id)
+        if task is None or task.done():
+            return False
+        # The orchestrator marks the workflow cancelled as the task unwinds
+        task.cancel()
+        return True
+
+    def get_position(self, workflow_id: str) -> Optional[int]:
+        """1-based position of a waiting workflow in the queue, or None if it is not waiting"""
+        for position, pending_id in enumerate(self._pending, start=1):
+            if pending_id == workflow_id:
+                return position
+        return None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth, worker utilisation and outcome counts"""
+        metrics = dict(self._metrics)
+        metrics.update({
+            "queued": len(self._pending),
+            "running": len(self._running),
+            "workers": self.workers,
+            "max_depth": self.max_depth
+        })
+        return metrics
+
+    async def _worker(self):
+        while True:
+            workflow_id = await self._queue.get()
+            client_data = self._pending.pop(workflow_id, None)
+            if client_data is None:
+                # Cancelled while it was waiting
+                continue
+
+            task = asyncio.create_task(
+                self.orchestrator.execute_full_workflow(client_data, workflow_id=workflow_id)
+            )
+            self._running[workflow_id] = task
+            try:
+                # wait() leaves the workflow task alone if this worker is cancelled; stop() cancels both
+                await asyncio.wait({task})
+            finally:
+                self._running.pop(workflow_id, None)
+
+            if task.cancelled():
+                # Covers a task cancelled before it started, which never reached the orchestrator
+                await self.orchestrator.mark_workflow_cancelled(workflow_id)
+                self._metrics["cancelled"] += 1
+            elif task.exception() is not None:
+                self._metrics["failed"] += 1
+                logger.error(f"Workflow {workflow_id} raised: {task.exception()}")
+            elif task.result().get("status") == "completed":
+                self._metrics["completed"] += 1
+            else:
+                self._metrics["failed"] += 1
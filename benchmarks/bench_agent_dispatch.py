@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call overhead of dispatching to an agent, the old if/elif chain
+versus an AgentRegistry lookup, with and without input validation. The agents
+are no-op stubs so only the dispatch cost is measured.
+
+Usage: python benchmarks/bench_agent_dispatch.py [calls]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.agents.registry import (
+    ActionableInsightsInput, AgentRegistry, ClientProfileInput, DomainKnowledgeInput, MeetingAnalysisInput
+)
+
+class StubAgent:
+    name = "Stub Agent"
+
+    async def run(self, *args, **kwargs):
+        return {"status": "success"}
+
+NAMES = ["domain_knowledge", "client_profile", "meetings", "actionable_insights"]
+MODELS = [DomainKnowledgeInput, ClientProfileInput, MeetingAnalysisInput, ActionableInsightsInput]
+PARAMS = {"client_name": "Acme", "industry": "Retail", "problem_statement": "Checkout", "tech_stack": "React"}
+
+async def chain_dispatch(agents, agent_name, **kwargs):
+    """The shape of the old execute_single_agent: compare names in turn, then call"""
+    if agent_name == "domain_knowledge":
+        return await agents[0].run(kwargs.get("industry", ""), kwargs.get("problem_statement", ""), kwargs.get("tech_stack", ""))
+    elif agent_name == "client_profile":
+        return await agents[1].run(kwargs.get("client_name", ""))
+    elif agent_name == "meetings":
+        return await agents[2].run(kwargs.get("client_name", ""), kwargs.get("transcript", ""))
+    elif agent_name == "actionable_insights":
+        return await agents[3].run(kwargs.get("client_name", ""), {}, {}, {})
+    return {"status": "error", "message": f"Unknown agent: {agent_name}"}
+
+async def per_call_us(call, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        await call()
+    return (time.perf_counter() - start) / calls * 1e6
+
+async def main(calls: int):
+    agents = [StubAgent() for _ in NAMES]
+    registry = AgentRegistry()
+    for name, agent, model in zip(NAMES, agents, MODELS):
+        registry.register(name, agent, "run", model)
+
+    # The last branch of the chain is the slowest case for it
+    name = "actionable_insights"
+    insights = {"client_name": "Acme"}
+    timings = {
+        "direct call": await per_call_us(lambda: agents[3].run("Acme", {}, {}, {}), calls),
+        "if/elif chain": await per_call_us(lambda: chain_dispatch(agents, name, **PARAMS), calls),
+        "registry (stage dispatch)": await per_call_us(lambda: registry.get(name)("Acme", {}, {}, {}), calls),
+        "registry + validation": await per_call_us(lambda: registry.execute(name, insights), calls)
+    }
+
+    print(f"Dispatch overhead over {calls} calls (4 agents, last in chain):")
+    base = timings["direct call"]
+    for label, us in timings.items():
+        print(f"  {label:<28} {us:7.3f} us/call  (+{us - base:.3f} us)")
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ClientProfileAgent.build_client_profile latency as the profile book
+grows, comparing the indexed get_client_profile lookup against the previous
+load-everything-and-compare scan over get_client_profiles().
+
+Usage: python benchmarks/bench_client_profile_lookup.py [max_profiles] [runs]
+"""
+
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.agents.client_profile import ClientProfileAgent
+from backend.database.db_manager import DatabaseManager
+
+class FullScanLookup:
+    """DatabaseManager wrapper reproducing the agent's previous lookup"""
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+
+    def get_client_profile(self, client_name: str):
+        for profile in self.db_manager.get_client_profiles():
+            if profile["client_name"].lower() == client_name.lower():
+                return profile
+        return None
+
+def grow(db_manager: DatabaseManager, start: int, stop: int):
+    db_manager.save_client_profiles(
+        (f"Client {i}", {"name": f"Client {i}", "industry": "Retail", "region": "USA", "founded": 2000})
+        for i in range(start, stop)
+    )
+
+def time_workflow(agent: ClientProfileAgent, client_name: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = asyncio.run(agent.build_client_profile(client_name, "Retail", "Improve checkout conversion", "Shopify"))
+        samples.append((time.perf_counter() - start) * 1000)
+        assert result["status"] == "success" and result["profile_exists"]
+    return statistics.median(samples)
+
+def main():
+    max_profiles = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    sizes = [n for n in (10, 100, 1_000, 10_000, 100_000) if n <= max_profiles]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(str(Path(tmp) / "profiles.db"))
+        db_manager.initialize_database()
+        indexed = ClientProfileAgent(db_manager)
+        scanning = ClientProfileAgent(FullScanLookup(db_manager))
+
+        print("=== build_client_profile median latency by stored profiles ===")
+        print(f"   {'profiles':>9}{'indexed lookup':>17}{'full scan':>14}")
+        stored = 0
+        for size in sizes:
+            grow(db_manager, stored, size)
+            stored = size
+            client_name = f"client {size // 2}"
+            fast_ms = time_workflow(indexed, client_name, runs)
+            slow_ms = time_workflow(scanning, client_name, max(1, runs // 10) if size >= 10_000 else runs)
+            print(f"   {size:>9}{fast_ms:>14.3f} ms{slow_ms:>11.1f} ms")
+
+        db_manager.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-turn latency of NaturalConversationalAgent.process_message with
+extraction and reply generation run back to back versus concurrently, and the
+time to first token of stream_message, against a local fake Ollama server that
+starts answering /api/generate after a fixed delay and then streams the reply
+a word at a time.
+
+Usage: python benchmarks/bench_conversation_pipeline.py [turns] [delay_ms ...]
+"""
+
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.agents.natural_conversational_agent import NaturalConversationalAgent
+
+MESSAGES = [
+    "Hi! My company is Zulu.riverside and we're in the IT industry",
+    "We need to modernize our legacy infrastructure",
+    "Our stack is Java, MySQL and an old mainframe",
+    "We have about 15 developers in San Francisco",
+    "We'd like to finish within 12 months on a $500K budget"
+]
+
+EXTRACTION = json.dumps({"industry": "IT", "company_name": "Zulu.riverside"})
+REPLY = "Thanks for sharing that! It helps a lot to know where you are today. What timeline are you working towards?"
+TOKEN_DELAY = 0.01
+
+def fake_ollama(delay: float) -> web.Application:
+    """Minimal /api/generate: waits delay seconds, then streams the reply a word per TOKEN_DELAY"""
+    async def generate(request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        await asyncio.sleep(delay)
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        if "Extract any business information" in payload.get("prompt", ""):
+            chunks = [EXTRACTION]
+        else:
+            chunks = [word + " " for word in REPLY.split(" ")]
+        for chunk in chunks:
+            await response.write((json.dumps({"response": chunk, "done": False}) + "\n").encode())
+            await asyncio.sleep(TOKEN_DELAY)
+        await response.write((json.dumps({"response": "", "done": True}) + "\n").encode())
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/api/generate", generate)
+    return app
+
+async def run_turns(base_url: str, pipelined: bool, turns: int) -> list:
+    agent = NaturalConversationalAgent(None, base_url=base_url, pipelined=pipelined)
+    await agent.start_conversation("bench")
+    latencies = []
+    for i in range(turns):
+        start = time.perf_counter()
+        await agent.process_message("bench", MESSAGES[i % len(MESSAGES)])
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+async def stream_turns(base_url: str, turns: int) -> list:
+    """Time to first token of streamed turns"""
+    agent = NaturalConversationalAgent(None, base_url=base_url)
+    await agent.start_conversation("bench")
+    for i in range(turns):
+        async for _ in agent.stream_message("bench", MESSAGES[i % len(MESSAGES)]):
+            pass
+    return agent.get_stream_metrics()["ttft_ms"]["p50"]
+
+async def main(turns: int, delays_ms: list):
+    words = len(REPLY.split(" "))
+    print(f"Per-turn latency over {turns} turns (fake Ollama: fixed delay per call, then {words} words at {TOKEN_DELAY * 1000:.0f}ms each):")
+    print(f"  {'delay':>8} {'sequential':>12} {'pipelined':>12} {'speedup':>8} {'stream TTFT':>12}")
+    for delay_ms in delays_ms:
+        runner = web.AppRunner(fake_ollama(delay_ms / 1000))
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            sequential = statistics.median(await run_turns(base_url, False, turns))
+            pipelined = statistics.median(await run_turns(base_url, True, turns))
+            ttft_ms = await stream_turns(base_url, turns)
+        finally:
+            await runner.cleanup()
+        print(f"  {delay_ms:>6}ms {sequential * 1000:>10.1f}ms {pipelined * 1000:>10.1f}ms "
+              f"{sequential / pipelined:>7.2f}x {ttft_ms:>10.1f}ms")
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    delays = [int(arg) for arg in sys.argv[2:]] or [50, 200, 500]
+    asyncio.run(main(turns, delays))
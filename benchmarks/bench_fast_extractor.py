@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: LLM extraction calls made by NaturalConversationalAgent on the
+scripted conversations of backend/test_natural_agent.py and
+test_conversation_flow.py, before the fast-path extractor (one call per
+message) and with it, plus the cost of the fast path itself. The LLM is a
+counting fake, so no Ollama server is needed.
+
+Usage: python benchmarks/bench_fast_extractor.py [repeats]
+"""
+
+import asyncio
+import json
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+from langchain_core.language_models.llms import LLM
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.agents.fast_extractor import FastExtractor
+from backend.agents.natural_conversational_agent import FIELD_FOLLOW_UPS, NaturalConversationalAgent
+
+# The user messages of the two scripted conversations
+CONVERSATIONS = {
+    "backend/test_natural_agent.py": [
+        "Hi there! My company is Zulu.riverside and we're in the IT industry",
+        "hello?",
+        "are you there?",
+        "We're facing challenges with our legacy systems and need to modernize our infrastructure",
+        "Our current tech stack includes Java, MySQL, and some old mainframe systems",
+        "We have a team of about 15 developers and we're located in San Francisco",
+        "The project timeline is flexible but we'd like to complete it within 12 months",
+        "Our budget is around $500K for this modernization project"
+    ],
+    "test_conversation_flow.py": [
+        "Hi! I'm John from TechCorp, a software development company.",
+        "We're in the fintech industry and we're struggling with scalability issues in our payment processing system.",
+        "We're currently using Python with Django and PostgreSQL, but we're open to new technologies.",
+        "We need to solve this within 6 months and have a budget of around $200,000.",
+        "Our team has 15 developers and we're based in San Francisco."
+    ]
+}
+
+# The messages stating the client's problem, which the fake LLM extracts
+PROBLEM_MESSAGES = {
+    "We're facing challenges with our legacy systems and need to modernize our infrastructure": "Legacy modernization",
+    "We're in the fintech industry and we're struggling with scalability issues in our payment processing system.":
+        "Payment processing scalability"
+}
+
+MISSING_FIELDS = re.compile(r"Missing information: \[([^\]]*)\]")
+
+class CountingLLM(LLM):
+    """Fake LLM answering instantly: the problem statement of PROBLEM_MESSAGES or an empty extraction,
+    or a reply asking about the first missing field, as the reply prompt instructs"""
+    extraction_calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "counting-fake"
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, **kwargs: Any) -> str:
+        if "Extract any business information" in prompt:
+            self.extraction_calls += 1
+            problems = [problem for message, problem in PROBLEM_MESSAGES.items() if message in prompt]
+            return json.dumps({"problem_statement": problems[0]} if problems else {})
+        missing = MISSING_FIELDS.search(prompt)
+        fields = re.findall(r"'(\w+)'", missing.group(1)) if missing else []
+        return "Thanks! " + FIELD_FOLLOW_UPS.get(fields[0] if fields else "", "What else should we know?")
+
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None, **kwargs: Any) -> str:
+        return self._call(prompt)
+
+async def run_conversation(messages: List[str]):
+    agent = NaturalConversationalAgent(None)
+    agent.llm = CountingLLM()
+    await agent.start_conversation("bench")
+    for message in messages:
+        await agent.process_message("bench", message)
+    return agent.llm.extraction_calls, agent.get_extraction_metrics()["fast_path_fields"]
+
+def fast_path_us(messages: List[str], repeats: int) -> float:
+    extractor = FastExtractor()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for message in messages:
+            extractor.unresolved(message, extractor.extract(message))
+    return (time.perf_counter() - start) / (repeats * len(messages)) * 1e6
+
+async def main(repeats: int):
+    print("LLM extraction calls on the scripted conversations:")
+    print(f"  {'conversation':<32} {'messages':>8} {'before':>7} {'after':>6} {'saved':>6} {'rule fields':>12}")
+    total_messages = total_calls = 0
+    for name, messages in CONVERSATIONS.items():
+        calls, fields = await run_conversation(messages)
+        total_messages += len(messages)
+        total_calls += calls
+        print(f"  {name:<32} {len(messages):>8} {len(messages):>7} {calls:>6} {1 - calls / len(messages):>6.0%} {fields:>12}")
+    print(f"  {'total':<32} {total_messages:>8} {total_messages:>7} {total_calls:>6} {1 - total_calls / total_messages:>6.0%}")
+
+    all_messages = [message for messages in CONVERSATIONS.values() for message in messages]
+    print(f"\nFast path cost: {fast_path_us(all_messages, repeats):.1f} us per message")
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
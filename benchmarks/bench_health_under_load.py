@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: /health latency while concurrent clients hammer /api/dashboard,
+with the dashboard query awaited on the database executor (current) versus
+run synchronously inside the async handler (previous behaviour, reproduced
+by a benchmark-only route).
+
+Usage: python benchmarks/bench_health_under_load.py [rows] [dashboard_clients] [seconds]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+TRANSCRIPT = "We reviewed the migration plan, the data model and the rollout timeline with the client. " * 20
+
+def seed(db_manager, rows: int):
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    db_manager.save_client_profiles(
+        (f"Client {i}", {"company_name": f"Client {i}", "industry": "Retail", "regions": ["USA"]}) for i in range(rows)
+    )
+    with db_manager.writer() as conn:
+        conn.executemany(
+            "INSERT INTO meetings (client_name, transcript, action_items, engagement_metrics, sentiment_score, sentiment_category) "
+            "VALUES (?, ?, '[]', '{}', 0.1, 'positive')",
+            ((f"Client {i}", TRANSCRIPT) for i in range(rows))
+        )
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+async def run_load(app, dashboard_url: str, clients: int, seconds: float):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        stop = time.perf_counter() + seconds
+        dashboards = 0
+
+        async def dashboard_client():
+            nonlocal dashboards
+            while time.perf_counter() < stop:
+                response = await client.get(dashboard_url, params={"limit": 500})
+                response.raise_for_status()
+                dashboards += 1
+
+        async def health_prober():
+            samples = []
+            while time.perf_counter() < stop:
+                start = time.perf_counter()
+                response = await client.get("/health")
+                samples.append((time.perf_counter() - start) * 1000)
+                assert response.json()["database"] == "connected"
+                await asyncio.sleep(0.005)
+            return samples
+
+        results = await asyncio.gather(health_prober(), *(dashboard_client() for _ in range(clients)))
+        return results[0], dashboards
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["KS_DB_PATH"] = str(Path(tmp) / "load.db")
+        from backend import main as api
+
+        seed(api.db_manager, rows)
+
+        @api.app.get("/bench/dashboard-blocking")
+        async def blocking_dashboard(limit: int = 500):
+            """The previous handler shape: a synchronous query inside an async endpoint"""
+            return {"status": "success", "data": api.dashboard_repository.get_dashboard_data(limit=limit)}
+
+        print(f"=== /health under {clients} concurrent dashboard clients, {rows} rows, {seconds:.0f}s ===")
+        print(f"   {'dashboard path':<28}{'health p50':>12}{'health p99':>12}{'health max':>12}{'dashboards/s':>14}")
+        for label, url in (("sync in event loop", "/bench/dashboard-blocking"), ("awaited on executor", "/api/dashboard")):
+            samples, dashboards = asyncio.run(run_load(api.app, url, clients, seconds))
+            print(f"   {label:<28}{statistics.median(samples):>9.2f} ms{percentile(samples, 0.99):>9.2f} ms"
+                  f"{max(samples):>9.2f} ms{dashboards / seconds:>14.1f}")
+
+        print(f"\n   executor metrics: {api.db_manager.aio.get_metrics()}")
+        api.db_manager.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: knowledge base search over synthetic meeting transcripts,
+FTS5/BM25 path versus the LIKE '%q%' scan it replaced (both limited to 20 rows).
+
+Usage: python benchmarks/bench_knowledge_search.py [transcripts]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.database.db_manager import DatabaseManager
+
+DOMAIN_TERMS = (
+    "lead management salesforce pipeline kpi dashboard migration cloud aws azure encryption "
+    "compliance hipaa audit checkout conversion mobile inventory warehouse erp integration "
+    "api latency scalability budget timeline stakeholder roadmap onboarding training adoption "
+    "security analytics reporting forecast churn retention pricing discount vendor contract"
+).split()
+FILLER = "the we our team discussed next steps with client about and for to on in review plan".split()
+QUERIES = ["encryption", "hipaa audit", "warehouse inventory", "roadmap", "zeppelin"]
+
+def build_vocabulary(rng: random.Random, size: int = 5000):
+    """Domain terms plus synthetic words, with Zipf-like weights so term frequencies look like real text"""
+    synthetic = {"".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))) for _ in range(size)}
+    words = DOMAIN_TERMS + sorted(synthetic)
+    rng.shuffle(words)
+    weights = [1.0 / (rank + 1) for rank in range(len(words))]
+    return words, weights
+
+def synthetic_transcript(rng: random.Random, vocabulary) -> str:
+    words, weights = vocabulary
+    content = rng.choices(words, weights=weights, k=40)
+    filler = rng.choices(FILLER, k=80)
+    mixed = content + filler
+    rng.shuffle(mixed)
+    return " ".join(mixed).capitalize() + "."
+
+def seed(db_manager: DatabaseManager, count: int):
+    rng = random.Random(42)
+    vocabulary = build_vocabulary(rng)
+    db_manager.initialize_database()
+    start = time.perf_counter()
+    with db_manager.writer() as conn:
+        conn.executemany(
+            "INSERT INTO meetings (client_name, transcript, sentiment_score, sentiment_category) VALUES (?, ?, 0, 'neutral')",
+            ((f"Client {i % 500}", synthetic_transcript(rng, vocabulary)) for i in range(count))
+        )
+    print(f"   seeded {count} transcripts (with FTS triggers) in {time.perf_counter() - start:.1f}s")
+
+def time_query(fn, query: str, repeat: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(query)
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(str(Path(tmp) / "search.db"))
+        print(f"=== Knowledge base search over {count} transcripts ===")
+        seed(db_manager, count)
+        assert db_manager.fts_enabled, "SQLite build lacks FTS5"
+
+        print(f"\n   {'query':<22}{'LIKE scan':>12}{'FTS5 + BM25':>14}{'speedup':>10}")
+        for query in QUERIES:
+            like_ms = time_query(lambda q: db_manager._search_knowledge_base_like(q, limit=20), query)
+            fts_ms = time_query(lambda q: db_manager.search_knowledge_base(q, limit=20), query)
+            print(f"   {query:<22}{like_ms:>9.2f} ms{fts_ms:>11.2f} ms{like_ms / fts_ms:>9.1f}x")
+
+        db_manager.close()
+
+if __name__ == "__main__":
+    main()
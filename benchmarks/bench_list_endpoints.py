@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: response size and latency of the paginated list endpoints
+(/api/clients, /api/dashboard, /api/use-cases) as profiles and meetings grow,
+for the first page and for a page reached by following next_cursor, against
+the previous unbounded full-table profile listing.
+
+Usage: python benchmarks/bench_list_endpoints.py [max_rows] [requests]
+"""
+
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient
+
+from backend.database.db_manager import DatabaseManager
+from backend.database.repositories import ClientProfileRepository, DashboardRepository
+from backend import main as api
+
+TRANSCRIPT = "We reviewed the migration plan, the data model and the rollout timeline with the client. " * 40
+
+def grow(db_manager: DatabaseManager, start: int, stop: int):
+    db_manager.save_client_profiles(
+        (f"Client {i}", {"company_name": f"Client {i}", "industry": "Retail", "regions": ["USA"],
+                         "stakeholders": ["CEO", "CTO"], "completeness_score": i % 100})
+        for i in range(start, stop)
+    )
+    with db_manager.writer() as conn:
+        conn.executemany(
+            "INSERT INTO meetings (client_name, transcript, action_items, engagement_metrics, sentiment_score, sentiment_category) "
+            "VALUES (?, ?, '[\"Follow up\"]', '{\"engagement\": 70}', 0.3, 'positive')",
+            ((f"Client {i}", TRANSCRIPT) for i in range(start, stop))
+        )
+
+def measure(fn, requests: int):
+    samples, size = [], 0
+    for _ in range(requests):
+        start = time.perf_counter()
+        size = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), size
+
+def report(label: str, result):
+    ms, size = result
+    print(f"   {label:<40}{ms:>9.2f} ms{size / 1024:>11.1f} KiB")
+
+def main():
+    max_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    sizes = [n for n in (1_000, 10_000, 100_000) if n <= max_rows]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(str(Path(tmp) / "lists.db"))
+        db_manager.initialize_database()
+        db_manager.load_use_cases()
+        profiles = ClientProfileRepository(db_manager)
+        api.app.dependency_overrides[api.get_profile_repository] = lambda: profiles
+        api.app.dependency_overrides[api.get_dashboard_repository] = lambda: DashboardRepository(db_manager)
+        client = TestClient(api.app)
+
+        def get(url, **params):
+            return lambda: len(client.get(url, params=params).content)
+
+        stored = 0
+        for size in sizes:
+            grow(db_manager, stored, size)
+            stored = size
+
+            # Follow the cursor 20 pages deep
+            cursor = None
+            for _ in range(20):
+                cursor = client.get("/api/clients", params={"limit": 50, "cursor": cursor} if cursor else {"limit": 50}).json()["next_cursor"]
+
+            print(f"\n=== {size} profiles and meetings ===")
+            report("/api/clients first page (50)", measure(get("/api/clients", limit=50), requests))
+            report("/api/clients page 21 via cursor", measure(get("/api/clients", limit=50, cursor=cursor), requests))
+            report("/api/clients fields=company_name,industry", measure(get("/api/clients", limit=50, fields="company_name,industry"), requests))
+            report("/api/dashboard (50 per list)", measure(get("/api/dashboard"), requests))
+            report("/api/dashboard meeting_fields=client_name", measure(get("/api/dashboard", meeting_fields="client_name,sentiment_score"), requests))
+            report("/api/use-cases", measure(get("/api/use-cases"), requests))
+            report("unbounded list_profiles() (previous)",
+                   measure(lambda: len(json.dumps(profiles.list_profiles()["items"])), max(1, requests // 5)))
+
+        api.app.dependency_overrides.clear()
+        db_manager.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sentiment distribution read from the trigger-maintained meeting_stats
+aggregates versus the previous recomputation (GROUP BY over meetings in
+get_sentiment_data, and decoding every meeting row in MeetingsAgent), plus the
+insert cost the triggers add.
+
+Usage: python benchmarks/bench_meeting_stats.py [meetings]
+"""
+
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.database.db_manager import DatabaseManager
+
+def seed(db_manager: DatabaseManager, count: int) -> float:
+    rng = random.Random(1)
+    start = time.perf_counter()
+    with db_manager.writer() as conn:
+        conn.executemany(
+            "INSERT INTO meetings (client_name, transcript, action_items, engagement_metrics, sentiment_score, sentiment_category) "
+            "VALUES (?, ?, '[\"Follow up\"]', ?, ?, ?)",
+            ((f"Client {rng.randrange(1000)}", "Weekly status notes " * 30, json.dumps({"engagement": rng.randrange(100)}),
+              rng.uniform(-1, 1), rng.choice(["positive", "neutral", "negative"])) for _ in range(count))
+        )
+    return time.perf_counter() - start
+
+def group_by_distribution(db_manager: DatabaseManager):
+    """Previous get_sentiment_data"""
+    with db_manager.reader() as conn:
+        rows = conn.execute("SELECT sentiment_category, COUNT(*) AS count FROM meetings GROUP BY sentiment_category").fetchall()
+    return {row["sentiment_category"]: row["count"] for row in rows}
+
+def decoded_distribution(db_manager: DatabaseManager):
+    """Previous MeetingsAgent.get_sentiment_distribution: decode every meeting row"""
+    counts = {"positive": 0, "neutral": 0, "negative": 0}
+    for meeting in db_manager.get_meeting_insights():
+        counts[meeting["sentiment_category"]] += 1
+    return counts
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(str(Path(tmp) / "stats.db"))
+        db_manager.initialize_database()
+        with_triggers = seed(db_manager, count)
+        with db_manager.writer() as conn:
+            conn.execute("DROP TRIGGER meeting_stats_ai")
+            conn.execute("DELETE FROM meetings")
+        without_triggers = seed(db_manager, count)
+
+        print(f"=== Sentiment distribution over {count} meetings ===")
+        print(f"   meeting_stats lookup (all)          {timed(db_manager.get_sentiment_data, 200):>9.3f} ms")
+        print(f"   meeting_stats lookup (one client)   {timed(lambda: db_manager.get_sentiment_data('Client 7'), 200):>9.3f} ms")
+        print(f"   GROUP BY over meetings (previous)   {timed(lambda: group_by_distribution(db_manager), 5):>9.3f} ms")
+        print(f"   decode every row (previous agent)   {timed(lambda: decoded_distribution(db_manager), 1):>9.3f} ms")
+        print(f"\n   bulk insert: {count / with_triggers:,.0f} rows/s with aggregate triggers, "
+              f"{count / without_triggers:,.0f} rows/s without")
+        db_manager.close()
+
+if __name__ == "__main__":
+    main()
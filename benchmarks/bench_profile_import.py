@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark: importing a CRM export of client profiles, one save_client_profile
+call (and commit) per row versus a single save_client_profiles transaction.
+
+Usage: python benchmarks/bench_profile_import.py [profiles]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.database.db_manager import DatabaseManager
+
+def crm_export(count: int):
+    """Synthetic export; a tenth of the rows re-send an existing client in different case"""
+    for i in range(count):
+        name = f"Client {i % (count - count // 10)}"
+        yield (name.upper() if i % 2 else name), {"company_name": name, "industry": "Retail", "row": i}
+
+def run(label: str, db_path: str, fn, count: int):
+    db_manager = DatabaseManager(db_path)
+    db_manager.initialize_database()
+    start = time.perf_counter()
+    fn(db_manager, crm_export(count))
+    elapsed = time.perf_counter() - start
+    with db_manager.reader() as conn:
+        stored = conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+    db_manager.close()
+    print(f"   {label:<32}{elapsed * 1000:>10.1f} ms{count / elapsed:>12.0f} rows/s   ({stored} profiles)")
+    return elapsed
+
+def row_by_row(db_manager: DatabaseManager, rows):
+    for client_name, profile in rows:
+        db_manager.save_client_profile(client_name, profile)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"=== Importing {count} client profiles ===")
+        single = run("save_client_profile per row", str(Path(tmp) / "rows.db"), row_by_row, count)
+        bulk = run("save_client_profiles (bulk)", str(Path(tmp) / "bulk.db"),
+                   lambda db_manager, rows: db_manager.save_client_profiles(rows), count)
+        print(f"   speedup: {single / bulk:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-request latency of profile reads through the pooled
+ClientProfileRepository versus the previous pattern of opening a fresh
+sqlite3 connection on every request.
+
+Usage: python benchmarks/bench_profile_repository.py [profile_count] [requests]
+"""
+
+import json
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient
+
+from backend.database.db_manager import DatabaseManager
+from backend.database.repositories import ClientProfileRepository
+from backend import main as api
+
+def seed(db_manager: DatabaseManager, count: int):
+    db_manager.initialize_database()
+    with db_manager.writer() as conn:
+        conn.executemany(
+            "INSERT INTO profiles (client_name, profile_data) VALUES (?, ?)",
+            [(f"Client {i}", json.dumps({"company_name": f"Client {i}", "industry": "Retail"})) for i in range(count)]
+        )
+
+def legacy_get_profile(db_path: str, client_name: str):
+    """The per-request connection pattern previously used by backend/main.py"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute("SELECT profile_data FROM profiles WHERE client_name = ?", (client_name,))
+    result = cursor.fetchone()
+    conn.close()
+    return json.loads(result[0]) if result else None
+
+def timed(fn, requests: int):
+    samples = []
+    for i in range(requests):
+        start = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": statistics.mean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p99_ms": samples[int(len(samples) * 0.99) - 1]
+    }
+
+def report(label: str, stats: dict):
+    print(f"   {label:<34} mean {stats['mean_ms']:.3f} ms  p50 {stats['p50_ms']:.3f} ms  p99 {stats['p99_ms']:.3f} ms")
+
+def main():
+    profile_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+        db_manager = DatabaseManager(db_path)
+        seed(db_manager, profile_count)
+        repository = ClientProfileRepository(db_manager)
+
+        print(f"=== Profile lookup, {profile_count} profiles, {requests} requests ===")
+        legacy = timed(lambda i: legacy_get_profile(db_path, f"Client {i % profile_count}"), requests)
+        pooled = timed(lambda i: repository.get_profile(f"Client {i % profile_count}"), requests)
+        report("fresh sqlite3.connect per request", legacy)
+        report("pooled repository", pooled)
+        print(f"   speedup: {legacy['mean_ms'] / pooled['mean_ms']:.1f}x")
+
+        print("\n=== GET /api/clients/{name} through FastAPI ===")
+        api.app.dependency_overrides[api.get_profile_repository] = lambda: repository
+        client = TestClient(api.app)
+        endpoint = timed(lambda i: client.get(f"/api/clients/Client {i % profile_count}"), min(requests, 500))
+        report("endpoint (pooled repository)", endpoint)
+        api.app.dependency_overrides.clear()
+
+        db_manager.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Python overhead per conversation turn with prompt templates and
+chains compiled once per agent versus compiled inside every call (the previous
+behaviour). The LLM answers instantly, so LLM time is excluded.
+
+Usage: python benchmarks/bench_prompt_compilation.py [turns]
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+from langchain_core.language_models.llms import LLM
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.agents.conversational_setup import EXTRACTION_PROMPTS, ConversationalSetupAgent
+from backend.agents.natural_conversational_agent import NaturalConversationalAgent
+
+EXTRACTION = json.dumps({"industry": "IT", "company_name": "Zulu.riverside"})
+REPLY = "Thanks for sharing that! What timeline are you working towards?"
+
+class InstantLLM(LLM):
+    """Fake LLM: answers extraction prompts with EXTRACTION and others with REPLY, without waiting"""
+
+    @property
+    def _llm_type(self) -> str:
+        return "instant-fake"
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, **kwargs: Any) -> str:
+        return EXTRACTION if "Extract" in prompt else REPLY
+
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None, **kwargs: Any) -> str:
+        return self._call(prompt)
+
+class PerCallNaturalAgent(NaturalConversationalAgent):
+    """Compiles the prompt and composes the chain inside every call, as before"""
+
+    async def _extract_information(self, session, user_message):
+        prompt = ChatPromptTemplate.from_template(self._prompt_templates()["extraction"])
+        self.chains["extraction"] = prompt | self.llm | JsonOutputParser()
+        return await super()._extract_information(session, user_message)
+
+    async def _generate_response(self, session, user_message, client_info=None):
+        self.chains["response"] = ChatPromptTemplate.from_template(self._prompt_templates()["response"]) | self.llm
+        return await super()._generate_response(session, user_message, client_info)
+
+class PerCallSetupAgent(ConversationalSetupAgent):
+    """Compiles the extraction prompt and composes the chain inside every call, as before"""
+
+    async def _extract_information_with_llm(self, user_message, extraction_type, current_info=None):
+        prompt = ChatPromptTemplate.from_template(EXTRACTION_PROMPTS[extraction_type])
+        self.extraction_chains[extraction_type] = prompt | self.llm | JsonOutputParser()
+        return await super()._extract_information_with_llm(user_message, extraction_type, current_info)
+
+async def natural_turn_us(agent_class, turns: int) -> float:
+    agent = agent_class(None)
+    agent.llm = InstantLLM()
+    await agent.start_conversation("bench")
+    start = time.perf_counter()
+    for _ in range(turns):
+        await agent.process_message("bench", "We're Zulu.riverside, an IT consultancy")
+    return (time.perf_counter() - start) / turns * 1e6
+
+async def setup_extraction_us(agent_class, turns: int) -> float:
+    agent = agent_class(None)
+    agent.llm = InstantLLM()
+    start = time.perf_counter()
+    for _ in range(turns):
+        await agent._extract_information_with_llm("We're Zulu.riverside, an IT consultancy", "company_and_industry")
+    return (time.perf_counter() - start) / turns * 1e6
+
+async def main(turns: int):
+    rows = [
+        ("NaturalConversationalAgent turn", await natural_turn_us(PerCallNaturalAgent, turns),
+         await natural_turn_us(NaturalConversationalAgent, turns)),
+        ("ConversationalSetupAgent extraction", await setup_extraction_us(PerCallSetupAgent, turns),
+         await setup_extraction_us(ConversationalSetupAgent, turns))
+    ]
+
+    print(f"Python overhead per call over {turns} calls (instant fake LLM):")
+    print(f"  {'':<36} {'per call':>12} {'compiled':>12} {'saved':>8}")
+    for label, per_call, compiled in rows:
+        print(f"  {label:<36} {per_call:>9.1f} us {compiled:>9.1f} us {1 - compiled / per_call:>7.0%}")
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: onboarding a wave of clients one POST /api/execute-workflow at a
+time (sequential execute_full_workflow calls) versus execute_workflow_batch
+at several concurrency limits with the shared per-batch cache.
+
+The domain knowledge agent is rule based here, so it is wrapped with a sleep
+of `latency_ms` to stand in for the knowledge-service latency it has in
+deployment; the database stages run against a real SQLite file.
+
+Usage: python benchmarks/bench_workflow_batch.py [clients] [latency_ms]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.database.db_manager import DatabaseManager
+from backend.workflow_orchestrator import WorkflowOrchestrator
+
+INDUSTRIES = ["Retail", "Healthcare", "Automotive", "Finance", "Logistics"]
+PROBLEMS = ["Checkout conversion is dropping", "Lead management is manual", "Patient records are scattered"]
+
+def make_clients(count: int):
+    return [
+        {
+            "client_name": f"Client {i}",
+            "industry": INDUSTRIES[i % len(INDUSTRIES)],
+            "problem_statement": PROBLEMS[i % len(PROBLEMS)],
+            "tech_stack": "React, Node.js, AWS"
+        }
+        for i in range(count)
+    ]
+
+def make_orchestrator(db_path: str, latency: float) -> WorkflowOrchestrator:
+    db_manager = DatabaseManager(db_path)
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    orchestrator = WorkflowOrchestrator(db_manager)
+    process = orchestrator.domain_knowledge_agent.process_domain_knowledge
+
+    async def process_domain_knowledge(*args):
+        await asyncio.sleep(latency)
+        return await process(*args)
+
+    orchestrator.domain_knowledge_agent.process_domain_knowledge = process_domain_knowledge
+    return orchestrator
+
+async def run_sequential(orchestrator, clients):
+    start = time.perf_counter()
+    for client_data in clients:
+        await orchestrator.execute_full_workflow(client_data)
+    return time.perf_counter() - start, None
+
+async def run_batch(orchestrator, clients, concurrency: int):
+    report = None
+    async for item in orchestrator.execute_workflow_batch(clients, concurrency):
+        if item["type"] == "report":
+            report = item
+    return report["elapsed"], report
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 50) / 1000
+    clients = make_clients(count)
+
+    print(f"=== Onboarding {count} clients, {latency * 1000:.0f} ms domain knowledge latency ===")
+    print(f"\n   {'mode':<24}{'elapsed':>10}{'clients/s':>12}{'cache hits':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [("sequential", lambda o: run_sequential(o, clients))]
+        runs += [(f"batch, concurrency {c}", lambda o, c=c: run_batch(o, clients, c)) for c in (1, 4, 16)]
+        for index, (label, run) in enumerate(runs):
+            orchestrator = make_orchestrator(str(Path(tmp) / f"batch_{index}.db"), latency)
+            elapsed, report = asyncio.run(run(orchestrator))
+            hits = f"{report['cache']['hits']}/{report['cache']['hits'] + report['cache']['misses']}" if report else "-"
+            print(f"   {label:<24}{elapsed:>8.2f} s{count / elapsed:>12.1f}{hits:>12}")
+            orchestrator.db_manager.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: latest workflow for a client and per-status counts over many
+workflows, the old linear scans over workflow_state versus WorkflowStore's
+client index and maintained counters.
+
+Usage: python benchmarks/bench_workflow_index.py [workflows] [clients]
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.database.db_manager import DatabaseManager
+from backend.database.workflow_store import WorkflowStore
+
+STATUSES = ["completed", "completed", "completed", "failed", "cancelled"]
+
+def seed(store: WorkflowStore, count: int, clients: int):
+    """Finished workflows written straight to workflow_runs, plus the equivalent old in-memory dict"""
+    workflow_state = {}
+    rows = []
+    for i in range(count):
+        workflow_id = store.new_id()
+        record = {
+            "status": STATUSES[i % len(STATUSES)],
+            "start_time": f"2024-01-01T00:00:{i:09d}",
+            "client_data": {"client_name": f"Client {i % clients}"}
+        }
+        workflow_state[workflow_id] = record
+        rows.append((workflow_id, record["client_data"]["client_name"], record["status"], record["start_time"], json.dumps(record)))
+    with store.db_manager.writer() as conn:
+        conn.executemany(
+            "INSERT INTO workflow_runs (workflow_id, client_name, status, created_at, record) VALUES (?, ?, ?, ?, ?)", rows
+        )
+    return workflow_state
+
+def scan_latest(workflow_state, client_name):
+    client_workflows = [
+        (wf_id, wf_data) for wf_id, wf_data in workflow_state.items()
+        if wf_data.get("client_data", {}).get("client_name") == client_name
+    ]
+    return max(client_workflows, key=lambda x: x[1].get("start_time", "")) if client_workflows else None
+
+def scan_counts(workflow_state):
+    return {
+        status: len([wf for wf in workflow_state.values() if wf.get("status") == status])
+        for status in ("running", "completed", "failed")
+    }
+
+def per_call_us(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for i in range(repeat):
+        fn(i)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(str(Path(tmp) / "index.db"))
+        db_manager.initialize_database()
+        store = WorkflowStore(db_manager)
+        workflow_state = seed(store, count, clients)
+
+        start = time.perf_counter()
+        store.load_index()
+        print(f"=== {count} workflows for {clients} clients (index built in {(time.perf_counter() - start) * 1000:.0f} ms) ===")
+
+        print(f"\n   {'lookup':<28}{'dict scan':>14}{'index':>14}")
+        scan = per_call_us(lambda i: scan_latest(workflow_state, f"Client {i % clients}"), 20)
+        indexed = per_call_us(lambda i: store.latest_for_client(f"Client {i % clients}"), 2000)
+        print(f"   {'latest workflow for client':<28}{scan:>11.1f} us{indexed:>11.1f} us")
+        scan = per_call_us(lambda i: scan_counts(workflow_state), 20)
+        indexed = per_call_us(lambda i: store.count_by_status(), 2000)
+        print(f"   {'status counts':<28}{scan:>11.1f} us{indexed:>11.1f} us")
+
+        db_manager.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory held for finished workflows by the old unbounded
+workflow_state dict versus WorkflowStore (compact LRU/TTL tier over the
+workflow_runs table), measured with tracemalloc.
+
+Every workflow carries a copy of a real execute_full_workflow record (client
+data, all agent results and stage timings). A full dict of 100k such records
+does not fit comfortably in a test box, so the dict baseline is measured on
+`sample` workflows and scaled linearly; the store is run over all of them.
+
+Usage: python benchmarks/bench_workflow_store.py [workflows] [max_cached] [sample]
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.database.db_manager import DatabaseManager
+from backend.database.workflow_store import WorkflowStore
+from backend.workflow_orchestrator import WorkflowOrchestrator
+
+CLIENT = {
+    "client_name": "GT Automotive",
+    "industry": "Automotive",
+    "problem_statement": "Lead management is manual and scattered across spreadsheets",
+    "tech_stack": "Salesforce, AWS"
+}
+
+def real_workflow_record() -> str:
+    """JSON of a live record captured just before a real workflow finishes"""
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    db_manager.load_use_cases()
+    orchestrator = WorkflowOrchestrator(db_manager)
+    captured = {}
+    finish = orchestrator.workflow_store.finish
+
+    def capture(workflow_id, summary=None):
+        captured["record"] = json.dumps(orchestrator.workflow_store.get_active(workflow_id), default=str)
+        captured["summary"] = summary
+        return finish(workflow_id, summary)
+
+    orchestrator.workflow_store.finish = capture
+    asyncio.run(orchestrator.execute_full_workflow(CLIENT))
+    db_manager.close()
+    return captured["record"], captured["summary"]
+
+def make_record(template: str, i: int):
+    record = json.loads(template)
+    record["client_data"]["client_name"] = f"Client {i % 5000}"
+    return record
+
+def measure_dict(template: str, count: int) -> int:
+    tracemalloc.start()
+    workflow_state = {f"workflow_{i}": make_record(template, i) for i in range(count)}
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del workflow_state
+    return current
+
+def measure_store(template: str, summary, count: int, max_cached: int, db_path: str):
+    db_manager = DatabaseManager(db_path)
+    db_manager.initialize_database()
+    store = WorkflowStore(db_manager, max_cached=max_cached)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(count):
+        workflow_id = f"workflow_{i}"
+        store.add(workflow_id, make_record(template, i))
+        store.finish(workflow_id, summary)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    lookup_start = time.perf_counter()
+    for i in range(0, count, max(1, count // 1000)):
+        assert store.get(f"workflow_{i}")["status"] == "completed"
+    lookup_ms = (time.perf_counter() - lookup_start) / min(count, 1000) * 1000
+
+    metrics = store.get_metrics()
+    db_manager.close()
+    return current, peak, elapsed, lookup_ms, metrics
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    max_cached = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    sample = min(count, int(sys.argv[3]) if len(sys.argv) > 3 else 5000)
+    logging.disable(logging.WARNING)
+
+    template, summary = real_workflow_record()
+    print(f"=== Memory for {count} finished workflows ({len(template)} byte records, LRU of {max_cached}) ===")
+
+    per_workflow = measure_dict(template, sample) / sample
+    print(f"\n   unbounded dict   {per_workflow / 1024:8.1f} KiB/workflow measured on {sample}, "
+          f"~{per_workflow * count / 2**20:,.0f} MiB for {count}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "workflows.db")
+        current, peak, elapsed, lookup_ms, metrics = measure_store(template, summary, count, max_cached, db_path)
+        disk = Path(db_path).stat().st_size
+        print(f"   WorkflowStore    {current / 2**20:8.1f} MiB retained, {peak / 2**20:.1f} MiB peak "
+              f"({metrics['cached']} cached, {metrics['active']} active)")
+        print(f"                    {disk / 2**20:8.1f} MiB on disk, {count / elapsed:,.0f} finishes/s, "
+              f"{lookup_ms:.3f} ms per uncached status lookup")
+
+if __name__ == "__main__":
+    main()
@@ -110,12 +110,12 @@ const Dashboard: React.FC = () => {
       {
         label: 'Clients by Industry',
         data: [
-          dashboardData?.client_profiles?.filter(p => p.industry?.toLowerCase() === 'automotive').length || 0,
-          dashboardData?.client_profiles?.filter(p => p.industry?.toLowerCase() === 'healthcare').length || 0,
-          dashboardData?.client_profiles?.filter(p => p.industry?.toLowerCase() === 'retail').length || 0,
-          dashboardData?.client_profiles?.filter(p => 
-            !['automotive', 'healthcare', 'retail'].includes(p.industry?.toLowerCase())
-          ).length || 0,
+          dashboardData?.industry_counts?.automotive || 0,
+          dashboardData?.industry_counts?.healthcare || 0,
+          dashboardData?.industry_counts?.retail || 0,
+          Object.entries(dashboardData?.industry_counts || {})
+            .filter(([industry]) => !['automotive', 'healthcare', 'retail'].includes(industry))
+            .reduce((total, [, count]) => total + count, 0),
         ],
         backgroundColor: [
           '#3b82f6',
@@ -212,7 +212,7 @@ const Dashboard: React.FC = () => {
         
         <StatCard
           title="Active Clients"
-          value={dashboardData?.client_profiles?.length || 0}
+          value={dashboardData?.profiles_count ?? dashboardData?.client_profiles?.length ?? 0}
           icon={Users}
           trend={{ value: 8, isPositive: true }}
           color="success"
@@ -220,7 +220,7 @@ const Dashboard: React.FC = () => {
         
         <StatCard
           title="Insights Generated"
-          value={dashboardData?.insights?.length || 0}
+          value={dashboardData?.insights_count ?? dashboardData?.insights?.length ?? 0}
           icon={Brain}
           trend={{ value: 15, isPositive: true }}
           color="warning"
@@ -35,6 +35,10 @@ export interface DashboardData {
   insights: any[]
   meetings: any[]
   validations: any[]
+  insights_count?: number
+  profiles_count?: number
+  industry_counts?: Record<string, number>
+  next_cursor?: Record<string, string | null>
   system_metrics?: {
     total_workflows: number
     active_workflows: number
@@ -203,6 +207,46 @@ export class ApiService {
     }
   }
 
+  // Streams the reply over Server-Sent Events: onToken gets text as it is generated,
+  // the promise resolves with the final "done" event (full reply, client_info, ttft_ms)
+  static async streamMessage(
+    conversationId: string,
+    message: string,
+    onToken: (text: string) => void
+  ): Promise<{response: string, message: string, client_info: any, completion_percentage: number, missing_fields: string[], is_complete: boolean, ttft_ms: number}> {
+    const baseURL = (import.meta as any).env?.VITE_API_URL || ''
+    const response = await fetch(`${baseURL}/api/conversation/message/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ conversation_id: conversationId, message })
+    })
+    if (!response.ok || !response.body) {
+      throw new Error(`Failed to stream message (status ${response.status})`)
+    }
+
+    const reader = response.body.getReader()
+    const decoder = new TextDecoder()
+    let buffer = ''
+    for (;;) {
+      const { done, value } = await reader.read()
+      if (done) break
+      buffer += decoder.decode(value, { stream: true })
+      let boundary = buffer.indexOf('\n\n')
+      while (boundary !== -1) {
+        const block = buffer.slice(0, boundary)
+        buffer = buffer.slice(boundary + 2)
+        boundary = buffer.indexOf('\n\n')
+
+        const event = block.match(/^event: (.*)$/m)?.[1]
+        const data = JSON.parse(block.match(/^data: (.*)$/m)?.[1] || '{}')
+        if (event === 'token') onToken(data.text)
+        else if (event === 'done') return data
+        else if (event === 'error') throw new Error(data.message)
+      }
+    }
+    throw new Error('Stream ended before the reply was complete')
+  }
+
   static async getConversationStatus(conversationId: string): Promise<ApiResponse<any>> {
     try {
       const response = await api.get(`/api/conversation/${conversationId}/status`)
@@ -249,6 +293,47 @@ export class ApiService {
     }
   }
 
+  static async getWorkflows(params: {
+    limit?: number
+    cursor?: string
+    status?: string
+    client_name?: string
+  } = {}): Promise<ApiResponse> {
+    try {
+      const response = await api.get('/api/workflows', { params })
+      return response.data
+    } catch (error) {
+      throw this.handleError(error)
+    }
+  }
+
+  static async getWorkflowMetrics(): Promise<ApiResponse> {
+    try {
+      const response = await api.get('/api/metrics/workflows')
+      return response.data
+    } catch (error) {
+      throw this.handleError(error)
+    }
+  }
+
+  static async cancelWorkflow(workflowId: string): Promise<ApiResponse> {
+    try {
+      const response = await api.post(`/api/workflow/${workflowId}/cancel`)
+      return response.data
+    } catch (error) {
+      throw this.handleError(error)
+    }
+  }
+
+  static async resumeWorkflow(workflowId: string): Promise<ApiResponse> {
+    try {
+      const response = await api.post(`/api/workflow/${workflowId}/resume`)
+      return response.data
+    } catch (error) {
+      throw this.handleError(error)
+    }
+  }
+
   static async executeAgent(
     agentName: string,
     params: Record<string, any>